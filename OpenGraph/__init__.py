@@ -1,6 +1,28 @@
-import OpenGraph.classes
-from OpenGraph.classes import *
+from OpenGraph.classes import Graph, DiGraph, EdgeView, OutEdgeView, SubgraphView, \
+    CompactGraph, CompactDiGraph, JournalEntry
+from OpenGraph.utils.lazy_import import lazy_import
 
-import OpenGraph.utils
+# The rest is imported on first access, so that `import OpenGraph` does
+# not pay for numpy, or for tensorflow, gensim and sklearn in functions.
+__getattr__, __dir__, _lazy_all = lazy_import(
+    __name__,
+    submodules=['classes', 'utils', 'readwrite', 'functions', 'datasets', 'sampling'],
+    attributes={
+        'CSRGraph': '.classes',
+        'ColumnarGraph': '.classes',
+        'ColumnarDiGraph': '.classes',
+        'SharedGraph': '.classes',
+        'parse_edgelist': '.readwrite',
+        'read_edgelist': '.readwrite',
+        'save_binary': '.readwrite',
+        'load_binary': '.readwrite',
+        'edgelist_to_binary': '.readwrite',
+        'partition': '.functions',
+        # modules of classes, attributes of this package before
+        'graph': '.classes',
+        'directed_graph': '.classes',
+    })
+del lazy_import
 
-import OpenGraph.functions
\ No newline at end of file
+__all__ = ['Graph', 'DiGraph', 'EdgeView', 'OutEdgeView', 'SubgraphView',
+           'CompactGraph', 'CompactDiGraph', 'JournalEntry'] + _lazy_all
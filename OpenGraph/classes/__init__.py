@@ -1,2 +1,20 @@
 from .graph import Graph
-from .directed_graph import DiGraph
\ No newline at end of file
+from .directed_graph import DiGraph
+from .edge_view import EdgeView, OutEdgeView
+from .subgraph_view import SubgraphView
+from .compact_graph import CompactGraph, CompactDiGraph
+from .journal import JournalEntry
+
+from OpenGraph.utils.lazy_import import lazy_import
+
+# Classes built on numpy are imported on first access
+__getattr__, __dir__, _lazy_all = lazy_import(__name__, attributes={
+    'CSRGraph': '.csr_graph',
+    'ColumnarGraph': '.columnar_graph',
+    'ColumnarDiGraph': '.columnar_graph',
+    'SharedGraph': '.shared_graph',
+})
+del lazy_import
+
+__all__ = ['Graph', 'DiGraph', 'EdgeView', 'OutEdgeView', 'SubgraphView',
+           'CompactGraph', 'CompactDiGraph', 'JournalEntry'] + _lazy_all
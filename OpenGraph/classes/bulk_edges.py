@@ -0,0 +1,118 @@
+"""
+Vectorized helpers behind ``add_edges_from_arrays`` of Graph and DiGraph.
+"""
+
+
+def factorize_edge_arrays(src, dst):
+    """
+    Returns
+    1. node labels, in order of first appearance in (src, dst)
+    2. index of the label of each src element
+    3. index of the label of each dst element
+    """
+    import numpy as np
+    src = np.asarray(src)
+    dst = np.asarray(dst)
+    if src.ndim != 1 or src.shape != dst.shape:
+        raise ValueError("src and dst must be 1-D arrays of the same length.")
+    labels, inverse = factorize_labels(np.concatenate([src, dst]))
+    return labels, inverse[:len(src)], inverse[len(src):]
+
+
+def factorize_labels(labels):
+    """
+    Returns
+    1. distinct labels, in order of first appearance in `labels`
+    2. index of the label of each element
+    """
+    import numpy as np
+    labels = np.asarray(labels)
+    try:
+        uniq, first, inverse = np.unique(
+            labels, return_index=True, return_inverse=True)
+    except TypeError:  # Unorderable labels, e.g. mixed int and str
+        index_of_label = dict()
+        inverse = np.fromiter(
+            (index_of_label.setdefault(label, len(index_of_label)) for label in labels.tolist()),
+            dtype=np.int64, count=len(labels))
+        return list(index_of_label), inverse
+    # Relabel so that index order is order of first appearance
+    order = np.argsort(first, kind='stable')
+    rank = np.empty(len(order), dtype=np.int64)
+    rank[order] = np.arange(len(order))
+    return uniq[order].tolist(), rank[inverse.reshape(-1)]
+
+
+def dedupe_edges(u, v, weight, n, directed):
+    """
+    Drops duplicate edges like repeated ``add_edge`` calls do: an edge
+    keeps the place of its first occurrence and the weight of its last.
+    Undirected edges are oriented as (min, max) first, so (a, b) and
+    (b, a) are duplicates.
+    """
+    import numpy as np
+    if not directed:
+        u, v = np.minimum(u, v), np.maximum(u, v)
+    if len(u) == 0:
+        return u, v, weight
+    key = u * n + v
+    order = np.argsort(key, kind='stable')
+    sorted_key = key[order]
+    starts = np.flatnonzero(np.concatenate([[True], sorted_key[1:] != sorted_key[:-1]]))
+    first = order[starts]
+    last = order[np.append(starts[1:], len(key)) - 1]
+    by_place = np.argsort(first)
+    keep = first[by_place]
+    return u[keep], v[keep], None if weight is None else weight[last[by_place]]
+
+
+def group_rows(rows, cols, values):
+    """
+    Yields (row, [col, ...], [value, ...]) for each distinct row, so a
+    whole adjacency row is filled with one dict update. `cols` and
+    `values` are object arrays aligned with the integer array `rows`.
+    """
+    import numpy as np
+    if len(rows) == 0:
+        return
+    order = np.argsort(rows, kind='stable')
+    rows = rows[order]
+    cols = cols[order].tolist()
+    values = values[order].tolist()
+    bounds = np.flatnonzero(np.diff(rows)) + 1
+    starts = [0] + bounds.tolist()
+    ends = bounds.tolist() + [len(rows)]
+    for start, end in zip(starts, ends):
+        yield int(rows[start]), cols[start:end], values[start:end]
+
+
+def object_array(items):
+    """
+    Returns a 1-D object array holding `items`, e.g. labels or dicts.
+    """
+    import numpy as np
+    array = np.empty(len(items), dtype=object)
+    array[:] = items
+    return array
+
+
+def label_array(labels):
+    """
+    Returns `labels` as an int64 array if they are all ints, else as an
+    object array.
+    """
+    import numpy as np
+    if all(type(label) is int for label in labels):
+        return np.fromiter(labels, dtype=np.int64, count=len(labels))
+    return object_array(labels)
+
+
+def degree_deltas(rows, weight_key, weight, n):
+    """
+    Returns the degree added to each node index by the edges starting at
+    `rows`, as counted by an index for `weight_key`.
+    """
+    import numpy as np
+    if weight is None or weight_key != 'weight':  # each edge counts as 1
+        return np.bincount(rows, minlength=n)
+    return np.bincount(rows, weights=weight, minlength=n)
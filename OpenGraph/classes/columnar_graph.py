@@ -0,0 +1,355 @@
+from collections.abc import MutableMapping
+
+import numpy as np
+
+from .graph import Graph
+from .directed_graph import DiGraph
+
+__all__ = [
+    "ColumnarGraph",
+    "ColumnarDiGraph",
+    "EdgeColumns"
+]
+
+
+class EdgeColumns(object):
+    """
+    Columnar storage of the edges of a ColumnarGraph/ColumnarDiGraph.
+
+    Each edge gets an integer id indexing numpy arrays: ``src`` and
+    ``dst`` hold the ids of its endpoints in ``G.index_of_node``, and
+    ``columns[key]`` holds the float64 value of attribute `key`, NaN where
+    the edge has none. Ids of removed edges are reused; ``alive`` marks
+    the ids in use among the first ``size``.
+    """
+    __slots__ = ('names', 'columns', 'src', 'dst', 'alive', 'size', 'free')
+
+    def __init__(self, names, capacity=16):
+        self.names = tuple(names)
+        self.columns = {name: np.full(capacity, np.nan) for name in self.names}
+        self.src = np.full(capacity, -1, dtype=np.int64)
+        self.dst = np.full(capacity, -1, dtype=np.int64)
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.size = 0
+        self.free = []
+
+    def new_record(self):
+        """
+        Returns the attribute mapping of a new edge id.
+        """
+        if self.free:
+            edge_id = self.free.pop()
+        else:
+            if self.size == len(self.alive):
+                self._grow(2 * self.size)
+            edge_id = self.size
+            self.size += 1
+        self.alive[edge_id] = True
+        return _EdgeRecord(self, edge_id)
+
+    def release(self, edge_id):
+        self.alive[edge_id] = False
+        self.src[edge_id] = self.dst[edge_id] = -1
+        for column in self.columns.values():
+            column[edge_id] = np.nan
+        self.free.append(edge_id)
+
+    def _grow(self, capacity):
+        def grown(array, fill):
+            new = np.full(capacity, fill, dtype=array.dtype)
+            new[:len(array)] = array
+            return new
+        self.columns = {name: grown(column, np.nan) for name, column in self.columns.items()}
+        self.src = grown(self.src, -1)
+        self.dst = grown(self.dst, -1)
+        self.alive = grown(self.alive, False)
+
+    def copy(self):
+        H = EdgeColumns(self.names, capacity=0)
+        H.columns = {name: column.copy() for name, column in self.columns.items()}
+        H.src, H.dst, H.alive = self.src.copy(), self.dst.copy(), self.alive.copy()
+        H.size = self.size
+        H.free = list(self.free)
+        return H
+
+    def nbytes(self):
+        return sum(column.nbytes for column in self.columns.values()) + \
+            self.src.nbytes + self.dst.nbytes + self.alive.nbytes
+
+    def arrays(self, weight, default):
+        # src, dst and weight arrays of the edges in use, in id order
+        ids = np.flatnonzero(self.alive[:self.size])
+        if weight in self.columns:
+            weights = self.columns[weight][ids]
+            weights[np.isnan(weights)] = default
+        else:
+            weights = np.full(len(ids), default, dtype=np.float64)
+        return self.src[ids], self.dst[ids], weights
+
+    def remap_nodes(self, new_id):
+        # Node ids changed by compact_node_index, old id -> new_id[old id]
+        used = self.src[:self.size] >= 0
+        self.src[:self.size][used] = new_id[self.src[:self.size][used]]
+        self.dst[:self.size][used] = new_id[self.dst[:self.size][used]]
+
+
+class _EdgeRecord(MutableMapping):
+    """
+    Attribute mapping of one edge of a columnar graph, reading and writing
+    its row of the columns.
+    """
+    __slots__ = ('_store', '_id')
+
+    def __init__(self, store, edge_id):
+        self._store = store
+        self._id = edge_id
+
+    def __getitem__(self, key):
+        column = self._store.columns.get(key)
+        if column is not None:
+            value = column[self._id]
+            if value == value:  # not NaN
+                return value.item()
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        column = self._store.columns.get(key)
+        if column is not None:
+            value = column[self._id]
+            if value == value:
+                return value.item()
+        return default
+
+    def __setitem__(self, key, value):
+        _check_columns(self._store.names, {key: value})
+        self._store.columns[key][self._id] = value
+
+    def __delitem__(self, key):
+        self[key]
+        self._store.columns[key][self._id] = np.nan
+
+    def __iter__(self):
+        edge_id = self._id
+        return (key for key, column in self._store.columns.items()
+                if column[edge_id] == column[edge_id])
+
+    def __len__(self):
+        return sum(1 for key in self)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+    def copy(self):
+        return dict(self)
+
+
+def _check_columns(names, attr):
+    # Checked before the graph is touched, so a refused call changes nothing
+    for key, value in attr.items():
+        if key not in names:
+            raise ValueError("This graph stores only the edge attributes {}, not {!r}.".format(
+                list(names), key))
+        if not isinstance(value, (int, float, np.number)) or isinstance(value, bool):
+            raise ValueError("Edge attribute {!r} must be a number.".format(key))
+
+
+class ColumnarGraph(Graph):
+    """
+    Undirected graph keeping designated numeric edge attributes, e.g. the
+    weight, in contiguous float64 arrays indexed by edge id instead of one
+    dict per edge.
+
+    ``G[u][v]`` still reads like a dict, e.g. ``G[u][v].get('weight', 1)``,
+    so algorithms accept it unchanged, while `edge_arrays` hands the
+    endpoints and weights of all edges to vectorized code, and degree
+    indexes are built with ``np.bincount``. The attributes of an edge
+    take less than half the memory of a ``{'weight': w}`` dict, though the
+    graph keeps `index_of_node` built. Attributes other than
+    `edge_columns`, or not numeric, raise ValueError.
+
+    `copy` copies the columns and rebuilds the rows, in O(edges), also
+    with ``lazy=True``.
+
+    Parameters
+    ----------
+    edge_columns : list of String
+        keys of the numeric edge attributes stored as columns.
+    """
+
+    def __init__(self, edge_columns=('weight',), **graph_attr):
+        super().__init__(**graph_attr)
+        self._columns = EdgeColumns(edge_columns)
+        self.edge_attr_dict_factory = self._columns.new_record
+        self.index_of_node  # endpoints are stored as node ids
+
+    def _add_one_edge(self, u_of_edge, v_of_edge, edge_attr: dict = {}):
+        _check_columns(self._columns.names, edge_attr)
+        super()._add_one_edge(u_of_edge, v_of_edge, edge_attr)
+        _store_endpoints(self, u_of_edge, v_of_edge)
+
+    def _add_edges_from_indices(self, labels, u, v, weight=None):
+        if weight is not None:
+            _check_columns(self._columns.names, {'weight': 0.0})
+        super()._add_edges_from_indices(labels, u, v, weight)
+        for i, j in zip(u.tolist(), v.tolist()):
+            _store_endpoints(self, labels[i], labels[j])
+
+    def remove_node(self, node_to_remove):
+        edge_ids = {record._id for record in self._adj.get(node_to_remove, {}).values()}
+        super().remove_node(node_to_remove)
+        for edge_id in edge_ids:
+            self._columns.release(edge_id)
+
+    def remove_edge(self, u, v):
+        record = self._adj.get(u, {}).get(v)
+        super().remove_edge(u, v)
+        self._columns.release(record._id)
+
+    def compact_node_index(self):
+        _compact_node_index(self, super().compact_node_index)
+
+    def edge_arrays(self, weight='weight', default=1.0):
+        """
+        Returns the arrays (src, dst, weights) of all edges, each edge
+        once: the endpoints as ids of `index_of_node` (compacted first, so
+        0..n-1 in node order, see `node_of_index`) and the values of
+        attribute `weight`, `default` where an edge has none.
+        """
+        self.compact_node_index()
+        return self._columns.arrays(weight, default)
+
+    def _get_degree_index(self, weight):
+        if weight not in self._degree_index:
+            degree, total = _column_degrees(self, weight)
+            degree = degree[0] + degree[1]
+            self._degree_index[weight] = dict(zip(self.node_of_index, degree.tolist()))
+            self._degree_total[weight] = 2 * total
+        return self._degree_index[weight]
+
+    def copy(self, lazy=False):
+        # The columns are always copied, so `lazy` gives the same copy
+        G = self.__class__(edge_columns=self._columns.names)
+        _copy_columnar(self, G)
+        return G
+
+    def memory_usage(self, deep=True):
+        return _columnar_memory_usage(self, super().memory_usage(deep=deep))
+
+
+class ColumnarDiGraph(DiGraph):
+    """
+    Directed graph keeping designated numeric edge attributes in
+    contiguous arrays, see `ColumnarGraph`.
+    """
+
+    def __init__(self, edge_columns=('weight',), **graph_attr):
+        super().__init__(**graph_attr)
+        self._columns = EdgeColumns(edge_columns)
+        self.edge_attr_dict_factory = self._columns.new_record
+        self.index_of_node  # endpoints are stored as node ids
+
+    def _add_one_edge(self, u_of_edge, v_of_edge, edge_attr: dict = {}):
+        _check_columns(self._columns.names, edge_attr)
+        super()._add_one_edge(u_of_edge, v_of_edge, edge_attr)
+        _store_endpoints(self, u_of_edge, v_of_edge)
+
+    def _add_edges_from_indices(self, labels, u, v, weight=None):
+        if weight is not None:
+            _check_columns(self._columns.names, {'weight': 0.0})
+        super()._add_edges_from_indices(labels, u, v, weight)
+        for i, j in zip(u.tolist(), v.tolist()):
+            _store_endpoints(self, labels[i], labels[j])
+
+    def remove_node(self, node_to_remove):
+        edge_ids = {record._id for record in self._adj.get(node_to_remove, {}).values()}
+        edge_ids.update(record._id for record in self._pred.get(node_to_remove, {}).values())
+        super().remove_node(node_to_remove)
+        for edge_id in edge_ids:
+            self._columns.release(edge_id)
+
+    def remove_edge(self, u, v):
+        record = self._adj.get(u, {}).get(v)
+        super().remove_edge(u, v)
+        self._columns.release(record._id)
+
+    def compact_node_index(self):
+        _compact_node_index(self, super().compact_node_index)
+
+    def edge_arrays(self, weight='weight', default=1.0):
+        """
+        Returns the arrays (src, dst, weights) of all edges, see
+        `ColumnarGraph.edge_arrays`.
+        """
+        self.compact_node_index()
+        return self._columns.arrays(weight, default)
+
+    def _get_degree_index(self, weight):
+        if weight not in self._out_degree_index:
+            degree, total = _column_degrees(self, weight)
+            self._out_degree_index[weight] = dict(zip(self.node_of_index, degree[0].tolist()))
+            self._in_degree_index[weight] = dict(zip(self.node_of_index, degree[1].tolist()))
+            self._degree_total[weight] = total
+        return self._out_degree_index[weight], self._in_degree_index[weight]
+
+    def copy(self, lazy=False):
+        # The columns are always copied, so `lazy` gives the same copy
+        G = self.__class__(edge_columns=self._columns.names)
+        _copy_columnar(self, G)
+        return G
+
+    def memory_usage(self, deep=True):
+        return _columnar_memory_usage(self, super().memory_usage(deep=deep))
+
+
+def _store_endpoints(G, u, v):
+    index = G.index_of_node
+    edge_id = G._adj[u][v]._id
+    G._columns.src[edge_id] = index[u]
+    G._columns.dst[edge_id] = index[v]
+
+
+def _compact_node_index(G, compact):
+    if G._index_holes:
+        old_index = G._node_index
+        new_id = np.full(len(G._index_node), -1, dtype=np.int64)
+        new_id[[old_index[node] for node in G._node]] = np.arange(len(G._node))
+        compact()
+        G._columns.remap_nodes(new_id)
+        G.index_of_node
+
+
+def _column_degrees(G, weight):
+    # Degree arrays by node id of the edge sources and of the edge
+    # targets, and the total weight of the edges
+    src, dst, weights = G.edge_arrays(weight)
+    n = len(G.node_of_index)
+    if weight is None or weight not in G._columns.columns:
+        degree = (np.bincount(src, minlength=n), np.bincount(dst, minlength=n))
+        return degree, len(src)
+    degree = (np.bincount(src, weights=weights, minlength=n),
+              np.bincount(dst, weights=weights, minlength=n))
+    return degree, weights.sum().item()
+
+
+def _copy_columnar(G, H):
+    H.graph.update(G.graph)
+    H._columns = G._columns.copy()
+    H.edge_attr_dict_factory = H._columns.new_record
+    for node, node_attr in G._node.items():
+        H._add_one_node(node, node_attr)
+    H._node_index = dict(G._node_index)
+    H._index_node = list(G._index_node)
+    H._index_holes = G._index_holes
+    records = dict()  # one record per edge, shared by both of its rows
+    for adj, H_adj in ([(G._adj, H._adj), (G._pred, H._pred)] if G.is_directed()
+                       else [(G._adj, H._adj)]):
+        for node, nbrs in adj.items():
+            H_adj[node] = {v: records.setdefault(record._id, _EdgeRecord(H._columns, record._id))
+                           for v, record in nbrs.items()}
+    H._version = G._version
+
+
+def _columnar_memory_usage(G, usage):
+    usage['edge_attrs'] += G._columns.nbytes()
+    usage['total'] += G._columns.nbytes()
+    return usage
@@ -0,0 +1,117 @@
+import threading
+from contextlib import contextmanager
+
+__all__ = [
+    "ReadWriteLock"
+]
+
+
+class ReadWriteLock(object):
+    """
+    Lock shared by any number of readers or held by one writer.
+
+    Writers are preferred: once a writer waits, new readers wait too, so a
+    steady stream of readers cannot starve it. Both sides are reentrant
+    per thread, and the writing thread may also read.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = None  # thread id holding the write lock
+        self._writes = 0  # reentrant depth of the writer
+        self._writers_waiting = 0
+        self._local = threading.local()  # read depth of each thread
+
+    def acquire_read(self):
+        depth = getattr(self._local, 'depth', 0)
+        if depth or self._writer == threading.get_ident():
+            self._local.depth = depth + 1
+            return
+        with self._cond:
+            while self._writer is not None or self._writers_waiting:
+                self._cond.wait()
+            self._readers += 1
+        self._local.depth = 1
+
+    def release_read(self):
+        self._local.depth -= 1
+        if self._local.depth or self._writer == threading.get_ident():
+            return
+        with self._cond:
+            self._readers -= 1
+            if self._readers == 0:
+                self._cond.notify_all()
+
+    def acquire_write(self):
+        me = threading.get_ident()
+        if self._writer == me:
+            self._writes += 1
+            return
+        if getattr(self._local, 'depth', 0):
+            raise RuntimeError("Cannot write to the graph while reading it in the same thread.")
+        with self._cond:
+            self._writers_waiting += 1
+            while self._writer is not None or self._readers:
+                self._cond.wait()
+            self._writers_waiting -= 1
+            self._writer = me
+            self._writes = 1
+
+    def release_write(self):
+        self._writes -= 1
+        if self._writes:
+            return
+        with self._cond:
+            self._writer = None
+            self._cond.notify_all()
+
+    @contextmanager
+    def reading(self):
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def writing(self):
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+    @property
+    def writer_active(self):
+        return self._writer is not None or self._writers_waiting > 0
+
+
+class Concurrency(object):
+    """
+    Lock and latest snapshot of a graph, see ``Graph.enable_concurrency``.
+    Pickling or deep-copying a graph gives it a fresh, unlocked state.
+    """
+
+    def __init__(self):
+        self.lock = ReadWriteLock()
+        self.snapshot = None
+        self.snapshot_mutex = threading.Lock()
+
+    def __reduce__(self):
+        return (Concurrency, ())
+
+    def get_snapshot(self, G):
+        snapshot = self.snapshot
+        if snapshot is not None and (snapshot._version == G._version or
+                                     (self.lock.writer_active and
+                                      self.lock._writer != threading.get_ident())):
+            # Unchanged, or a write batch is running: serve the last epoch
+            return snapshot
+        with self.lock.reading(), self.snapshot_mutex:
+            snapshot = self.snapshot
+            if snapshot is None or snapshot._version != G._version:
+                # A copy-on-write copy: the writer copies each row before
+                # it changes it and the snapshot never sees it
+                snapshot = self.snapshot = G.copy(lazy=True)
+            return snapshot
@@ -0,0 +1,772 @@
+from collections.abc import Mapping
+
+import numpy as np
+from .edge_view import EdgeView, OutEdgeView
+
+__all__ = [
+    "CSRGraph"
+]
+
+
+class CSRGraph(object):
+    """
+    Read-only graph in compressed sparse row (CSR) form.
+
+    Node ``i`` (``nodes[i]`` is its label) has the neighbors
+    ``indices[indptr[i]:indptr[i+1]]``, sorted by index, with edge weights
+    ``weights[indptr[i]:indptr[i+1]]``. An undirected graph stores both
+    directions of every edge and a self-loop once. A directed graph
+    additionally stores its predecessors in ``in_indptr``, ``in_indices``
+    and ``in_weights``.
+
+    It exposes the read API of Graph/DiGraph (``G[u][v].get('weight', 1)``,
+    ``G.adj``, ``G.edges``, ``G.degree()``, ...), so algorithms accept it as
+    a drop-in graph, while the arrays are open to vectorized traversal.
+    Only the edge weight stored at construction is kept, other node and
+    edge attributes are dropped.
+
+    Use ``G.to_csr()`` (or ``G.freeze()``) to build one from a graph.
+    """
+
+    def __init__(self, indptr, indices, weights=None, nodes=None, directed=False,
+                 in_indptr=None, in_indices=None, in_weights=None, weight='weight', **graph_attr):
+        self.indptr = indptr
+        self.indices = indices
+        if weights is None:
+            weights = _unit_weights(len(indices))
+        self.weights = weights
+        if nodes is None:  # labels 0..n-1, never materialized
+            nodes = range(len(indptr) - 1)
+        self._nodes = nodes
+        self._index_of_node = None
+        # Built on the first batch query: label lookup, label array, and
+        # the sorted key row * n + col of each edge
+        self._label_lookup = None
+        self._label_array = None
+        self._edge_keys = None
+        # Degree arrays and sizes computed so far, the graph never changes
+        self._degrees = dict()
+        self._sizes = dict()
+        self._directed = directed
+        if directed:
+            self.in_indptr = in_indptr
+            self.in_indices = in_indices
+            self.in_weights = in_weights if in_weights is not None else \
+                _unit_weights(len(in_indices))
+        else:
+            self.in_indptr, self.in_indices, self.in_weights = indptr, indices, weights
+        self.weight = weight
+        self.graph = dict(graph_attr)
+        # Segment holding the arrays if attached from a SharedGraph
+        self._shared_memory = None
+
+    @classmethod
+    def from_graph(cls, G, weight='weight'):
+        """
+        Builds the CSR form of Graph/DiGraph `G` in one pass over its
+        adjacency (and predecessors if directed).
+
+        Parameters
+        ----------
+        weight : String or None
+            key for edge weight, stored as float64. Edges without it
+            weigh 1. None to store only the structure.
+        """
+        nodes = list(G._node)
+        index_of_node = {node: i for i, node in enumerate(nodes)}
+        indptr, indices, weights = _build_csr_arrays(
+            G._adj, nodes, index_of_node, weight)
+        if G.is_directed():
+            in_indptr, in_indices, in_weights = _build_csr_arrays(
+                G._pred, nodes, index_of_node, weight)
+        else:
+            in_indptr = in_indices = in_weights = None
+        H = cls(indptr, indices, weights, nodes=nodes, directed=G.is_directed(),
+                in_indptr=in_indptr, in_indices=in_indices, in_weights=in_weights,
+                weight=weight, **G.graph)
+        H._index_of_node = index_of_node
+        return H
+
+    @classmethod
+    def from_edge_indices(cls, nodes, u, v, weights=None, directed=False, weight='weight'):
+        """
+        Builds a CSRGraph from edges given as node indices, edge i joining
+        ``nodes[u[i]]`` and ``nodes[v[i]]``, with array sorts only and no
+        intermediate Graph. Duplicate edges keep the last weight, like
+        repeated ``add_edge`` calls.
+
+        Parameters
+        ----------
+        nodes : list
+            node labels.
+
+        u, v : array-like
+            integer endpoints of the edges.
+
+        weights : array-like or None
+            weight of each edge, each edge weighs 1 if None.
+
+        weight : String or None
+            key the weights are read under, see `CSRGraph`.
+        """
+        from .bulk_edges import dedupe_edges
+        n = len(nodes)
+        u = np.asarray(u, dtype=np.int64)
+        v = np.asarray(v, dtype=np.int64)
+        if weights is not None:
+            weights = np.asarray(weights, dtype=np.float64)
+        u, v, weights = dedupe_edges(u, v, weights, n, directed=directed)
+        if weights is None:
+            weights = np.ones(len(u), dtype=np.float64)
+        if directed:
+            indptr, indices, weights_out = _csr_from_pairs(u, v, weights, n)
+            in_indptr, in_indices, in_weights = _csr_from_pairs(v, u, weights, n)
+        else:  # both directions, a self-loop once
+            not_loop = u != v
+            indptr, indices, weights_out = _csr_from_pairs(
+                np.concatenate([u, v[not_loop]]), np.concatenate([v, u[not_loop]]),
+                np.concatenate([weights, weights[not_loop]]), n)
+            in_indptr = in_indices = in_weights = None
+        return cls(indptr, indices, weights_out, nodes=list(nodes), directed=directed,
+                   in_indptr=in_indptr, in_indices=in_indices, in_weights=in_weights,
+                   weight=weight)
+
+    def __iter__(self):
+        return iter(self._nodes)
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def __contains__(self, node):
+        try:
+            return node in self.index_of_node
+        except TypeError:
+            return False
+
+    def __getitem__(self, node):
+        return _CSRRow(self, self._index(node), self.indptr, self.indices, self.weights)
+
+    @property
+    def index_of_node(self):
+        """
+        Returns the dict mapping each node label to its row index.
+        """
+        if self._index_of_node is None:
+            if _is_range(self._nodes):
+                self._index_of_node = _RangeIndex(len(self._nodes))
+            else:
+                self._index_of_node = {node: i for i, node in enumerate(self._nodes)}
+        return self._index_of_node
+
+    @property
+    def node_of_index(self):
+        """
+        Returns the list mapping each row index to its node label.
+        """
+        return self._nodes
+
+    def compact_node_index(self):
+        # Rows are always numbered 0..n-1, kept for the Graph API
+        pass
+
+    @property
+    def version(self):
+        # A read-only graph never changes, kept for the Graph API
+        return 0
+
+    def _index(self, node):
+        try:
+            return self.index_of_node[node]
+        except KeyError:
+            raise KeyError("No node {} in graph.".format(node))
+
+    @property
+    def adj(self):
+        return _CSRAdjacency(self, self.indptr, self.indices, self.weights)
+
+    _adj = adj
+
+    @property
+    def pred(self):
+        return _CSRAdjacency(self, self.in_indptr, self.in_indices, self.in_weights)
+
+    @property
+    def nodes(self):
+        return self._nodes
+
+    @property
+    def edges(self):
+        return OutEdgeView(self) if self._directed else EdgeView(self)
+
+    def _row_ids(self, indptr):
+        return np.repeat(np.arange(len(indptr) - 1, dtype=self.indices.dtype),
+                         np.diff(indptr))
+
+    def _weight_array(self, weight, weights):
+        # Like d.get(weight, 1) on the row dicts: any key but the stored one
+        # is missing from every edge, so each edge counts as 1.
+        if weight is None or weight != self.weight:
+            return None
+        return weights
+
+    def _degree_array(self, weight='weight', out=True):
+        key = (weight if weight == self.weight else None, out)
+        degree = self._degrees.get(key)
+        if degree is None:
+            degree = self._degrees[key] = self._compute_degree_array(weight, out)
+        return degree
+
+    def _compute_degree_array(self, weight, out):
+        if out:
+            indptr, indices, weights = self.indptr, self.indices, self.weights
+        else:
+            indptr, indices, weights = self.in_indptr, self.in_indices, self.in_weights
+        weights = self._weight_array(weight, weights)
+        row_ids = self._row_ids(indptr)
+        degree = np.bincount(row_ids, weights=weights, minlength=len(self._nodes))
+        if not self._directed:  # self-loop counts twice
+            loops = row_ids == indices
+            degree += np.bincount(row_ids[loops],
+                                  weights=None if weights is None else weights[loops],
+                                  minlength=len(self._nodes))
+        return degree if weights is not None else degree.astype(np.int64)
+
+    def _as_dict(self, values):
+        return dict(zip(self._nodes, values.tolist()))
+
+    def _node_degree(self, node, weight, out):
+        # Degree of one node read from its row, without the whole array
+        i = self._index(node)
+        if out:
+            indptr, indices, weights = self.indptr, self.indices, self.weights
+        else:
+            indptr, indices, weights = self.in_indptr, self.in_indices, self.in_weights
+        start, end = int(indptr[i]), int(indptr[i + 1])
+        weights = self._weight_array(weight, weights)
+        if weights is None:
+            degree = end - start
+        else:
+            degree = weights[start:end].sum().item()
+        if not self._directed:  # self-loop counts twice
+            pos = start + int(np.searchsorted(indices[start:end], i))
+            if pos < end and indices[pos] == i:
+                degree += 1 if weights is None else weights[pos].item()
+        return degree
+
+    def degree(self, weight='weight', node=None):
+        if node is not None:
+            degree = self._node_degree(node, weight, out=True)
+            if self._directed:
+                degree += self._node_degree(node, weight, out=False)
+            return degree
+        if self._directed:
+            degree = self._degree_array(weight, out=True) + \
+                self._degree_array(weight, out=False)
+        else:
+            degree = self._degree_array(weight)
+        return self._as_dict(degree)
+
+    def out_degree(self, weight='weight', node=None):
+        if node is not None:
+            return self._node_degree(node, weight, out=True)
+        return self._as_dict(self._degree_array(weight, out=True))
+
+    def in_degree(self, weight='weight', node=None):
+        if node is not None:
+            return self._node_degree(node, weight, out=False)
+        return self._as_dict(self._degree_array(weight, out=False))
+
+    def size(self, weight=None):
+        """
+        Returns the number of edges or total of all edge weights.
+
+        Parameters
+        -----------
+        weight : String or None
+            key for edge weight.
+        """
+        key = weight if weight == self.weight else None
+        if key not in self._sizes:
+            if key is None and self._directed:
+                s = len(self.indices)
+            else:
+                s = self._degree_array(weight).sum().item()
+            if self._directed:
+                self._sizes[key] = int(s) if key is None else s
+            else:
+                self._sizes[key] = s // 2 if key is None else s / 2
+        return self._sizes[key]
+
+    def neighbors(self, node):
+        return iter(self[node])
+
+    successors = neighbors
+
+    def predecessors(self, node):
+        return iter(self.pred[node])
+
+    def all_neighbors(self, node):
+        if not self._directed:
+            return self.neighbors(node)
+        i = self._index(node)
+        both = np.union1d(self.indices[self.indptr[i]:self.indptr[i + 1]],
+                          self.in_indices[self.in_indptr[i]:self.in_indptr[i + 1]])
+        return map(self._nodes.__getitem__, both.tolist())
+
+    def has_node(self, node):
+        return node in self
+
+    def has_edge(self, u, v):
+        try:
+            return v in self[u]
+        except KeyError:
+            return False
+
+    def rows_of(self, nodes):
+        """
+        Returns the row index of each of `nodes` as an int64 array, -1 for
+        nodes not in the graph. Integer labels are looked up with array
+        operations, other labels through `index_of_node`.
+        """
+        if self._label_lookup is None:
+            n = len(self._nodes)
+            if _is_range(self._nodes):
+                self._label_lookup = 'range'
+            elif all(type(node) is int for node in self._nodes):
+                labels = np.fromiter(self._nodes, dtype=np.int64, count=n)
+                if np.array_equal(labels, np.arange(n)):
+                    self._label_lookup = 'range'
+                else:
+                    order = np.argsort(labels, kind='stable')
+                    self._label_lookup = (labels[order], order)
+            else:
+                self._label_lookup = 'dict'
+        query = np.asarray(nodes)
+        if self._label_lookup == 'dict' or query.dtype.kind not in 'iu' or query.ndim != 1:
+            index_of_node = self.index_of_node
+            return np.fromiter((index_of_node.get(node, -1) for node in nodes),
+                               dtype=np.int64, count=len(nodes))
+        query = query.astype(np.int64)
+        if self._label_lookup == 'range':
+            return np.where((query >= 0) & (query < len(self._nodes)), query, -1)
+        labels, order = self._label_lookup
+        if len(labels) == 0:
+            return np.full(len(query), -1, dtype=np.int64)
+        pos = _search(labels, query).clip(max=len(labels) - 1)
+        return np.where(labels[pos] == query, order[pos], -1)
+
+    def _known_rows(self, nodes):
+        rows = self.rows_of(nodes)
+        missing = np.flatnonzero(rows < 0)
+        if len(missing):
+            raise KeyError("No node {} in graph.".format(nodes[missing[0]]))
+        return rows
+
+    def _edge_positions(self, u, v):
+        # Position in indices of each edge (u[i], v[i]) of rows, -1 if absent
+        if self._edge_keys is None:
+            n = len(self._nodes)
+            self._edge_keys = self._row_ids(self.indptr).astype(np.int64) * n + self.indices
+        keys = self._edge_keys
+        query = u * len(self._nodes) + v
+        if len(keys) == 0:
+            return np.full(len(query), -1, dtype=np.int64)
+        pos = _search(keys, query).clip(max=len(keys) - 1)
+        return np.where((keys[pos] == query) & (u >= 0) & (v >= 0), pos, -1)
+
+    def has_edges(self, u, v):
+        """
+        Returns whether each pair (u[i], v[i]) is an edge, as a boolean
+        array, with binary searches over the sorted edge keys and no
+        per-pair Python work.
+
+        Parameters
+        ----------
+        u, v : array-like
+            endpoints of the pairs, of the same length.
+        """
+        if len(u) != len(v):
+            raise ValueError("u and v must have the same length.")
+        return self._edge_positions(self.rows_of(u), self.rows_of(v)) >= 0
+
+    def degrees_of(self, nodes, weight='weight'):
+        """
+        Returns the degree of each of `nodes` as an array, reading only
+        their rows.
+
+        Parameters
+        ----------
+        nodes : array-like
+
+        weight : String or None
+            key for edge weight. None if every edge counts as 1.
+        """
+        rows = self._known_rows(nodes)
+        degree = self._row_degrees(rows, weight, self.indptr, self.weights)
+        if self._directed:
+            return degree + self._row_degrees(rows, weight, self.in_indptr, self.in_weights)
+        # self-loop counts twice
+        loops = self._edge_positions(rows, rows)
+        is_loop = loops >= 0
+        if weight is None or weight != self.weight:
+            return degree + is_loop
+        degree[is_loop] += self.weights[loops[is_loop]]
+        return degree
+
+    def _row_degrees(self, rows, weight, indptr, weights):
+        weights = self._weight_array(weight, weights)
+        starts = indptr[rows].astype(np.int64)
+        lengths = indptr[rows + 1] - starts
+        if weights is None:
+            return lengths.astype(np.int64)
+        positions, offsets = _gather_positions(starts, lengths)
+        return np.bincount(np.repeat(np.arange(len(rows)), lengths),
+                           weights=weights[positions], minlength=len(rows))
+
+    def neighbors_of(self, nodes):
+        """
+        Returns the neighbors (successors if directed) of all `nodes` in
+        CSR form: an array of the concatenated neighbor labels, and the
+        offsets such that the neighbors of ``nodes[i]`` are
+        ``neighbors[offsets[i]:offsets[i+1]]``. See `gather_neighbors`
+        for row indices.
+
+        Parameters
+        ----------
+        nodes : array-like
+        """
+        neighbors, offsets = self.gather_neighbors(self._known_rows(nodes))
+        if self._label_lookup == 'range':
+            return neighbors, offsets
+        if self._label_array is None:
+            from .bulk_edges import label_array
+            self._label_array = label_array(self._nodes)
+        return self._label_array[neighbors], offsets
+
+    def number_of_nodes(self):
+        return len(self._nodes)
+
+    def number_of_edges(self):
+        return int(self.size())
+
+    def is_directed(self):
+        return self._directed
+
+    def memory_usage(self, deep=True):
+        """
+        Returns the bytes taken by the snapshot, as a dict with
+
+        'arrays' : CSR arrays held in memory, and the edge keys of
+            `has_edges` once built
+        'mapped' : CSR arrays memory-mapped from a file (see
+            `load_binary`) or in shared memory (see `to_shared_memory`),
+            shared between processes
+        'nodes' : node table, and the label -> index dict if built
+        'graph_attrs' : graph attribute dict
+        'total' : sum of the above except 'mapped'
+
+        Parameters
+        ----------
+        deep : boolean
+            if true, node labels and attribute values are counted too,
+            otherwise only the containers.
+        """
+        from OpenGraph.utils.memory import sizeof
+        seen = set()
+        usage = dict(arrays=0, mapped=0)
+        for array in (self.indptr, self.indices, self.weights,
+                      self.in_indptr, self.in_indices, self.in_weights):
+            if id(array) in seen or array.strides == (0,):  # aliased or unit weights
+                continue
+            seen.add(id(array))
+            mapped = isinstance(array, np.memmap) or self._shared_memory is not None
+            usage['mapped' if mapped else 'arrays'] += array.nbytes
+        for array in (self._edge_keys, self._label_array):
+            if array is not None:
+                usage['arrays'] += array.nbytes
+        usage['nodes'] = sizeof(self._nodes, deep=deep, seen=seen) + \
+            sizeof(self._index_of_node, deep=deep, seen=seen)
+        usage['graph_attrs'] = sizeof(self.graph, deep=deep, seen=seen)
+        usage['total'] = sum(size for key, size in usage.items() if key != 'mapped')
+        return usage
+
+    def to_shared_memory(self):
+        """
+        Places the arrays and node labels in shared memory and returns a
+        small picklable handle (OpenGraph.SharedGraph) that process-pool
+        workers attach to without copying. Free it with ``unlink()``.
+        """
+        from .shared_graph import SharedGraph
+        return SharedGraph.create(self)
+
+    def copy(self):
+        """
+        Returns a mutable Graph/DiGraph holding the same nodes and weights.
+        """
+        from .graph import Graph
+        from .directed_graph import DiGraph
+        G = DiGraph() if self._directed else Graph()
+        G.graph.update(self.graph)
+        G.add_nodes(list(self._nodes))
+        labels = self._nodes
+        row_ids = self._row_ids(self.indptr)
+        indices, weights = self.indices, self.weights
+        if not self._directed:  # each edge once, from its first row
+            once = row_ids <= indices
+            row_ids, indices, weights = row_ids[once], indices[once], weights[once]
+        row_ids, indices = row_ids.tolist(), indices.tolist()
+        if self.weight is None:
+            for u, v in zip(row_ids, indices):
+                G._add_one_edge(labels[u], labels[v])
+        else:
+            for u, v, w in zip(row_ids, indices, weights.tolist()):
+                G._add_one_edge(labels[u], labels[v], {self.weight: w})
+        return G
+
+    thaw = copy
+
+    def nodes_subgraph(self, from_nodes: list):
+        """
+        Returns the CSRGraph induced by `from_nodes`, built with array
+        masks over the edges instead of per-edge lookups.
+        """
+        index_of_node = self.index_of_node
+        keep = np.zeros(len(self._nodes), dtype=bool)
+        keep[[index_of_node[node] for node in from_nodes if node in index_of_node]] = True
+        new_index = np.cumsum(keep) - 1
+        nodes = [node for node, k in zip(self._nodes, keep.tolist()) if k]
+
+        def select(indptr, indices, weights):
+            row_ids = self._row_ids(indptr)
+            mask = keep[row_ids] & keep[indices]
+            counts = np.bincount(new_index[row_ids[mask]], minlength=len(nodes))
+            new_indptr = np.zeros(len(nodes) + 1, dtype=indptr.dtype)
+            np.cumsum(counts, out=new_indptr[1:])
+            return new_indptr, new_index[indices[mask]].astype(indices.dtype), weights[mask]
+
+        indptr, indices, weights = select(self.indptr, self.indices, self.weights)
+        if self._directed:
+            in_indptr, in_indices, in_weights = select(
+                self.in_indptr, self.in_indices, self.in_weights)
+        else:
+            in_indptr = in_indices = in_weights = None
+        return self.__class__(indptr, indices, weights, nodes=nodes, directed=self._directed,
+                              in_indptr=in_indptr, in_indices=in_indices, in_weights=in_weights,
+                              weight=self.weight, **self.graph)
+
+    def ego_subgraph(self, center):
+        neighbors_of_center = list(self.all_neighbors(center))
+        neighbors_of_center.append(center)
+        return self.nodes_subgraph(from_nodes=neighbors_of_center)
+
+    def to_index_node_graph(self):
+        """
+        Returns
+        1. graph with each node switched to its index, sharing the arrays of this graph.
+        2. index of node
+        3. node of index
+        """
+        G = self.__class__(self.indptr, self.indices, self.weights, directed=self._directed,
+                           in_indptr=self.in_indptr, in_indices=self.in_indices,
+                           in_weights=self.in_weights, weight=self.weight, **self.graph)
+        index_of_node = dict(self.index_of_node)
+        node_of_index = dict(enumerate(self._nodes))
+        return G, index_of_node, node_of_index
+
+    def gather_neighbors(self, rows):
+        """
+        Returns the concatenated neighbor indices of the row indices `rows`
+        and the position of each row's block, without a Python loop.
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        starts = self.indptr[rows].astype(np.int64)
+        lengths = self.indptr[rows + 1] - starts
+        positions, offsets = _gather_positions(starts, lengths)
+        return self.indices[positions], offsets
+
+
+def _unit_weights(m):
+    # Weight 1 for each of m edges, a read-only view of a single float
+    return np.broadcast_to(np.ones(1), (m,))
+
+
+def _is_range(nodes):
+    return isinstance(nodes, range) and nodes == range(len(nodes))
+
+
+class _RangeIndex(Mapping):
+    """
+    index_of_node of labels 0..n-1, each label its own index, in O(1)
+    memory.
+    """
+    __slots__ = ('_n',)
+
+    def __init__(self, n):
+        self._n = n
+
+    def __getitem__(self, node):
+        if type(node) is not bool and isinstance(node, (int, np.integer)) and 0 <= node < self._n:
+            return int(node)
+        raise KeyError(node)
+
+    def __iter__(self):
+        return iter(range(self._n))
+
+    def __len__(self):
+        return self._n
+
+
+def _search(keys, query):
+    # keys.searchsorted(query), on sorted queries: consecutive searches
+    # then hit the same cache lines, several times faster for large batches
+    order = np.argsort(query)
+    pos = np.empty(len(query), dtype=np.int64)
+    pos[order] = keys.searchsorted(query[order])
+    return pos
+
+
+def _gather_positions(starts, lengths):
+    # Positions of the blocks [starts[i], starts[i] + lengths[i]) one after
+    # the other, and the offset of each block in them
+    offsets = np.zeros(len(starts) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    positions = np.arange(offsets[-1], dtype=np.int64) + \
+        np.repeat(starts - offsets[:-1], lengths)
+    return positions, offsets
+
+
+def _build_csr_arrays(adj, nodes, index_of_node, weight):
+    degrees = [len(adj[node]) for node in nodes]
+    nnz = sum(degrees)
+    index_dtype = np.int32 if max(nnz, len(nodes)) < 2 ** 31 else np.int64
+    indptr = np.zeros(len(nodes) + 1, dtype=index_dtype)
+    np.cumsum(degrees, out=indptr[1:])
+    indices = np.empty(nnz, dtype=index_dtype)
+    weights = np.empty(nnz, dtype=np.float64)
+    pos = 0
+    for node in nodes:
+        nbrs = adj[node]
+        end = pos + len(nbrs)
+        indices[pos:end] = [index_of_node[v] for v in nbrs]
+        if weight is None:
+            weights[pos:end] = 1.0
+        else:
+            weights[pos:end] = [d.get(weight, 1) for d in nbrs.values()]
+        pos = end
+    # Sort neighbors by index inside each row
+    row_ids = np.repeat(np.arange(len(nodes), dtype=np.int64), degrees)
+    order = np.lexsort((indices, row_ids))
+    return indptr, indices[order], weights[order]
+
+
+def _csr_from_pairs(rows, cols, weights, n):
+    index_dtype = np.int32 if max(len(rows), n) < 2 ** 31 else np.int64
+    order = np.lexsort((cols, rows))
+    indptr = np.zeros(n + 1, dtype=index_dtype)
+    np.cumsum(np.bincount(rows, minlength=n), out=indptr[1:])
+    return indptr, cols[order].astype(index_dtype), weights[order]
+
+
+class _CSRAdjacency(object):
+    """
+    Read-only mapping node -> row of a CSRGraph, like ``Graph.adj``.
+    """
+    __slots__ = ('_graph', '_indptr', '_indices', '_weights')
+
+    def __init__(self, graph, indptr, indices, weights):
+        self._graph = graph
+        self._indptr = indptr
+        self._indices = indices
+        self._weights = weights
+
+    def __getitem__(self, node):
+        return _CSRRow(self._graph, self._graph._index(node),
+                       self._indptr, self._indices, self._weights)
+
+    def __iter__(self):
+        return iter(self._graph._nodes)
+
+    def __len__(self):
+        return len(self._graph._nodes)
+
+    def __contains__(self, node):
+        return node in self._graph
+
+    def keys(self):
+        return iter(self)
+
+    def items(self):
+        for node in self._graph._nodes:
+            yield node, self[node]
+
+    def values(self):
+        for node in self._graph._nodes:
+            yield self[node]
+
+
+class _CSRRow(object):
+    """
+    Read-only mapping neighbor -> edge attribute dict of one CSR row, like
+    ``G[u]`` of Graph. The attribute dicts are created on access.
+    """
+    __slots__ = ('_graph', '_start', '_end', '_indices', '_weights')
+
+    def __init__(self, graph, i, indptr, indices, weights):
+        self._graph = graph
+        self._start = int(indptr[i])
+        self._end = int(indptr[i + 1])
+        self._indices = indices
+        self._weights = weights
+
+    def _find(self, node):
+        try:
+            j = self._graph.index_of_node[node]
+        except (KeyError, TypeError):
+            return -1
+        pos = self._start + int(np.searchsorted(
+            self._indices[self._start:self._end], j))
+        if pos < self._end and self._indices[pos] == j:
+            return pos
+        return -1
+
+    def _attr(self, pos):
+        weight = self._graph.weight
+        return {} if weight is None else {weight: self._weights[pos].item()}
+
+    def __len__(self):
+        return self._end - self._start
+
+    def __iter__(self):
+        labels = self._graph._nodes
+        return map(labels.__getitem__, self._indices[self._start:self._end].tolist())
+
+    def __contains__(self, node):
+        return self._find(node) >= 0
+
+    def __getitem__(self, node):
+        pos = self._find(node)
+        if pos < 0:
+            raise KeyError(node)
+        return self._attr(pos)
+
+    def get(self, node, default=None):
+        pos = self._find(node)
+        return default if pos < 0 else self._attr(pos)
+
+    def keys(self):
+        return iter(self)
+
+    def items(self):
+        labels = self._graph._nodes
+        weight = self._graph.weight
+        indices = self._indices[self._start:self._end].tolist()
+        if weight is None:
+            for j in indices:
+                yield labels[j], {}
+        else:
+            for j, w in zip(indices, self._weights[self._start:self._end].tolist()):
+                yield labels[j], {weight: w}
+
+    def values(self):
+        for node, attr in self.items():
+            yield attr
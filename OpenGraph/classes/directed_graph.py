@@ -1,4 +1,8 @@
 from copy import deepcopy
+from itertools import chain
+from .edge_view import OutEdgeView
+from .journal import Journal
+from .concurrency import Concurrency
 
 class DiGraph(object):
     graph_attr_dict_factory = dict
@@ -13,6 +17,26 @@ class DiGraph(object):
         self._node = self.node_dict_factory()
         self._adj = self.adjlist_outer_dict_factory()
         self._pred = self.adjlist_outer_dict_factory()
+        # weight key -> {node: out/in degree}, built lazily by out_degree()
+        # and in_degree() and kept up to date by every mutation afterwards.
+        self._out_degree_index = dict()
+        self._in_degree_index = dict()
+        self._degree_total = dict()
+        # node -> int id and int id -> node, built lazily by index_of_node
+        # and kept up to date by node additions and removals afterwards.
+        self._node_index = None
+        self._index_node = None
+        self._index_holes = 0
+        # Copy-on-write after copy(lazy=True): None if all rows and
+        # attribute dicts belong to this graph, else the set of nodes whose
+        # row and attribute dict were made private since they got shared.
+        self._owned = None
+        # Number of changes so far, and their opt-in record, see
+        # enable_journal
+        self._version = 0
+        self._journal = None
+        # Opt-in lock and snapshot for threads, see enable_concurrency
+        self._concurrency = None
 
         self.graph.update(graph_attr)
 
@@ -36,56 +60,214 @@ class DiGraph(object):
     def adj(self):
         return self._adj
 
+    @property
+    def pred(self):
+        return self._pred
+
     @property
     def nodes(self):
-        # return self._node
-        return [node for node in self._node]
+        return self._node
+        # return [node for node in self._node]
 
     @property
     def edges(self):
-        edges = list()
-        for u in self._adj:
-            for v in self._adj[u]:
-                edges.append((u, v, self._adj[u][v]))
-        return edges
-
-    def out_degree(self, weight='weight'):
-        degree = dict()
-        for u, v, d in self.edges:
-            if u in degree:
-                degree[u] += d.get(weight, 1)
-            else:
-                degree[u] = d.get(weight, 1)
-        
-        # For isolated nodes
-        for node in self.nodes:
-            if node not in degree:
-                degree[node] = 0
-
-        return degree
-
-    def in_degree(self, weight='weight'):
-        degree = dict()
-        for u, v, d in self.edges:
-            if v in degree:
-                degree[v] += d.get(weight, 1)
-            else:
-                degree[v] = d.get(weight, 1)
-        
-        # For isolated nodes
-        for node in self.nodes:
-            if node not in degree:
-                degree[node] = 0
+        """
+        Returns a lazy view of the edges, yielding (u, v, edge_attr) triples.
+        Call it for projections, e.g. ``G.edges(data=False)`` or
+        ``G.edges(weight='weight')``. See `OutEdgeView`.
+        """
+        return OutEdgeView(self)
+
+    @property
+    def index_of_node(self):
+        """
+        Returns the dict mapping each node to its integer id.
+
+        The table is built in one pass on first use and then kept up to
+        date incrementally: a new node gets the next id, a removed node
+        leaves a hole, and the ids of the other nodes never change until
+        `compact_node_index` is called. Without holes, the ids are
+        0..n-1 in node order. Do not modify the dict.
+        """
+        if self._node_index is None:
+            self._index_node = list(self._node)
+            self._node_index = {node: i for i, node in enumerate(self._index_node)}
+            self._index_holes = 0
+        return self._node_index
+
+    @property
+    def node_of_index(self):
+        """
+        Returns the list mapping each integer id to its node, see
+        `index_of_node`. Ids of removed nodes hold None until
+        `compact_node_index` is called. Do not modify the list.
+        """
+        self.index_of_node
+        return self._index_node
+
+    def compact_node_index(self):
+        """
+        Renumbers the nodes 0..n-1 in node order, dropping the ids left by
+        removed nodes. Does nothing if no node was removed since the last
+        compaction. Tables returned before keep the old ids.
+        """
+        if self._index_holes:
+            self._node_index = None
+            self._index_node = None
+            self._index_holes = 0
+
+    @property
+    def version(self):
+        """
+        Returns the number of changes made to the graph so far: each node
+        or edge added, updated or removed counts one.
+        """
+        return self._version
+
+    def enable_journal(self, maxlen=None):
+        """
+        Starts recording the changes of the graph, so that an algorithm can
+        update a previous result from `changes_since` instead of running
+        again on the whole graph. Does nothing if already enabled.
+
+        Parameters
+        ----------
+        maxlen : int or None
+            if given, only the latest `maxlen` changes are kept.
+        """
+        if self._journal is None:
+            self._journal = Journal(self._version, maxlen=maxlen)
+
+    def disable_journal(self):
+        """
+        Stops recording changes and drops the journal.
+        """
+        self._journal = None
+
+    def changes_since(self, version):
+        """
+        Returns the changes made after `version`, a previous value of
+        `G.version`, oldest first, as a list of JournalEntry
+        (version, op, u, v, attr). Removing a node is recorded as the
+        removal of each of its edges, then of the node.
+
+        Raises ValueError if the journal is not enabled or no longer holds
+        all of these changes, in which case the result should be computed
+        from scratch.
+        """
+        if self._journal is None:
+            raise ValueError("The journal is not enabled, see enable_journal.")
+        return self._journal.since(version)
 
-        return degree
+    def enable_concurrency(self):
+        """
+        Makes the graph safe to share between threads: one thread writes,
+        inside ``with G.writing():``, while any number of threads read,
+        either inside ``with G.reading():`` or from ``G.snapshot()``.
+        Does nothing if already enabled.
+
+        Iterating the graph while another thread changes it raises
+        "dictionary changed size during iteration" or reads a half-done
+        change, so once enabled every change must be made inside
+        `writing`.
+        """
+        if self._concurrency is None:
+            self._concurrency = Concurrency()
+
+    def reading(self):
+        """
+        Returns a context manager holding the graph in shared mode: other
+        readers run at the same time, writers wait until it exits.
+        Reentrant. See `enable_concurrency`.
+        """
+        return self._get_concurrency().lock.reading()
+
+    def writing(self):
+        """
+        Returns a context manager holding the graph in exclusive mode, to
+        make a batch of changes that readers see all at once or not at
+        all. Reentrant. See `enable_concurrency`.
+        """
+        return self._get_concurrency().lock.writing()
+
+    def snapshot(self):
+        """
+        Returns a copy-on-write copy of the graph as of the end of the
+        last write batch, to read without any lock.
+
+        All readers share the snapshot of a version: it is taken once
+        after each batch, costing O(nodes), and the next writes copy the
+        rows they change instead of changing the shared ones. During a
+        batch, the previous snapshot is returned without waiting. Do not
+        modify it. See `enable_concurrency`.
+        """
+        return self._get_concurrency().get_snapshot(self)
+
+    def _get_concurrency(self):
+        if self._concurrency is None:
+            raise ValueError("Concurrency is not enabled, see enable_concurrency.")
+        return self._concurrency
+
+    def _record(self, op, u, v=None, attr={}):
+        # Counts one change, and journals it with a copy of `attr`
+        self._version += 1
+        if self._journal is not None:
+            self._journal.record(self._version, op, u, v, dict(attr))
+
+    def out_degree(self, weight='weight', node=None):
+        """
+        Returns the out degree of each node, or of one node if `node` is
+        given.
+
+        The degrees are read from an index that is built in one pass on the
+        first call for each weight key and then updated incrementally by
+        `add_edge`, `remove_edge` and `remove_node`. Changing an edge
+        attribute in place bypasses the index; use `add_edge` instead.
+        The degree of one node is summed from its row in O(degree) if the
+        index is not built yet.
+
+        Parameters
+        -----------
+        weight : String or None
+            key for edge weight. None if every edge counts as 1.
+
+        node : node or None
+            if given, only the degree of this node is returned.
+        """
+        if node is not None:
+            return self._row_degree(self._adj, self._out_degree_index, weight, node)
+        return dict(self._get_degree_index(weight)[0])
+
+    def in_degree(self, weight='weight', node=None):
+        """
+        Returns the in degree of each node, or of one node if `node` is
+        given, see `out_degree`.
+        """
+        if node is not None:
+            return self._row_degree(self._pred, self._in_degree_index, weight, node)
+        return dict(self._get_degree_index(weight)[1])
+
+    def degree(self, weight='weight', node=None):
+        """
+        Returns the in plus out degree of each node, or of one node if
+        `node` is given, see `out_degree`.
+        """
+        if node is not None:
+            return self.out_degree(weight, node) + self.in_degree(weight, node)
+        outdegree, indegree = self._get_degree_index(weight)
+        return {u: d + indegree[u] for u, d in outdegree.items()}
 
-    def degree(self, weight='weight'):
-        degree = dict()
-        outdegree = self.out_degree(weight=weight)
-        indegree = self.in_degree(weight=weight)
-        for u in outdegree:
-            degree[u] = outdegree[u] + indegree[u]
-        return degree
+    def _row_degree(self, rows, index, weight, node):
+        # Degree of one node, from the index if built, else from its row
+        try:
+            if weight in index:
+                return index[weight][node]
+            row = rows[node]
+        except KeyError:
+            raise KeyError("No node {} in graph.".format(node))
+        if weight is None:
+            return len(row)
+        return sum(datadict.get(weight, 1) for datadict in row.values())
 
     def size(self, weight=None):
         """
@@ -96,9 +278,37 @@ class DiGraph(object):
         weight : String or None
             key for edge weight.
         """
-        s = sum(d for v, d in self.out_degree(weight=weight).items())
+        self._get_degree_index(weight)
+        s = self._degree_total[weight]
         return int(s) if weight is None else s
 
+    def _get_degree_index(self, weight):
+        try:
+            return self._out_degree_index[weight], self._in_degree_index[weight]
+        except KeyError:
+            pass
+        out_index = dict.fromkeys(self._node, 0)
+        in_index = dict.fromkeys(self._node, 0)
+        total = 0
+        for u, nbrs in self._adj.items():
+            for v, d in nbrs.items():
+                w = d.get(weight, 1)
+                out_index[u] += w
+                in_index[v] += w
+                total += w
+        self._out_degree_index[weight] = out_index
+        self._in_degree_index[weight] = in_index
+        self._degree_total[weight] = total
+        return out_index, in_index
+
+    def _update_degree_index(self, u, v, edge_attr, sign):
+        # Add (sign=1) or subtract (sign=-1) edge (u, v) to every built index
+        for weight, out_index in self._out_degree_index.items():
+            w = sign * edge_attr.get(weight, 1)
+            out_index[u] += w
+            self._in_degree_index[weight][v] += w
+            self._degree_total[weight] += w
+
     def neighbors(self, node):
         # successors
         try:
@@ -116,13 +326,13 @@ class DiGraph(object):
             print("No node {}".format(node))
 
     def all_neighbors(self, node):
-        # union of successors and predecessors
+        # union of successors and predecessors, yielded lazily
         try:
-            neighbors = self._adj[node]
-            neighbors.extend(self.pred[node])
-            return iter(neighbors)
+            succs, preds = self._adj[node], self._pred[node]
         except KeyError:
             print("No node {}".format(node))
+            return
+        return chain(succs, (pred for pred in preds if pred not in succs))
 
     def add_node(self, node_for_adding, **node_attr):
         self._add_one_node(node_for_adding, node_attr)
@@ -149,8 +359,31 @@ class DiGraph(object):
 
             attr_dict = self._node[node] = self.node_attr_dict_factory()
             attr_dict.update(node_attr)
+            for weight in self._out_degree_index:
+                self._out_degree_index[weight][node] = 0
+                self._in_degree_index[weight][node] = 0
+            if self._node_index is not None:
+                self._node_index[node] = len(self._index_node)
+                self._index_node.append(node)
+            if self._owned is not None:
+                self._owned.add(node)
+            self._record('add_node', node, attr=attr_dict)
         else:  # If already exists, there is no complain and still updating the node attribute
+            if self._owned is not None:
+                self._own(node)
             self._node[node].update(node_attr)
+            if node_attr:
+                self._record('add_node', node, attr=self._node[node])
+
+    def _own(self, node):
+        # Copy-on-write: take private copies of the rows and attribute
+        # dict of `node` before mutating them, they may be shared with
+        # other copies of the graph
+        if node not in self._owned:
+            self._adj[node] = self._adj[node].copy()
+            self._pred[node] = self._pred[node].copy()
+            self._node[node] = self._node[node].copy()
+            self._owned.add(node)
 
     def add_edge(self, u_of_edge, v_of_edge, **edge_attr):
         self._add_one_edge(u_of_edge, v_of_edge, edge_attr)
@@ -175,34 +408,136 @@ class DiGraph(object):
             except Exception as err:
                 print(err)
 
-    def add_edges_from_file(self, file, weighted=False):
+    def add_edges_from_arrays(self, src, dst, weight=None):
+        """
+        Adds the edges (src[i], dst[i]) in bulk from NumPy arrays.
+
+        Labels are factorized, duplicate edges are dropped keeping the last
+        one, and each successor and predecessor row is filled with a single
+        update, all in vectorized form. New nodes are added in order of
+        first appearance. Edges that already exist in the graph are updated
+        like `add_edge` does.
+
+        Parameters
+        ----------
+        src, dst : array-like
+            endpoints of the edges, integer or object arrays of node labels.
+
+        weight : array-like or None
+            if given, the 'weight' attribute of each edge.
+        """
+        import numpy as np
+        from .bulk_edges import factorize_edge_arrays
+        labels, u, v = factorize_edge_arrays(src, dst)
+        if weight is not None:
+            weight = np.asarray(weight, dtype=np.float64)
+            if weight.shape != u.shape:
+                raise ValueError("weight must have the same length as src and dst.")
+        self._add_edges_from_indices(labels, u, v, weight)
+
+    def _add_edges_from_indices(self, labels, u, v, weight=None):
+        # add_edges_from_arrays once labels are factorized: edge i joins
+        # labels[u[i]] and labels[v[i]]
+        import numpy as np
+        from .bulk_edges import dedupe_edges, group_rows, degree_deltas, object_array
+        u, v, weight = dedupe_edges(u, v, weight, len(labels), directed=True)
+
+        existed = np.fromiter((label in self._node for label in labels),
+                              dtype=bool, count=len(labels))
+        for label, exists in zip(labels, existed.tolist()):
+            if not exists:
+                self._add_one_node(label)
+
+        # Only edges between two old nodes can already exist
+        old = existed[u] & existed[v]
+        for i in np.flatnonzero(old).tolist():
+            attr = {} if weight is None else {'weight': weight[i].item()}
+            self._add_one_edge(labels[u[i]], labels[v[i]], attr)
+        new = ~old
+        u, v = u[new], v[new]
+        weight = None if weight is None else weight[new]
+
+        factory = self.edge_attr_dict_factory
+        datadicts = [factory() for i in range(len(u))]
+        if weight is not None:
+            for datadict, w in zip(datadicts, weight.tolist()):
+                datadict['weight'] = w
+        datadicts = object_array(datadicts)
+        labels_array = object_array(labels)
+        for row, row_cols, row_values in group_rows(u, labels_array[v], datadicts):
+            if self._owned is not None:
+                self._own(labels[row])
+            self._adj[labels[row]].update(zip(row_cols, row_values))
+        for row, row_cols, row_values in group_rows(v, labels_array[u], datadicts):
+            if self._owned is not None:
+                self._own(labels[row])
+            self._pred[labels[row]].update(zip(row_cols, row_values))
+        if self._journal is None:
+            self._version += len(u)
+        else:
+            for i, j, datadict in zip(u.tolist(), v.tolist(), datadicts.tolist()):
+                self._record('add_edge', labels[i], labels[j], datadict)
+
+        for key, out_index in self._out_degree_index.items():
+            out_delta = degree_deltas(u, key, weight, len(labels))
+            in_delta = degree_deltas(v, key, weight, len(labels))
+            in_index = self._in_degree_index[key]
+            for i in np.flatnonzero(out_delta).tolist():
+                out_index[labels[i]] += out_delta[i].item()
+            for i in np.flatnonzero(in_delta).tolist():
+                in_index[labels[i]] += in_delta[i].item()
+            self._degree_total[key] += out_delta.sum().item()
+
+    def add_edges_from_file(self, file, weighted=False, chunk_size=1 << 22, verbose=False,
+                            nodetype=None):
         """
         Added edges from file, for example, txt files.
         Each line is in form like:
         a b 23.0
         which denotes an edge (a, b) with weight 23.0.
 
+        The file is streamed in chunks of `chunk_size` characters and
+        inserted chunk by chunk, so memory stays bounded by the graph
+        itself whatever the size of the file. Blank and '#' comment lines
+        are skipped, malformed lines are skipped and counted. Files
+        compressed with gzip, bzip2 or xz are decompressed on the fly.
+
         Parameters
         ----------
         weighted : boolean
             if true, add an weighted edge
+
+        chunk_size : int
+            number of characters read and inserted at once
+
+        verbose : boolean
+            if true, print the progress and the number of malformed lines
+
+        nodetype : type or callable or None
+            parses the node labels, e.g. int for numeric ids, which are
+            faster to look up than strings. None keeps them as strings.
+
+        Returns
+        ----------
+        stats : dict
+            'lines', 'edges' and 'malformed' counts of the file, see
+            `OpenGraph.readwrite.parse_edgelist`.
         """
-        with open(file, 'r') as fp:
-            edges = fp.readlines()
-        if weighted:
-            for edge in edges:
-                edge = edge.split()
-                try:
-                    self.add_edge(edge[0], edge[1], weight=float(edge[2]))
-                except:
-                    pass
-        else:
-            for edge in edges:
-                edge = edge.split()
-                try:
-                    self.add_edge(edge[0], edge[1])
-                except:
-                    pass
+        from OpenGraph.readwrite.edgelist import parse_edgelist
+        stats = dict()
+        for src, dst, weight in parse_edgelist(file, weighted=weighted, chunk_size=chunk_size,
+                                               stats=stats, nodetype=nodetype):
+            if weight is None:
+                for u, v in zip(src, dst):
+                    self._add_one_edge(u, v)
+            else:
+                for u, v, w in zip(src, dst, weight):
+                    self._add_one_edge(u, v, {'weight': w})
+            if verbose:
+                print("Read {:.1f}/{:.1f} MB, {} edges, {} malformed lines".format(
+                    stats['bytes_read'] / 2**20, stats['bytes_total'] / 2**20,
+                    stats['edges'], stats['malformed']))
+        return stats
 
     def _add_one_edge(self, u_of_edge, v_of_edge, edge_attr: dict = {}):
         u, v = u_of_edge, v_of_edge
@@ -211,27 +546,65 @@ class DiGraph(object):
             self._add_one_node(u)
         if v not in self._node:
             self._add_one_node(v)
+        if self._owned is not None:
+            self._own(u)
+            self._own(v)
         # add the edge
-        datadict = self._adj[u].get(v, self.edge_attr_dict_factory())
-        datadict.update(edge_attr)
-        self._adj[u][v] = datadict
-        self._pred[v][u] = datadict
+        datadict = self._adj[u].get(v, None)
+        if datadict is None:
+            datadict = self.edge_attr_dict_factory()
+            datadict.update(edge_attr)
+            self._adj[u][v] = datadict
+            self._pred[v][u] = datadict
+        elif edge_attr:  # Existing edge, its old weight leaves the degree index
+            self._update_degree_index(u, v, datadict, -1)
+            if self._owned is not None:  # may be shared with other copies
+                datadict = self._adj[u][v] = self._pred[v][u] = datadict.copy()
+            datadict.update(edge_attr)
+        else:  # Existing edge and nothing to update
+            return
+        self._update_degree_index(u, v, datadict, 1)
+        self._version += 1
+        if self._journal is not None:
+            self._journal.record(self._version, 'add_edge', u, v, dict(datadict))
 
     def remove_node(self, node_to_remove):
         try:
             succs = list(self._adj[node_to_remove])
             preds = list(self._pred[node_to_remove])
-            del self._node[node_to_remove]
+            node_attr = self._node.pop(node_to_remove)
         except KeyError:  # Node not exists in self
             raise KeyError("No node {} in graph.".format(node_to_remove))
         for succ in succs:  # Remove edges start with node_to_remove
-            del self._pred[succ][node_to_remove]
+            self._update_degree_index(
+                node_to_remove, succ, self._adj[node_to_remove][succ], -1)
+            self._record('remove_edge', node_to_remove, succ, self._adj[node_to_remove][succ])
+            if succ != node_to_remove:  # own rows are dropped below
+                if self._owned is not None:
+                    self._own(succ)
+                del self._pred[succ][node_to_remove]
         for pred in preds:  # Remove edges end with node_to_remove
+            if pred == node_to_remove:  # self-loop already removed above
+                continue
+            self._update_degree_index(
+                pred, node_to_remove, self._adj[pred][node_to_remove], -1)
+            self._record('remove_edge', pred, node_to_remove, self._adj[pred][node_to_remove])
+            if self._owned is not None:
+                self._own(pred)
             del self._adj[pred][node_to_remove]
 
         # Remove this node
         del self._adj[node_to_remove]
         del self._pred[node_to_remove]
+        if self._owned is not None:
+            self._owned.discard(node_to_remove)
+        for weight in self._out_degree_index:
+            del self._out_degree_index[weight][node_to_remove]
+            del self._in_degree_index[weight][node_to_remove]
+        if self._node_index is not None:
+            self._index_node[self._node_index.pop(node_to_remove)] = None
+            self._index_holes += 1
+        self._record('remove_node', node_to_remove, attr=node_attr)
 
     def remove_nodes(self, nodes_to_remove: list):
         for node in nodes_to_remove:  # If not all nodes included in graph, give up removing other nodes
@@ -241,11 +614,16 @@ class DiGraph(object):
             self.remove_node(node)
 
     def remove_edge(self, u, v):
+        if self._owned is not None and self.has_edge(u, v):
+            self._own(u)
+            self._own(v)
         try:
-            del self._adj[u][v]
+            datadict = self._adj[u].pop(v)
             del self._pred[v][u]
         except KeyError:
             raise KeyError("No edge {}-{} in graph.".format(u, v))
+        self._update_degree_index(u, v, datadict, -1)
+        self._record('remove_edge', u, v, datadict)
 
     def remove_edges(self, edges_to_remove: [tuple]):
         for edge in edges_to_remove:
@@ -261,6 +639,61 @@ class DiGraph(object):
         except KeyError:
             return False
 
+    def has_edges(self, u, v):
+        """
+        Returns whether each pair (u[i], v[i]) is an edge, as a boolean
+        array, in one call instead of one `has_edge` call per pair. Use a
+        CSRGraph (`to_csr`) for a fully vectorized lookup.
+
+        Parameters
+        ----------
+        u, v : array-like
+            endpoints of the pairs, of the same length.
+        """
+        import numpy as np
+        if len(u) != len(v):
+            raise ValueError("u and v must have the same length.")
+        adj = self._adj
+        empty = {}
+        return np.fromiter((y in adj.get(x, empty) for x, y in zip(u, v)),
+                           dtype=bool, count=len(u))
+
+    def degrees_of(self, nodes, weight='weight'):
+        """
+        Returns the degree of each of `nodes` as an array, see `degree`.
+
+        Parameters
+        ----------
+        nodes : array-like
+
+        weight : String or None
+            key for edge weight. None if every edge counts as 1.
+        """
+        import numpy as np
+        return np.array([self.degree(weight=weight, node=node) for node in nodes])
+
+    def neighbors_of(self, nodes):
+        """
+        Returns the successors of all `nodes` in CSR form: an array of
+        the concatenated neighbors, and the offsets such that the
+        neighbors of ``nodes[i]`` are ``neighbors[offsets[i]:offsets[i+1]]``.
+
+        Parameters
+        ----------
+        nodes : array-like
+        """
+        import numpy as np
+        from .bulk_edges import label_array
+        neighbors = []
+        offsets = np.zeros(len(nodes) + 1, dtype=np.int64)
+        for i, node in enumerate(nodes):
+            try:
+                neighbors.extend(self._adj[node])
+            except KeyError:
+                raise KeyError("No node {} in graph.".format(node))
+            offsets[i + 1] = len(neighbors)
+        return label_array(neighbors), offsets
+
     def number_of_nodes(self):
         return len(self._node)
 
@@ -270,18 +703,114 @@ class DiGraph(object):
     def is_directed(self):
         return True
 
-    def copy(self):
+    def copy(self, lazy=False):
+        """
+        Returns an independent copy of the graph, with its own rows and
+        node and edge attribute dicts.
+
+        Parameters
+        ----------
+        lazy : boolean
+            if true, returns a copy-on-write copy instead. Only the outer
+            node and adjacency dicts are copied, the rows and attribute
+            dicts are shared, so copying costs no per-edge work. Whichever
+            graph later mutates a shared row through its methods
+            (add_node, add_edge, remove_node, remove_edge, ...) first takes
+            a private copy of it: removing a node from a copy costs the
+            degrees of its neighbors, not the size of the graph. Attribute
+            dicts stay shared, so changing attributes in place, e.g.
+            ``G[u][v]['weight'] = 3``, is seen by both graphs.
+        """
         G = self.__class__()
         G.graph.update(self.graph)
-        for node, node_attr in self._node.items():
-            G.add_node(node, **node_attr.copy())
-        for u, nbrs in self._adj.items():
-            for v, edge_data in nbrs.items():
-                G.add_edge(u, v, **edge_data.copy())
-        
+        if lazy:
+            G._node = self._node.copy()
+            G._adj = self._adj.copy()
+            G._pred = self._pred.copy()
+            # Both graphs now share every row
+            self._owned = set()
+            G._owned = set()
+        else:
+            G._node = {node: attr.copy() for node, attr in self._node.items()}
+            # Edges added node after node, like add_edge would, a successor
+            # and its predecessor entry sharing one attribute dict
+            adj = G._adj = {node: {} for node in self._node}
+            pred = G._pred = {node: {} for node in self._node}
+            for u, nbrs in self._adj.items():
+                row = adj[u]
+                for v, datadict in nbrs.items():
+                    row[v] = pred[v][u] = datadict.copy()
+        G._out_degree_index = {key: dict(index) for key, index in self._out_degree_index.items()}
+        G._in_degree_index = {key: dict(index) for key, index in self._in_degree_index.items()}
+        G._degree_total = dict(self._degree_total)
+        G._version = self._version
         return G
 
+    def memory_usage(self, deep=True):
+        """
+        Returns the bytes taken by the graph, as a dict with
+
+        'nodes' : node dict and node attribute dicts
+        'adjacency' : adjacency dict, predecessor dict and its rows
+        'edge_attrs' : edge attribute dicts, a dict shared by several
+            edges counted once
+        'graph_attrs' : graph attribute dict
+        'indexes' : degree and node indexes, and the journal
+        'total' : sum of the above
+
+        Objects shared with other graphs, e.g. rows shared by `copy`, are
+        counted in full.
+
+        Parameters
+        ----------
+        deep : boolean
+            if true, node labels and attribute values are counted too,
+            otherwise only the containers.
+        """
+        from OpenGraph.utils.memory import graph_memory_usage
+        return graph_memory_usage(self, deep=deep)
+
+    def to_csr(self, weight='weight'):
+        """
+        Returns a read-only CSR snapshot of the graph (OpenGraph.CSRGraph),
+        built in one pass over the adjacency. Later changes to this graph
+        are not reflected in it.
+
+        Parameters
+        ----------
+        weight : String or None
+            key for edge weight kept in the snapshot, as float64.
+        """
+        from .csr_graph import CSRGraph
+        return CSRGraph.from_graph(self, weight=weight)
+
+    freeze = to_csr
+
+    def to_shared_memory(self, weight='weight'):
+        """
+        Returns a handle (OpenGraph.SharedGraph) of the CSR form of the
+        graph placed in shared memory, for process-pool workers.
+
+        The handle pickles to a few hundred bytes whatever the size of the
+        graph; each worker calls ``handle.attach()`` to read the graph as
+        a CSRGraph without copying it, so memory does not grow with the
+        number of workers. The calling process frees the segment with
+        ``handle.unlink()``, or uses the handle in a ``with`` block.
+
+        Parameters
+        ----------
+        weight : String or None
+            key for edge weight kept in the shared graph, as float64.
+        """
+        from .shared_graph import SharedGraph
+        return SharedGraph.create(self, weight=weight)
+
     def nodes_subgraph(self, from_nodes: list):
+        """
+        Returns a copy of the subgraph induced by `from_nodes`. Use
+        `OpenGraph.SubgraphView` to read it without copying.
+        """
+        from_nodes = set(from_nodes)
         G = self.__class__()
         G.graph.update(self.graph)
         for node, node_attr in self._node.items():
@@ -304,17 +833,19 @@ class DiGraph(object):
         """
         Returns
         1. deepcopy of graph, with each node switched to its index.
-        2. index of node
+        2. index of node, a copy of `index_of_node`
         3. node of index
+
+        The node index is compacted first, so indices are 0..n-1 in node
+        order.
         """
+        self.compact_node_index()
+        index_of_node = dict(self.index_of_node)
+        node_of_index = dict(enumerate(self.node_of_index))
         G = self.__class__()
         G.graph.update(self.graph)
-        index_of_node = dict()
-        node_of_index = dict()
-        for index, (node, node_attr) in enumerate(self._node.items()):
+        for index, node_attr in enumerate(self._node.values()):
             G.add_node(index, **node_attr.copy())
-            index_of_node[node] = index
-            node_of_index[index] = node
         for u, nbrs in self._adj.items():
             for v, edge_data in nbrs.items():
                 G.add_edge(index_of_node[u], index_of_node[v], **edge_data.copy()) 
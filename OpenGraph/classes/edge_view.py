@@ -0,0 +1,95 @@
+__all__ = [
+    "OutEdgeView",
+    "EdgeView"
+]
+
+
+class OutEdgeView(object):
+    """
+    Lazy view of the edges of a directed graph.
+
+    Nothing is materialized: iterating the view walks ``G._adj`` each time,
+    so the view always reflects the current graph. Copy it with
+    ``list(G.edges)`` before mutating the graph inside the loop.
+
+    By default each edge is yielded as a ``(u, v, edge_attr)`` triple.
+    Calling the view returns a projection of it:
+
+    >>> G.edges(data=False)              # (u, v)
+    >>> G.edges(data=True)               # (u, v, edge_attr)
+    >>> G.edges(weight='weight')         # (u, v, edge_attr.get('weight', 1))
+
+    Parameters
+    ----------
+    G : graph
+
+    data : boolean or String
+        True to yield the attribute dict, False to yield 2-tuples,
+        or the key of one attribute to yield its value.
+
+    default : object
+        Value yielded when `data` is a key missing from an edge.
+    """
+    __slots__ = ('_graph', '_data', '_default')
+
+    def __init__(self, G, data=True, default=1):
+        self._graph = G
+        self._data = data
+        self._default = default
+
+    def __call__(self, data=True, weight=None, default=1):
+        if weight is not None:
+            data = weight
+        return self.__class__(self._graph, data=data, default=default)
+
+    def __len__(self):
+        return self._graph.number_of_edges()
+
+    def __iter__(self):
+        project = self._projection()
+        for u, nbrs in self._graph._adj.items():
+            for v, d in nbrs.items():
+                yield project(u, v, d)
+
+    def __contains__(self, edge):
+        try:
+            u, v = edge[:2]
+            d = self._graph._adj[u][v]
+        except (KeyError, TypeError, ValueError):
+            return False
+        if len(edge) == 2:
+            return True
+        return self._projection()(u, v, d) == tuple(edge)
+
+    def __repr__(self):
+        return "{}({})".format(self.__class__.__name__, list(self))
+
+    def _projection(self):
+        data, default = self._data, self._default
+        if data is True:
+            return lambda u, v, d: (u, v, d)
+        if data is False:
+            return lambda u, v, d: (u, v)
+        return lambda u, v, d: (u, v, d.get(data, default))
+
+
+class EdgeView(OutEdgeView):
+    """
+    Lazy view of the edges of an undirected graph.
+
+    Each edge is yielded once, from the first of its endpoints in node
+    order. Only the set of already walked nodes is kept, so iterating
+    costs O(n) extra memory instead of one entry per edge.
+
+    See `OutEdgeView` for the projections.
+    """
+    __slots__ = ()
+
+    def __iter__(self):
+        project = self._projection()
+        seen = set()
+        for u, nbrs in self._graph._adj.items():
+            for v, d in nbrs.items():
+                if v not in seen:
+                    yield project(u, v, d)
+            seen.add(u)
@@ -0,0 +1,55 @@
+from collections import deque, namedtuple
+
+__all__ = [
+    "JournalEntry"
+]
+
+JournalEntry = namedtuple('JournalEntry', ['version', 'op', 'u', 'v', 'attr'])
+JournalEntry.__doc__ = """
+One change of a graph, as recorded by ``G.enable_journal()``.
+
+version : int
+    value of ``G.version`` right after the change.
+
+op : String
+    'add_node', 'remove_node', 'add_edge' or 'remove_edge'. Updating the
+    attributes of an existing node or edge is also an 'add_node' or
+    'add_edge'.
+
+u, v : node
+    the node, or the endpoints of the edge. v is None for node changes.
+
+attr : dict
+    attributes of the node or edge after an add, before a remove.
+"""
+
+
+class Journal(object):
+    """
+    Bounded record of the changes of a graph, see ``Graph.enable_journal``.
+    """
+    __slots__ = ('entries', 'start')
+
+    def __init__(self, version, maxlen=None):
+        self.entries = deque(maxlen=maxlen)
+        # Changes after this version are all recorded, as long as none
+        # was dropped from a full deque
+        self.start = version
+
+    def record(self, version, op, u, v=None, attr=None):
+        entries = self.entries
+        if entries.maxlen is not None and len(entries) == entries.maxlen:
+            self.start = entries[0].version
+        entries.append(JournalEntry(version, op, u, v, attr))
+
+    def since(self, version):
+        if version < self.start:
+            raise ValueError("The journal no longer holds the changes since version {}, "
+                             "it starts at version {}.".format(version, self.start))
+        delta = []
+        for entry in reversed(self.entries):
+            if entry.version <= version:
+                break
+            delta.append(entry)
+        delta.reverse()
+        return delta
@@ -0,0 +1,140 @@
+import pickle
+import sys
+import threading
+
+import numpy as np
+
+__all__ = [
+    "SharedGraph"
+]
+
+
+class SharedGraph(object):
+    """
+    Handle of a graph placed in shared memory by ``G.to_shared_memory()``.
+
+    The CSR arrays and the node labels live in one
+    ``multiprocessing.shared_memory`` segment. The handle itself only
+    holds the segment name and the array layout, so it pickles to a few
+    hundred bytes: pass it to process-pool workers instead of the graph,
+    and call `attach` in each worker to get a read-only CSRGraph whose
+    arrays are views on the segment. The edges are then stored once
+    however many workers read them. Node labels other than 0..n-1 are
+    unpickled into each attaching process.
+
+    The process that created the segment must free it with `unlink`, or
+    use the handle as a context manager::
+
+        with G.to_shared_memory() as handle:
+            results = pool.map(work, [handle] * workers)
+    """
+
+    def __init__(self, name, header):
+        self.name = name
+        self._header = header
+        self._shm = None
+        self._graph = None
+        self._owner = False
+
+    @classmethod
+    def create(cls, G, weight='weight'):
+        """
+        Copies the CSR form of `G` into a new shared memory segment and
+        returns its handle, see ``Graph.to_shared_memory``.
+        """
+        from multiprocessing import shared_memory
+        from OpenGraph.readwrite.binary import _csr_layout, _aligned
+        # The segment is only read by processes of the same program
+        header, arrays = _csr_layout(G, weight, allow_pickle=True)
+        layout = header['arrays']
+        if header['labels'] is not None:  # keep the handle small
+            labels = pickle.dumps(header['labels'], protocol=pickle.HIGHEST_PROTOCOL)
+            arrays['labels'] = np.frombuffer(labels, dtype=np.uint8)
+            layout['labels'] = ('|u1', (len(labels),), header['size'])
+            header['size'] = _aligned(header['size'] + len(labels))
+            header['labels'] = None
+
+        shm = shared_memory.SharedMemory(create=True, size=max(header['size'], 1))
+        for name, array in arrays.items():
+            dtype, shape, offset = layout[name]
+            np.ndarray(shape, dtype=dtype, buffer=shm.buf, offset=offset)[...] = array
+        handle = cls(shm.name, header)
+        handle._shm = shm
+        handle._owner = True
+        return handle
+
+    def __getstate__(self):
+        return {'name': self.name, 'header': self._header}
+
+    def __setstate__(self, state):
+        self.__init__(state['name'], state['header'])
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.unlink()
+
+    def attach(self):
+        """
+        Returns the shared graph as a read-only CSRGraph, without copying
+        the arrays. Attaching again in the same process returns the same
+        graph.
+        """
+        if self._graph is not None:
+            return self._graph
+        if self._shm is None:
+            self._shm = _open_shared_memory(self.name)
+        header = dict(self._header)
+        arrays = dict()
+        for name, (dtype, shape, offset) in header['arrays'].items():
+            array = np.ndarray(shape, dtype=dtype, buffer=self._shm.buf, offset=offset)
+            array.flags.writeable = False
+            arrays[name] = array
+        if 'labels' in arrays:
+            header['labels'] = pickle.loads(arrays.pop('labels'))
+
+        from OpenGraph.readwrite.binary import _csr_from_layout
+        G = _csr_from_layout(header, arrays, allow_pickle=True)
+        G._shared_memory = self._shm
+        self._graph = G
+        return G
+
+    def unlink(self):
+        """
+        Frees the segment, called by the process that created it once no
+        worker needs the graph anymore. Graphs already attached stay
+        readable, later `attach` calls in other processes fail.
+        """
+        if self._owner:
+            self._owner = False
+            self._shm.unlink()
+            self._graph = None
+
+
+def _open_shared_memory(name):
+    # An attaching process must not free the segment when it exits, only
+    # the creator does, see SharedGraph.unlink
+    from multiprocessing import shared_memory
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    # Older versions always register the segment with the resource
+    # tracker, which forked workers share with the creator, so skip the
+    # registration of this segment only. The lock keeps concurrent attaches
+    # from restoring each other's patch.
+    from multiprocessing import resource_tracker
+    with _tracker_lock:
+        register = resource_tracker.register
+
+        def register_others(resource, rtype):
+            if rtype != 'shared_memory' or resource.lstrip('/') != name.lstrip('/'):
+                register(resource, rtype)
+
+        resource_tracker.register = register_others
+        try:
+            return shared_memory.SharedMemory(name=name)
+        finally:
+            resource_tracker.register = register
+
+
+_tracker_lock = threading.Lock()
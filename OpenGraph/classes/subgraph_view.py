@@ -0,0 +1,327 @@
+from .edge_view import EdgeView, OutEdgeView
+
+__all__ = [
+    "SubgraphView"
+]
+
+
+class SubgraphView(object):
+    """
+    Read-only view of the subgraph of `G` induced by `nodes`.
+
+    Nothing is copied: node and edge attribute dicts are those of `G`, and
+    each adjacency row is filtered through the node set when it is read.
+    Building the view costs O(len(nodes)) when `G` already keeps its node
+    index (a CSRGraph always does), else one pass over the nodes of `G`,
+    and reading a node costs O(degree) in `G`, so per-component or
+    per-ego analysis costs about as much as the subgraph. Changes to `G`
+    show through; use `copy()` for an independent graph.
+
+    It exposes the read API of Graph/DiGraph (``G[u][v]``, ``G.adj``,
+    ``G.edges``, ``G.degree()``, ...), so algorithms accept it directly.
+    Nodes and neighbors come in the order of `G`, like `nodes_subgraph`.
+
+    Parameters
+    ----------
+    G : Graph, DiGraph, CSRGraph or SubgraphView
+        nodes of a CSRGraph have empty attribute dicts in the view.
+
+    nodes : iterable
+        nodes of the subgraph, nodes not in `G` are ignored.
+    """
+
+    def __init__(self, G, nodes):
+        self._graph = G
+        self.graph = G.graph
+        wanted = set(nodes)
+        # The node index of a Graph/DiGraph is only used if already built,
+        # building it would cost O(len(G)) and be kept up to date by G
+        index_of_node = G._node_index if hasattr(G, '_node_index') else \
+            getattr(G, 'index_of_node', None)
+        if index_of_node is not None:  # ids follow the order of G
+            nodes = sorted((node for node in wanted if node in G), key=index_of_node.__getitem__)
+        else:
+            nodes = [node for node in G if node in wanted]
+        if hasattr(G, '_node'):
+            # Keeps the attribute dicts of G
+            G_node = G._node
+            self._node = {node: G_node[node] for node in nodes}
+            adj = G._adj
+            pred = G._pred if G.is_directed() else None
+        else:  # CSRGraph, without node attributes
+            self._node = {node: {} for node in nodes}
+            adj, pred = G.adj, G.pred
+        # Position of each node, to order the rows like nodes_subgraph
+        position = {node: i for i, node in enumerate(self._node)}
+        root = G
+        while isinstance(root, SubgraphView):
+            root = root._graph
+        if G.is_directed():
+            self._adj = _FilterAdjacency(adj, position, 'succ', root)
+            self._pred = _FilterAdjacency(pred, position, 'pred', root)
+        else:
+            self._adj = _FilterAdjacency(adj, position, 'undirected', root)
+
+    def __iter__(self):
+        return iter(self._node)
+
+    def __len__(self):
+        return len(self._node)
+
+    def __contains__(self, node):
+        try:
+            return node in self._node
+        except TypeError:
+            return False
+
+    def __getitem__(self, node):
+        return self._adj[node]
+
+    @property
+    def adj(self):
+        return self._adj
+
+    @property
+    def pred(self):
+        return self._pred
+
+    @property
+    def nodes(self):
+        return self._node
+
+    @property
+    def edges(self):
+        return OutEdgeView(self) if self.is_directed() else EdgeView(self)
+
+    def _degree_of(self, row, node, weight):
+        if weight is None:
+            d = len(row)
+            return d + 1 if node in row and not self.is_directed() else d
+        d = 0
+        for v, edge_attr in row.items():
+            w = edge_attr.get(weight, 1)
+            d += w + w if v == node and not self.is_directed() else w
+        return d
+
+    def degree(self, weight='weight', node=None):
+        """
+        Returns the degree of each node, or of one node if `node` is given,
+        counted from the filtered rows.
+        """
+        if node is not None:
+            d = self._degree_of(self._adj[node], node, weight)
+            if self.is_directed():
+                d += self._degree_of(self._pred[node], node, weight)
+            return d
+        return {node: self.degree(weight=weight, node=node) for node in self._node}
+
+    def out_degree(self, weight='weight'):
+        return {node: self._degree_of(row, node, weight) for node, row in self._adj.items()}
+
+    def in_degree(self, weight='weight'):
+        return {node: self._degree_of(row, node, weight) for node, row in self._pred.items()}
+
+    def size(self, weight=None):
+        """
+        Returns the number of edges or total of all edge weights.
+
+        Parameters
+        -----------
+        weight : String or None
+            key for edge weight.
+        """
+        if self.is_directed():
+            s = sum(self.out_degree(weight=weight).values())
+            return int(s) if weight is None else s
+        s = sum(self.degree(weight=weight).values())
+        return s // 2 if weight is None else s / 2
+
+    def neighbors(self, node):
+        try:
+            return iter(self._adj[node])
+        except KeyError:
+            print("No node {}".format(node))
+
+    successors = neighbors
+
+    def predecessors(self, node):
+        try:
+            return iter(self._pred[node])
+        except KeyError:
+            print("No node {}".format(node))
+
+    def all_neighbors(self, node):
+        if not self.is_directed():
+            return self.neighbors(node)
+        neighbors = dict.fromkeys(self._adj[node])
+        neighbors.update(dict.fromkeys(self._pred[node]))
+        return iter(neighbors)
+
+    def has_node(self, node):
+        return node in self
+
+    def has_edge(self, u, v):
+        try:
+            return v in self._adj[u]
+        except KeyError:
+            return False
+
+    def number_of_nodes(self):
+        return len(self._node)
+
+    def number_of_edges(self):
+        return int(self.size())
+
+    def is_directed(self):
+        return self._graph.is_directed()
+
+    def copy(self):
+        """
+        Returns a mutable graph of the same class as the viewed graph,
+        holding copies of the nodes and edges of the view.
+        """
+        G = self._graph
+        while isinstance(G, SubgraphView):
+            G = G._graph
+        if hasattr(G, '_node'):
+            H = G.__class__()
+        else:  # the mutable form of a CSRGraph
+            from .graph import Graph
+            from .directed_graph import DiGraph
+            H = DiGraph() if G.is_directed() else Graph()
+        H.graph.update(self.graph)
+        for node, node_attr in self._node.items():
+            H.add_node(node, **node_attr.copy())
+        for u, nbrs in self._adj.items():
+            for v, edge_data in nbrs.items():
+                H.add_edge(u, v, **edge_data.copy())
+        return H
+
+    def nodes_subgraph(self, from_nodes: list):
+        return SubgraphView(self, from_nodes)
+
+    def ego_subgraph(self, center):
+        neighbors_of_center = list(self.all_neighbors(center))
+        neighbors_of_center.append(center)
+        return self.nodes_subgraph(from_nodes=neighbors_of_center)
+
+    def to_index_node_graph(self):
+        return self.copy().to_index_node_graph()
+
+
+class _FilterAdjacency(object):
+    """
+    Read-only mapping node -> filtered row, over the nodes of a view.
+
+    The sorted neighbor order of each row is computed on first read and
+    kept until the version of the underlying graph changes.
+    """
+    __slots__ = ('_adj', '_position', '_kind', '_root', '_version', '_orders')
+
+    def __init__(self, adj, position, kind, root):
+        self._adj = adj
+        self._position = position
+        self._kind = kind
+        self._root = root
+        self._version = getattr(root, '_version', None)
+        self._orders = dict()
+
+    def __getitem__(self, node):
+        if node not in self._position:
+            raise KeyError(node)
+        version = getattr(self._root, '_version', None)
+        if version != self._version:  # G changed, the orders may be stale
+            self._orders = dict()
+            self._version = version
+        return _FilterRow(self._adj[node], self._position, node, self._kind, self._orders)
+
+    def __iter__(self):
+        return iter(self._position)
+
+    def __len__(self):
+        return len(self._position)
+
+    def __contains__(self, node):
+        return node in self._position
+
+    def get(self, node, default=None):
+        return self[node] if node in self._position else default
+
+    def keys(self):
+        return iter(self)
+
+    def items(self):
+        for node in self._position:
+            yield node, self[node]
+
+    def values(self):
+        for node, row in self.items():
+            yield row
+
+
+class _FilterRow(object):
+    """
+    Read-only mapping neighbor -> edge attribute dict, keeping only the
+    neighbors inside the view. Counting them scans the smaller of the row
+    and the node set.
+
+    Neighbors come in the order of the graph `nodes_subgraph` builds by
+    adding the edges node after node: successors in row order,
+    predecessors in node order, and undirected neighbors placed before
+    the node in node order, then the others in row order. Algorithms
+    breaking ties by visiting order thus give the same results on both.
+    """
+    __slots__ = ('_row', '_position', '_node', '_kind', '_orders')
+
+    def __init__(self, row, position, node, kind, orders):
+        self._row = row
+        self._position = position
+        self._node = node
+        self._kind = kind
+        self._orders = orders
+
+    def __iter__(self):
+        position = self._position
+        if self._kind == 'succ':
+            return iter([v for v in self._row if v in position])
+        order = self._orders.get(self._node)
+        if order is None:
+            inside = [v for v in self._row if v in position]
+            if self._kind == 'pred':
+                order = sorted(inside, key=position.__getitem__)
+            else:
+                here = position[self._node]
+                order = sorted((v for v in inside if position[v] < here), key=position.__getitem__)
+                order += [v for v in inside if position[v] >= here]
+            self._orders[self._node] = order
+        return iter(order)
+
+    def __len__(self):
+        row, position = self._row, self._position
+        if len(row) <= len(position):
+            return sum(1 for v in row if v in position)
+        return sum(1 for v in position if v in row)
+
+    def __contains__(self, node):
+        return node in self._position and node in self._row
+
+    def __getitem__(self, node):
+        if node not in self._position:
+            raise KeyError(node)
+        return self._row[node]
+
+    def get(self, node, default=None):
+        return self._row.get(node, default) if node in self._position else default
+
+    def keys(self):
+        return iter(self)
+
+    def items(self):
+        row = self._row
+        for v in self:
+            yield v, row[v]
+
+    def values(self):
+        row = self._row
+        for v in self:
+            yield row[v]
@@ -49,22 +49,15 @@ def get_graph_youtube():
     http://socialnetworks.mpi-sws.mpg.de/data/youtube-links.txt.gz
     """
     from urllib import request
-    import gzip
     url = 'http://socialnetworks.mpi-sws.mpg.de/data/youtube-links.txt.gz'
     zipped_data_path = './samples/youtube-links.txt.gz'
-    unzipped_data_path = './samples/youtube-links.txt'
 
     # Download .gz file
     request.urlretrieve(url, zipped_data_path)
 
-    # Unzip
-    unzipped_data = gzip.GzipFile(zipped_data_path)
-    open(unzipped_data_path, 'wb+').write(unzipped_data.read())
-    unzipped_data.close()
-
-    # Returns graph
+    # Returns graph, read straight from the .gz file
     G = og.Graph()
-    G.add_edges_from_file(file=unzipped_data_path)
+    G.add_edges_from_file(file=zipped_data_path)
     return G
 
 
@@ -75,22 +68,15 @@ def get_graph_flickr():
     http://socialnetworks.mpi-sws.mpg.de/data/flickr-links.txt.gz
     """
     from urllib import request
-    import gzip
     url = 'http://socialnetworks.mpi-sws.mpg.de/data/flickr-links.txt.gz'
     zipped_data_path = './samples/flickr-links.txt.gz'
-    unzipped_data_path = './samples/flickr-links.txt'
 
     # Download .gz file
     request.urlretrieve(url, zipped_data_path)
 
-    # Unzip
-    unzipped_data = gzip.GzipFile(zipped_data_path)
-    open(unzipped_data_path, 'wb+').write(unzipped_data.read())
-    unzipped_data.close()
-
-    # Returns graph
+    # Returns graph, read straight from the .gz file
     G = og.Graph()
-    G.add_edges_from_file(file=unzipped_data_path)
+    G.add_edges_from_file(file=zipped_data_path)
     return G
 
 
@@ -1,9 +1,57 @@
-from OpenGraph.functions.components import *
-from OpenGraph.functions.community import *
-from OpenGraph.functions.structural_holes import *
-from OpenGraph.functions.graph_embedding import *
-from OpenGraph.functions.drawing import *
+from OpenGraph.utils.lazy_import import lazy_import
 
-from OpenGraph.functions.not_sorted import *
-# import OpenGraph.functions.components
-# import OpenGraph.functions.community
+# Each subpackage is imported on first access of one of its functions,
+# e.g. og.functions.pagerank only imports not_sorted.
+__getattr__, __dir__, __all__ = lazy_import(
+    __name__,
+    submodules=['components', 'community', 'structural_holes', 'graph_embedding',
+                'drawing', 'not_sorted', 'partitioning'],
+    attributes={
+        # components
+        'is_connected': '.components',
+        'number_connected_components': '.components',
+        'connected_components': '.components',
+        'connected_component_of_node': '.components',
+        'is_biconnected': '.components',
+        'biconnected_components': '.components',
+        'generator_biconnected_components_nodes': '.components',
+        'generator_biconnected_components_edges': '.components',
+        'generator_articulation_points': '.components',
+        # community
+        'greedy_modularity_communities': '.community',
+        'modularity': '.community',
+        # structural_holes
+        'get_structural_holes_HIS': '.structural_holes',
+        'get_structural_holes_MaxD': '.structural_holes',
+        'common_greedy': '.structural_holes',
+        'AP_Greedy': '.structural_holes',
+        'get_structural_holes_HAM': '.structural_holes',
+        'effective_size': '.structural_holes',
+        'efficiency': '.structural_holes',
+        'constraint': '.structural_holes',
+        # graph_embedding
+        'node2vec_multi_thread': '.graph_embedding',
+        'node2vec': '.graph_embedding',
+        'LINE': '.graph_embedding',
+        # drawing
+        'random_position': '.drawing',
+        'circular_position': '.drawing',
+        'shell_position': '.drawing',
+        'rescale_position': '.drawing',
+        # not_sorted
+        'pagerank': '.not_sorted',
+        # partitioning
+        'partition': '.partitioning',
+        'Partition': '.partitioning',
+        # modules of the subpackages, attributes of this package before
+        'connected': '.components',
+        'biconnected': '.components',
+        'modularity_max_detection': '.community',
+        'HIS': '.structural_holes',
+        'MaxD': '.structural_holes',
+        'HAM': '.structural_holes',
+        'evaluation': '.structural_holes',
+        'line': '.graph_embedding',
+        'positioning': '.drawing',
+    })
+del lazy_import
@@ -46,11 +46,11 @@ def modularity(G, communities, weight='weight'):
     directed = G.is_directed()
     m = G.size(weight=weight)
     if directed:
-        out_degree = dict(G.out_degree(weight=weight))
-        in_degree = dict(G.in_degree(weight=weight))
+        out_degree = G.out_degree(weight=weight)
+        in_degree = G.in_degree(weight=weight)
         norm = 1 / m
     else:
-        out_degree = dict(G.degree(weight=weight))
+        out_degree = G.degree(weight=weight)
         in_degree = out_degree
         norm = 1 / (2 * m)
 
@@ -1,11 +1,13 @@
 from OpenGraph.functions.community.modularity import modularity
 from OpenGraph.utils.mapped_queue import MappedQueue
+from OpenGraph.utils.result_cache import cached_by_version
 
 __all__ = [
     "greedy_modularity_communities"
 ]
 
 
+@cached_by_version
 def greedy_modularity_communities(G, weight=None):
     """
     Find communities in graph using Clauset-Newman-Moore greedy modularity
@@ -35,7 +37,7 @@ def greedy_modularity_communities(G, weight=None):
 
     # Count nodes and edges
     N = len(G.nodes)
-    m = sum([d.get('weight', 1) for u, v, d in G.edges])
+    m = G.size(weight='weight')
     q0 = 1.0 / (2.0*m)
 
     # Map node labels to contiguous integers
@@ -1,4 +1,6 @@
 from OpenGraph.utils.decorators import only_implemented_for_UnDirected_graph
+from OpenGraph.utils.result_cache import cached_by_version
+from OpenGraph.classes.csr_graph import CSRGraph
 
 __all__ = [
     "is_connected",
@@ -22,14 +24,23 @@ def number_connected_components(G):
 
 
 @only_implemented_for_UnDirected_graph
+@cached_by_version
 def connected_components(G):
     # Return all components ordered by number of nodes included
+    return _connected_components(G)
+
+
+def _connected_components(G):
+    # Uncached, for the throwaway graphs of loops such as AP_Greedy's
     all_components = sorted(_generator_connected_components(G), key=len)
     return all_components
 
 
 @only_implemented_for_UnDirected_graph
 def _generator_connected_components(G):
+    if isinstance(G, CSRGraph):
+        yield from _csr_components(G)
+        return
     seen = set()
     for v in G:
         if v not in seen:
@@ -46,6 +57,9 @@ def _plain_bfs(G, source):
     """
     A fast BFS node generator
     """
+    if isinstance(G, CSRGraph):
+        yield from _csr_bfs(G, source)
+        return
     G_adj = G.adj
     seen = set()
     nextlevel = {source}
@@ -57,3 +71,60 @@ def _plain_bfs(G, source):
                 yield v
                 seen.add(v)
                 nextlevel.update(G_adj[v])
+
+
+def _csr_components(G):
+    """
+    Components of a CSRGraph in order of their first node, labeled with
+    array operations over all edges at once, so that the number of
+    components does not multiply the cost.
+    """
+    import numpy as np
+    if len(G) == 0:
+        return
+    labels = G.nodes
+    root = _csr_component_roots(G)
+    order = np.argsort(root, kind='stable')
+    starts = np.flatnonzero(np.diff(root[order], prepend=-1))
+    for block in np.split(order, starts[1:]):
+        yield {labels[i] for i in block.tolist()}
+
+
+def _csr_component_roots(G):
+    # Smallest row index of the component of each row: hook the root of
+    # the larger label under the smaller across every edge, then follow
+    # the pointers to the roots, until no edge joins two trees
+    import numpy as np
+    parent = np.arange(len(G), dtype=np.int64)
+    rows, cols = G._row_ids(G.indptr).astype(np.int64), G.indices.astype(np.int64)
+    while True:
+        root_u, root_v = parent[rows], parent[cols]
+        joined = root_u != root_v
+        if not joined.any():
+            return parent
+        root_u, root_v = root_u[joined], root_v[joined]
+        np.minimum.at(parent, np.maximum(root_u, root_v), np.minimum(root_u, root_v))
+        while True:
+            grandparent = parent[parent]
+            if np.array_equal(grandparent, parent):
+                break
+            parent = grandparent
+
+
+def _csr_bfs(G, source):
+    """
+    Level-synchronous BFS over the arrays of a CSRGraph, each level is
+    expanded with one vectorized gather.
+    """
+    import numpy as np
+    seen = np.zeros(len(G), dtype=bool)
+    thislevel = np.array([G.index_of_node[source]], dtype=np.int64)
+    seen[thislevel] = True
+    labels = G.nodes
+    while len(thislevel):
+        for i in thislevel.tolist():
+            yield labels[i]
+        nbrs, _ = G.gather_neighbors(thislevel)
+        nextlevel = np.unique(nbrs[~seen[nbrs]])
+        seen[nextlevel] = True
+        thislevel = nextlevel
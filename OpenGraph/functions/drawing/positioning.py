@@ -75,7 +75,7 @@ def circular_position(G, center=None, scale=1):
     if len(G) == 0:
         pos = {}
     elif len(G) == 1:
-        pos = {G.nodes[0]: center}
+        pos = {next(iter(G)): center}
     else:
         theta = np.linspace(0, 1, len(G), endpoint=False) * 2 * np.pi
         theta = theta.astype(np.float32)
@@ -122,7 +122,7 @@ def shell_position(G, nlist=None, scale=1, center=None):
     if len(G) == 0:
         return {}
     if len(G) == 1:
-        return {G.nodes[0]: center}
+        return {next(iter(G)): center}
 
     if nlist is None:
         # draw the whole graph in one shell
@@ -1,2 +1,11 @@
 from .node2vec import *
-from .line import LINE
\ No newline at end of file
+
+from OpenGraph.utils.lazy_import import lazy_import
+
+# LINE needs tensorflow, imported on first access
+__getattr__, __dir__, _lazy_all = lazy_import(__name__, submodules=['line'], attributes={
+    'LINE': '.line',
+})
+del lazy_import
+
+__all__ = ['node2vec_multi_thread', 'node2vec'] + _lazy_all
@@ -51,6 +51,8 @@ def deepwalk(G, dimensions=128, walk_length=80, num_walks=10, **skip_gram_params
 
 
 def simulate_walks(G, walk_length, num_walks):
+    if isinstance(G, og.CSRGraph):
+        return _simulate_walks_csr(G, walk_length, num_walks)
     walks = []
     nodes = list(G.nodes)
     print('Walk iteration:')
@@ -63,6 +65,36 @@ def simulate_walks(G, walk_length, num_walks):
 
     return walks
 
+def _simulate_walks_csr(G, walk_length, num_walks):
+    """
+    Simulates the walks of all start nodes at once, each step is one
+    vectorized draw over the CSR arrays. A walk stops at a node without
+    neighbors, as in `_deepwalk_walk`.
+    """
+    import numpy as np
+    indptr, indices = G.indptr, G.indices
+    labels = G.nodes
+    walks = []
+    print('Walk iteration:')
+    for walk_iter in tqdm(range(num_walks)):
+        cur = np.random.permutation(len(G))
+        steps = [cur]
+        alive = np.ones(len(cur), dtype=bool)
+        for step in range(walk_length - 1):
+            safe = np.where(alive, cur, 0)
+            start = indptr[safe]
+            degree = indptr[safe + 1] - start
+            alive &= degree > 0
+            if not alive.any():
+                break
+            pick = start + (np.random.random(len(cur)) * degree).astype(np.int64)
+            cur = np.where(alive, indices[np.where(alive, pick, 0)], -1)
+            steps.append(cur)
+        for walk in np.stack(steps, axis=1).tolist():
+            walks.append([labels[i] for i in walk if i >= 0])
+    return walks
+
+
 def _deepwalk_walk(G, walk_length, start_node):
     '''
     Simulate a random walk starting from start node.
@@ -106,9 +106,8 @@ class LINE:
         node_degree = np.zeros(numNodes)  # out degree
         node2idx = self.node2idx
 
-        for edge in self.graph.edges:
-            node_degree[node2idx[edge[0]]
-                        ] += self.graph[edge[0]][edge[1]].get('weight', 1.0)
+        for u, v, w in self.graph.edges(weight='weight', default=1.0):
+            node_degree[node2idx[u]] += w
 
         total_sum = sum([math.pow(node_degree[i], power)
                          for i in range(numNodes)])
@@ -119,16 +118,16 @@ class LINE:
 
         # create sampling table for edge
         numEdges = self.graph.number_of_edges()
-        total_sum = sum([self.graph[edge[0]][edge[1]].get('weight', 1.0)
-                         for edge in self.graph.edges])
-        norm_prob = [self.graph[edge[0]][edge[1]].get('weight', 1.0) *
-                     numEdges / total_sum for edge in self.graph.edges]
+        edge_weights = self.graph.edges(weight='weight', default=1.0)
+        total_sum = sum(w for u, v, w in edge_weights)
+        norm_prob = [w * numEdges / total_sum for u, v, w in edge_weights]
 
         self.edge_accept, self.edge_alias = create_alias_table(norm_prob)
 
     def batch_iter(self, node2idx):
 
-        edges = [(node2idx[x[0]], node2idx[x[1]]) for x in self.graph.edges]
+        edges = [(node2idx[u], node2idx[v])
+                 for u, v in self.graph.edges(data=False)]
 
         data_size = self.graph.number_of_edges()
         shuffle_indices = np.random.permutation(np.arange(data_size))
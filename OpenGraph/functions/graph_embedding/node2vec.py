@@ -2,10 +2,8 @@ import sys
 sys.path.append('../../../')
 import OpenGraph as og
 
-from .node2vec_multi_thread import Node2Vec
 import random
 import numpy as np
-from tqdm import tqdm
 
 
 __all__ = [
@@ -53,6 +51,7 @@ def node2vec_multi_thread(G, dimensions=128, walk_length=80, num_walks=10, p=1.0
     """
     G_index, index_of_node, node_of_index = G.to_index_node_graph()
 
+    from .node2vec_multi_thread import Node2Vec
     node2vec = Node2Vec(graph=G_index, dimensions=dimensions,
                         walk_length=walk_length, num_walks=num_walks, workers=workers)
 
@@ -145,6 +144,7 @@ def simulate_walks(G, walk_length, num_walks, p, q, weight_key=None):
         G, p, q, weight_key)
     walks = []
     nodes = list(G.nodes)
+    from tqdm import tqdm
     print('Walk iteration:')
     for walk_iter in tqdm(range(num_walks)):
         random.shuffle(nodes)
@@ -191,19 +191,25 @@ def _preprocess_transition_probs(G, p, q, weight_key=None):
 def _get_alias_edge(G, src, dst, p, q, weight_key=None):
     unnormalized_probs = []
 
+    dst_nbrs = sorted(G.neighbors(dst))
+    if isinstance(G, og.CSRGraph):
+        # One batch query instead of a row search per neighbor
+        connected = G.has_edges(dst_nbrs, [src] * len(dst_nbrs)).tolist()
+    else:  # a dict lookup per neighbor is cheaper than building arrays
+        connected = [G.has_edge(dst_nbr, src) for dst_nbr in dst_nbrs]
     if weight_key is None:
-        for dst_nbr in sorted(G.neighbors(dst)):
+        for dst_nbr, is_connected in zip(dst_nbrs, connected):
             if dst_nbr == src:
                 unnormalized_probs.append(1.0/p)
-            elif G.has_edge(dst_nbr, src):
+            elif is_connected:
                 unnormalized_probs.append(1.0)
             else:
                 unnormalized_probs.append(1.0/q)
     else:
-        for dst_nbr in sorted(G.neighbors(dst)):
+        for dst_nbr, is_connected in zip(dst_nbrs, connected):
             if dst_nbr == src:
                 unnormalized_probs.append(G[dst][dst_nbr][weight_key]/p)
-            elif G.has_edge(dst_nbr, src):
+            elif is_connected:
                 unnormalized_probs.append(G[dst][dst_nbr][weight_key])
             else:
                 unnormalized_probs.append(G[dst][dst_nbr][weight_key]/q)
@@ -218,7 +224,7 @@ def _get_alias_edge(G, src, dst, p, q, weight_key=None):
 def _alias_setup(probs):
     K = len(probs)
     q = np.zeros(K)
-    J = np.zeros(K, dtype=np.int)
+    J = np.zeros(K, dtype=int)
 
     smaller = []
     larger = []
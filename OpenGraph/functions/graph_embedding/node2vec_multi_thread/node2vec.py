@@ -6,7 +6,7 @@ import gensim
 from joblib import Parallel, delayed
 from tqdm import tqdm
 
-from .parallel import parallel_generate_walks
+from .parallel import parallel_generate_walks, parallel_generate_walks_shared
 
 
 class Node2Vec:
@@ -62,8 +62,13 @@ class Node2Vec:
             self.temp_folder = temp_folder
             self.require = "sharedmem"
 
-        self._precompute_probabilities()
-        self.walks = self._generate_walks()
+        if self.workers > 1 and self.require is None:
+            # Workers share one copy of the graph and compute the transition
+            # probabilities on the fly, instead of each receiving d_graph
+            self.walks = self._generate_walks_shared()
+        else:
+            self._precompute_probabilities()
+            self.walks = self._generate_walks()
 
     def _precompute_probabilities(self):
         """
@@ -156,6 +161,40 @@ class Node2Vec:
 
         return walks
 
+    def _generate_walks_shared(self) -> list:
+        """
+        Generates the random walks in worker processes that attach to the graph placed in
+        shared memory, so memory does not grow with the number of workers.
+        :return: List of walks. Each walk is a list of nodes.
+        """
+        from OpenGraph.classes import SharedGraph
+
+        flatten = lambda l: [item for sublist in l for item in sublist]
+
+        # Split num_walks for each worker
+        num_walks_lists = np.array_split(range(self.num_walks), self.workers)
+
+        with SharedGraph.create(self.graph, weight=self.weight_key) as shared_graph:
+            walk_results = Parallel(n_jobs=self.workers)(
+                delayed(parallel_generate_walks_shared)(shared_graph,
+                                                        self.walk_length,
+                                                        len(num_walks),
+                                                        idx,
+                                                        self.p,
+                                                        self.q,
+                                                        self.sampling_strategy,
+                                                        self.NUM_WALKS_KEY,
+                                                        self.WALK_LENGTH_KEY,
+                                                        self.P_KEY,
+                                                        self.Q_KEY,
+                                                        self.quiet) for
+                idx, num_walks
+                in enumerate(num_walks_lists, 1))
+
+        walks = flatten(walk_results)
+
+        return walks
+
     def fit(self, **skip_gram_params) -> gensim.models.Word2Vec:
         """
         Creates the embeddings using gensim's Word2Vec.
@@ -72,3 +72,92 @@ def parallel_generate_walks(d_graph: dict, global_walk_length: int, num_walks: i
         pbar.close()
 
     return walks
+
+
+def parallel_generate_walks_shared(shared_graph, global_walk_length: int, num_walks: int, cpu_num: int,
+                                   p: float = 1, q: float = 1, sampling_strategy: dict = None,
+                                   num_walks_key: str = None, walk_length_key: str = None,
+                                   p_key: str = None, q_key: str = None, quiet: bool = False) -> list:
+    """
+    Generates the random walks like `parallel_generate_walks`, reading the graph from a
+    shared memory handle (OpenGraph.SharedGraph) instead of a precomputed d_graph.
+
+    The transition probabilities are computed at each step from the CSR rows of the
+    current and previous nodes, so every worker reads the same copy of the graph.
+
+    :return: List of walks. Each walk is a list of nodes.
+    """
+
+    graph = shared_graph.attach()
+    indptr, indices, weights = graph.indptr, graph.indices, graph.weights
+    labels = graph.nodes
+
+    walks = list()
+
+    if not quiet:
+        pbar = tqdm(total=num_walks, desc='Generating walks (CPU: {})'.format(cpu_num))
+
+    for n_walk in range(num_walks):
+
+        # Update progress bar
+        if not quiet:
+            pbar.update(1)
+
+        # Shuffle the nodes
+        shuffled_nodes = list(range(len(labels)))
+        random.shuffle(shuffled_nodes)
+
+        # Start a random walk from every node
+        for source in shuffled_nodes:
+            source_label = labels[source]
+
+            # Skip nodes with specific num_walks
+            if source_label in sampling_strategy and \
+                    num_walks_key in sampling_strategy[source_label] and \
+                    sampling_strategy[source_label][num_walks_key] <= n_walk:
+                continue
+
+            # Start walk
+            walk = [source]
+
+            # Calculate walk length
+            if source_label in sampling_strategy:
+                walk_length = sampling_strategy[source_label].get(walk_length_key, global_walk_length)
+            else:
+                walk_length = global_walk_length
+
+            # Perform walk
+            while len(walk) < walk_length:
+
+                current = walk[-1]
+                walk_options = indices[indptr[current]:indptr[current + 1]]
+
+                # Skip dead end nodes
+                if len(walk_options) == 0:
+                    break
+
+                probabilities = weights[indptr[current]:indptr[current + 1]]
+                if len(walk) > 1:  # Bias by the distance to the previous node
+                    previous = walk[-2]
+                    strategy = sampling_strategy.get(labels[current], {})
+                    current_p, current_q = strategy.get(p_key, p), strategy.get(q_key, q)
+                    # Rows are sorted, so membership is a binary search
+                    previous_options = indices[indptr[previous]:indptr[previous + 1]]
+                    found = previous_options.searchsorted(walk_options).clip(max=len(previous_options) - 1)
+                    bias = np.where(previous_options[found] == walk_options, 1, 1 / current_q)
+                    bias[walk_options == previous] = 1 / current_p
+                    probabilities = probabilities * bias
+
+                cumulative = probabilities.cumsum()
+                choice = cumulative.searchsorted(np.random.random_sample() * cumulative[-1], side='right')
+                walk_to = walk_options[min(choice, len(walk_options) - 1)].item()
+                walk.append(walk_to)
+
+            walk = [str(labels[node]) for node in walk]  # Convert all to strings
+
+            walks.append(walk)
+
+    if not quiet:
+        pbar.close()
+
+    return walks
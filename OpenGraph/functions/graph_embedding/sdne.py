@@ -2,6 +2,7 @@ import sys
 sys.path.append('../../../')
 import OpenGraph as og
 from OpenGraph.utils.alias import create_alias_table, alias_sample
+from OpenGraph.utils.index_of_node import get_relation_of_index_and_node
 
 import time
 
@@ -14,16 +15,6 @@ from tensorflow.python.keras.layers import Dense, Input
 from tensorflow.python.keras.models import Model
 from tensorflow.python.keras.regularizers import l1_l2
 
-def get_relation_of_index_and_node(graph):
-    node2idx = {}
-    idx2node = []
-    node_size = 0
-    for node in graph.nodes:
-        node2idx[node] = node_size
-        idx2node.append(node)
-        node_size += 1
-    return idx2node, node2idx
-
 def l_2nd(beta):
     def loss_2nd(y_true, y_pred):
         b_ = np.ones_like(y_true)
@@ -149,13 +140,13 @@ class SDNE(object):
         A_row_index = []
         A_col_index = []
 
-        for edge in graph.edges:
-            v1, v2 = edge[0], edge[1]
-            edge_weight = graph[v1][v2].get('weight', 1)
-
-            A_data.append(edge_weight)
-            A_row_index.append(node2idx[v1])
-            A_col_index.append(node2idx[v2])
+        if hasattr(graph, 'edge_arrays'):  # columnar graphs, ids are node2idx's
+            A_row_index, A_col_index, A_data = (a.tolist() for a in graph.edge_arrays('weight'))
+        else:
+            for v1, v2, edge_weight in graph.edges(weight='weight'):
+                A_data.append(edge_weight)
+                A_row_index.append(node2idx[v1])
+                A_col_index.append(node2idx[v2])
 
         A = sp.csr_matrix((A_data, (A_row_index, A_col_index)), shape=(node_size, node_size))
         A_ = sp.csr_matrix((A_data + A_data, (A_row_index + A_col_index, A_col_index + A_row_index)),
@@ -167,15 +158,8 @@ class SDNE(object):
 
 if __name__ == "__main__":
 
-    with open('./Wiki_edgelist.txt', 'r') as fp:
-        data = fp.readlines()
     G = og.Graph()
-    for edge in data:
-        edge = edge.split()
-        try:
-            G.add_edge(int(edge[0]), int(edge[1]))
-        except:
-            pass
+    G.add_edges_from_file('./Wiki_edgelist.txt', nodetype=int)
 
     model = SDNE(G, hidden_size=[256, 128],)
     model.train(batch_size=3000, epochs=40, verbose=2)
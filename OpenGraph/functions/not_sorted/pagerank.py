@@ -1,6 +1,7 @@
 import sys
 sys.path.append('../../../')
 import OpenGraph as og
+from OpenGraph.utils.result_cache import cached_by_version
 
 
 __all__ = [
@@ -8,6 +9,7 @@ __all__ = [
 ]
 
 
+@cached_by_version
 def pagerank(G, alpha = 0.85):
     """
     Returns the PageRank value of each node in G.
@@ -20,10 +22,16 @@ def pagerank(G, alpha = 0.85):
     alpha : float
         The damping factor. Default is 0.85
 
+    A CSRGraph, e.g. from `load_binary`, is solved by power iteration over
+    its arrays a block of rows at a time, in O(nodes) memory besides the
+    arrays, so memory-mapped graphs larger than RAM work too. Other
+    graphs are solved exactly on the dense Google matrix.
     """
     import numpy as np
     if len(G) == 0:
         return {}
+    if isinstance(G, og.CSRGraph):
+        return dict(zip(G, _pagerank_csr(G, alpha).tolist()))
     M = google_matrix(G, alpha=alpha)
 
     # use numpy LAPACK solver
@@ -36,6 +44,36 @@ def pagerank(G, alpha = 0.85):
 
 
 
+def _pagerank_csr(G, alpha, tol=1e-12, max_iter=1000, block=1 << 22):
+    # Power iteration on the Google matrix of `google_matrix`, without
+    # building it: x @ M is a weighted bincount of the column indices
+    import numpy as np
+    indptr, indices = G.indptr, G.indices
+    n = len(indptr) - 1
+    out_degree = np.diff(indptr)
+    dangling = out_degree == 0
+    # Row ranges holding about `block` entries each
+    bounds = [0]
+    while bounds[-1] < n:
+        end = int(np.searchsorted(indptr, indptr[bounds[-1]] + block, 'right')) - 1
+        bounds.append(min(max(end, bounds[-1] + 1), n))
+
+    x = np.full(n, 1.0 / n)
+    for _ in range(max_iter):
+        share = np.divide(x, out_degree, out=np.zeros(n), where=~dangling)
+        y = np.zeros(n)
+        for start, end in zip(bounds[:-1], bounds[1:]):
+            y += np.bincount(indices[indptr[start]:indptr[end]], minlength=n,
+                             weights=np.repeat(share[start:end], out_degree[start:end]))
+        # Dangling nodes link to every node
+        y = alpha * (y + x[dangling].sum() / n) + (1 - alpha) / n
+        err = np.abs(y - x).sum()
+        x = y
+        if err < n * tol:
+            break
+    return x / x.sum()
+
+
 def google_matrix(G, alpha):
     import numpy as np
     M = og.utils.to_numpy_matrix(G)
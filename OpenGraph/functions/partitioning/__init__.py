@@ -0,0 +1 @@
+from .partition import *
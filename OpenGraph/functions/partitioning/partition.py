@@ -0,0 +1,247 @@
+from collections import namedtuple
+
+import numpy as np
+
+from OpenGraph.classes.csr_graph import CSRGraph, _gather_positions
+
+__all__ = [
+    "partition",
+    "Partition"
+]
+
+Partition = namedtuple('Partition', ['assignment', 'nodes', 'parts', 'boundary', 'ghosts', 'stats'])
+Partition.__doc__ = """
+Result of `partition`.
+
+assignment : numpy.ndarray
+    part of each node, aligned with `nodes`.
+
+nodes : list
+    node labels, in CSR row order.
+
+parts : list of CSRGraph
+    the shard of each part: its nodes, then its ghost nodes (neighbors in
+    other parts), with the edges of its own nodes only, so ghost rows are
+    empty. Node labels are those of the graph.
+
+boundary : list of list
+    nodes of each part with a neighbor in another part.
+
+ghosts : list of list
+    nodes of other parts adjacent to each part, in the order of its shard.
+
+stats : dict
+    'sizes' (nodes per part), 'edge_cut' (edges between parts),
+    'cut_fraction' (edge_cut / number of edges), 'balance' (largest part
+    size over the mean, 1.0 is perfect) and 'ghosts' (ghost nodes over
+    all parts, the nodes exchanged between shards).
+"""
+
+_METHODS = ('bfs', 'label_propagation', 'hash')
+
+
+def partition(G, k, method='bfs', weight='weight', max_iter=10, imbalance=0.05):
+    """
+    Splits the nodes of G into `k` parts for sharded, multi-process
+    algorithms, and returns a Partition with the part of each node, a
+    CSR shard per part with its ghost nodes, and edge cut and balance
+    statistics.
+
+    Parameters
+    ----------
+    G : Graph, DiGraph or CSRGraph
+        directed edges count in both directions for locality.
+
+    k : int
+        number of parts.
+
+    method : String
+        'hash' scatters the nodes by a hash of their index, fast but
+        cutting about (k-1)/k of the edges. 'bfs' cuts a breadth-first order of the nodes
+        into k runs of equal size, keeping neighborhoods together.
+        'label_propagation' refines the 'bfs' parts by moving nodes to the
+        part most of their neighbors are in, keeping each part within
+        `imbalance` of the mean size, to cut fewer edges.
+
+    weight : String or None
+        key for edge weight kept in the shards, if G is not a CSRGraph.
+
+    max_iter : int
+        rounds of label propagation.
+
+    imbalance : float
+        largest part size over the mean, minus 1, allowed by label
+        propagation.
+
+    Returns
+    ----------
+    partition : Partition
+    """
+    if k < 1:
+        raise ValueError("k must be at least 1, not {}.".format(k))
+    if method not in _METHODS:
+        raise ValueError("method must be one of {}, not {!r}.".format(_METHODS, method))
+    C = G if isinstance(G, CSRGraph) else G.to_csr(weight=weight)
+    n = len(C)
+    indptr, indices = _undirected_arrays(C)
+
+    if method == 'hash':
+        assignment = ((_mix(np.arange(n, dtype=np.uint64)) >> np.uint64(32)) * np.uint64(k)
+                      >> np.uint64(32)).astype(np.int64)
+    else:
+        assignment = np.empty(n, dtype=np.int64)
+        assignment[_bfs_order(indptr, indices, n)] = np.arange(n) * k // max(n, 1)
+        if method == 'label_propagation':
+            _label_propagation(indptr, indices, assignment, k, max_iter, imbalance)
+
+    parts, boundary, ghosts = [], [], []
+    for part in range(k):
+        shard, part_boundary, part_ghosts = _shard(C, assignment, part)
+        parts.append(shard)
+        boundary.append(part_boundary)
+        ghosts.append(part_ghosts)
+
+    sizes = np.bincount(assignment, minlength=k)
+    cut = assignment[C._row_ids(C.indptr)] != assignment[C.indices]
+    edge_cut = int(np.count_nonzero(cut))
+    if not C.is_directed():  # each edge is stored in both rows
+        edge_cut //= 2
+    num_edges = C.number_of_edges()
+    stats = {
+        'sizes': sizes.tolist(),
+        'edge_cut': edge_cut,
+        'cut_fraction': edge_cut / num_edges if num_edges else 0.0,
+        'balance': sizes.max().item() * k / n if n else 1.0,
+        'ghosts': sum(len(part_ghosts) for part_ghosts in ghosts),
+    }
+    return Partition(assignment, C.nodes, parts, boundary, ghosts, stats)
+
+
+def _undirected_arrays(C):
+    # indptr and indices (int64) of the neighbors of each row, successors
+    # and predecessors alike if directed
+    indptr, indices = C.indptr.astype(np.int64), C.indices.astype(np.int64)
+    if not C.is_directed():
+        return indptr, indices
+    rows = np.concatenate([C._row_ids(C.indptr), C._row_ids(C.in_indptr)])
+    cols = np.concatenate([indices, C.in_indices.astype(np.int64)])
+    order = np.argsort(rows, kind='stable')
+    indptr = np.zeros(len(C) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=len(C)), out=indptr[1:])
+    return indptr, cols[order]
+
+
+def _mix(x):
+    # splitmix64 finalizer: unrelated, well spread 64-bit hashes of x
+    x = x + np.uint64(0x9E3779B97F4A7C15)
+    x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+
+def _neighbors(indptr, indices, rows):
+    starts = indptr[rows]
+    positions, offsets = _gather_positions(starts, indptr[rows + 1] - starts)
+    return indices[positions]
+
+
+def _bfs_order(indptr, indices, n):
+    # Rows in breadth-first order, one component after the other
+    seen = np.zeros(n, dtype=bool)
+    order = []
+    root = 0
+    while root < n:
+        if seen[root]:
+            root += 1
+            continue
+        frontier = np.array([root], dtype=np.int64)
+        seen[root] = True
+        while len(frontier):
+            order.append(frontier)
+            nbrs = _neighbors(indptr, indices, frontier)
+            frontier = np.unique(nbrs[~seen[nbrs]])
+            seen[frontier] = True
+    return np.concatenate(order) if order else np.empty(0, dtype=np.int64)
+
+
+def _label_propagation(indptr, indices, assignment, k, max_iter, imbalance):
+    # Moves nodes, in place, to the part holding most of their neighbors,
+    # as long as the part stays under capacity. Even and odd rows move in
+    # turns, so that two neighbors do not swap parts forever.
+    n = len(assignment)
+    capacity = int(np.ceil((1 + imbalance) * n / k))
+    rows = np.repeat(np.arange(n, dtype=np.int64), np.diff(indptr))
+    not_loop = rows != indices
+    rows, cols = rows[not_loop], indices[not_loop]
+    for _ in range(max_iter):
+        moved = 0
+        for parity in (0, 1):
+            keys, counts = np.unique(rows * k + assignment[cols], return_counts=True)
+            node, part = keys // k, keys % k
+            current = np.zeros(n, dtype=np.int64)
+            in_current = part == assignment[node]
+            current[node[in_current]] = counts[in_current]
+            # Part with most neighbors of each node, lowest part on ties
+            order = np.lexsort((part, -counts, node))
+            node, part, counts = node[order], part[order], counts[order]
+            first = np.ones(len(node), dtype=bool)
+            first[1:] = node[1:] != node[:-1]
+            node, part, gain = node[first], part[first], counts[first] - current[node[first]]
+            candidate = (gain > 0) & (node % 2 == parity)
+            node, part, gain = node[candidate], part[candidate], gain[candidate]
+            # Largest gains first, while the target part has room
+            order = np.lexsort((-gain, part))
+            node, part = node[order], part[order]
+            rank = np.arange(len(part)) - np.searchsorted(part, part)
+            room = capacity - np.bincount(assignment, minlength=k)
+            accept = rank < room[part]
+            assignment[node[accept]] = part[accept]
+            moved += int(np.count_nonzero(accept))
+        if moved == 0:
+            break
+
+
+def _shard(C, assignment, part):
+    # CSRGraph of the nodes of `part` and their ghosts, its boundary nodes
+    # and its ghost nodes
+    owned = np.flatnonzero(assignment == part)
+    arrays = [(C.indptr, C.indices, C.weights)]
+    if C.is_directed():
+        arrays.append((C.in_indptr, C.in_indices, C.in_weights))
+    gathered = []
+    for indptr, indices, weights in arrays:
+        starts = indptr[owned].astype(np.int64)
+        lengths = indptr[owned + 1] - starts
+        positions, offsets = _gather_positions(starts, lengths)
+        gathered.append((lengths, indices[positions].astype(np.int64), weights[positions]))
+
+    outside = [cols[assignment[cols] != part] for lengths, cols, weights in gathered]
+    ghost_rows = np.unique(np.concatenate(outside))
+    local_rows = np.concatenate([owned, ghost_rows])
+    sorter = np.argsort(local_rows)
+    index_dtype = np.int32 if len(local_rows) < 2 ** 31 else np.int64
+
+    shard_arrays = []
+    for lengths, cols, weights in gathered:
+        local_cols = sorter[np.searchsorted(local_rows, cols, sorter=sorter)]
+        row_ids = np.repeat(np.arange(len(owned), dtype=np.int64), lengths)
+        order = np.lexsort((local_cols, row_ids))  # rows sorted by index
+        indptr = np.zeros(len(local_rows) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=indptr[1:len(owned) + 1])
+        indptr[len(owned) + 1:] = indptr[len(owned)]  # ghost rows are empty
+        shard_arrays.append((indptr, local_cols[order].astype(index_dtype), weights[order]))
+
+    nodes = C.nodes
+    labels = [nodes[i] for i in local_rows.tolist()]
+    (indptr, indices, weights), in_arrays = shard_arrays[0], shard_arrays[1:]
+    in_indptr, in_indices, in_weights = in_arrays[0] if in_arrays else (None, None, None)
+    shard = CSRGraph(indptr, indices, weights, nodes=labels, directed=C.is_directed(),
+                     in_indptr=in_indptr, in_indices=in_indices, in_weights=in_weights,
+                     weight=C.weight, **C.graph)
+
+    crossing = np.zeros(len(owned), dtype=bool)
+    for (lengths, cols, weights) in gathered:
+        row_ids = np.repeat(np.arange(len(owned)), lengths)
+        crossing[row_ids[assignment[cols] != part]] = True
+    boundary = [nodes[i] for i in owned[crossing].tolist()]
+    return shard, boundary, labels[len(owned):]
@@ -5,7 +5,7 @@ import OpenGraph as og
 import random
 import math
 from OpenGraph.utils.decorators import only_implemented_for_UnDirected_graph
-from OpenGraph.functions.components.connected import connected_components
+from OpenGraph.functions.components.connected import _connected_components
 from OpenGraph.functions.components.biconnected import generator_articulation_points
 
 
@@ -47,7 +47,7 @@ def common_greedy(G, k, c=1.0, weight='weight'):
         C_max = 0
 
         for j in range(N-i):
-            G_i_j = G_i.copy()
+            G_i_j = G_i.copy(lazy=True)  # only nodes are removed from it
             G_i_j.remove_node(sorted_nodes[j])
             upper_bound = procedure1(G_i_j, c)
             if upper_bound < C_max:
@@ -87,10 +87,10 @@ def procedure1(G, c=1.0):
         To define zeta: zeta = c * (n*n*n)
         Default is 1.
     """
-    components = connected_components(G)
+    components = _connected_components(G)
     upper_bound = 0
     for component in components:
-        component_subgraph = G.nodes_subgraph(from_nodes=list(component))
+        component_subgraph = og.SubgraphView(G, component)
         spanning_tree = _get_spanning_tree_of_component(component_subgraph)
 
         random_root = list(spanning_tree.nodes)[
@@ -164,12 +164,12 @@ def procedure2(G, c=1.0):
         To define zeta: zeta = c * (n*n*n)
         Default is 1.
     """
-    components = connected_components(G)
+    components = _connected_components(G)
     C = 0
     N_G = len(G)
     zeta = c * math.pow(N_G, 3)
     for component in components:
-        component_subgraph = G.nodes_subgraph(from_nodes=list(component))
+        component_subgraph = og.SubgraphView(G, component)
         C_l = _get_sum_all_shortest_paths_of_component(component_subgraph)
         N_c = len(component)
         C += (C_l + N_c * (N_G - N_c) * zeta)
@@ -248,7 +248,7 @@ def AP_Greedy(G, k, c=1.0, weight='weight'):
             C_max = 0
 
             for j in range(N-i):
-                G_i_j = G_i.copy()
+                G_i_j = G_i.copy(lazy=True)  # only nodes are removed from it
                 G_i_j.remove_node(sorted_nodes[j])
                 upper_bound = procedure1(G_i_j, c)
                 if upper_bound < C_max:
@@ -290,21 +290,21 @@ def _get_lower_bound_of_ap_nodes(G, c=1.0):
 
     N_G = len(G)
     zeta = c * math.pow(N_G, 3)
-    components = connected_components(G)
+    components = _connected_components(G)
     for component in components:
-        component_subgraph = G.nodes_subgraph(from_nodes=list(component))
+        component_subgraph = og.SubgraphView(G, component)
         articulation_points = list(
             generator_articulation_points(component_subgraph))
         N_component = len(component_subgraph)
         for articulation in articulation_points:
-            component_subgraph_after_remove = component_subgraph.copy()
-            component_subgraph_after_remove.remove_node(articulation)
+            component_subgraph_after_remove = og.SubgraphView(
+                G, component - {articulation})
 
             lower_bound_value = 0
             lower_bound_value += sum([(len(temp) * (N_G - len(temp)))
                                       for temp in components])
             lower_bound_value += sum([(len(temp) * (N_component - 1 - len(temp)))
-                                      for temp in connected_components(component_subgraph_after_remove)])
+                                      for temp in _connected_components(component_subgraph_after_remove)])
             lower_bound_value += (2*N_component - 2*N_G)
             lower_bound_value *= zeta
 
@@ -341,7 +341,7 @@ def _get_upper_bound_of_non_ap_nodes(G, ap: list, c=1.0):
 
     N_G = len(G)
     zeta = c * math.pow(N_G, 3)
-    components = connected_components(G)
+    components = _connected_components(G)
     for component in components:
         non_articulation_points = component - set(ap)
         for node in non_articulation_points:
@@ -71,7 +71,7 @@ def load_adj_matrix(G):
     A : A sparse matrix A
     '''
     listE = []
-    for edge in G.edges:
+    for edge in G.edges(data=False):
         listE.append(edge[0]-1)
         listE.append(edge[1]-1)
         # listE.append(edge[0])
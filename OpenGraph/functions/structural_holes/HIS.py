@@ -38,11 +38,12 @@ def initialize(G, C: [frozenset], S: [tuple], weight='weight'):
         I[node] = dict()
         H[node] = dict()
 
+    degree = G.degree(weight=weight)
     for node in G.nodes:
         for index, community in enumerate(C):
             if node in community:
                 # TODO: add PageRank or HITS to initialize I
-                I[node][index] = G.degree(weight=weight)[node]
+                I[node][index] = degree[node]
             else:
                 I[node][index] = 0
 
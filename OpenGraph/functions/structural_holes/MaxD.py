@@ -25,6 +25,7 @@ def get_community_kernel(G, C: [frozenset], weight='weight'):
             area[each_node-1] += 1 << i    # node_id from 1 to n.
     kernels = []
     cnt = 0
+    degree = G.degree(weight=weight)
     for i in range(len(C)):
         mask = 1<<i
         cnt+=1
@@ -32,7 +33,7 @@ def get_community_kernel(G, C: [frozenset], weight='weight'):
         p = []
         for i in range(len(G)):
             if (area[i] & mask) == mask:
-                q.append((G.degree(weight=weight)[i+1], i+1))
+                q.append((degree[i+1], i+1))
         q.sort()
         q.reverse()
         for i in range(max(int(len(q)/100),
@@ -49,7 +50,7 @@ def get_community_kernel(G, C: [frozenset], weight='weight'):
     return kernels
 
 
-def get_structural_holes_MaxD (G, k_size, C: [frozenset]):
+def get_structural_holes_MaxD (G, k_size, C: [frozenset], weight='weight'):
     '''
     To calc the strucutral hole spanners using MaxD.
 
@@ -64,6 +65,9 @@ def get_structural_holes_MaxD (G, k_size, C: [frozenset]):
 
     C : [frozenset]
         communities
+
+    weight : String or None
+        Key for edge weight. None if not concerning about edge weight.
         
     Returns
     -------
@@ -71,7 +75,8 @@ def get_structural_holes_MaxD (G, k_size, C: [frozenset]):
     '''
 
 
-    kernels = get_community_kernel(G, C)
+    kernels = get_community_kernel(G, C, weight=weight)
+    degree = G.degree(weight=weight)
     c = len(kernels)
     save = []
     for i in range(len(G)):
@@ -102,7 +107,7 @@ def get_structural_holes_MaxD (G, k_size, C: [frozenset]):
             if save[i] == False:
                 q.append((-1, i))
             else:
-                q.append((sflow[i]+G.degree(weight=weight)[i+1], i))
+                q.append((sflow[i]+degree[i+1], i))
         q.sort()
         q.reverse()
         candidates = []
@@ -372,7 +377,7 @@ def build_network(kernels, c, G):
         if len(S1) == 0 or len(S2) == 0:
             continue
 
-        for edges in G.edges:
+        for edges in G.edges(data=False):
             addedge(base + edges[0] - 1, base + edges[1] - 1, 1, 1)
             addedge(base + edges[1] - 1, base + edges[0] - 1, 1, 1)
 
@@ -1,6 +1,16 @@
 from .HIS import *
 from .MaxD import *
 from .AP_Greedy import *
-from .HAM import *
 
-from .evaluation import *
\ No newline at end of file
+from .evaluation import *
+
+from OpenGraph.utils.lazy_import import lazy_import
+
+# HAM needs scipy and sklearn, imported on first access
+__getattr__, __dir__, _lazy_all = lazy_import(__name__, submodules=['HAM'], attributes={
+    'get_structural_holes_HAM': '.HAM',
+})
+del lazy_import
+
+__all__ = ['get_structural_holes_HIS', 'get_structural_holes_MaxD', 'common_greedy', 'AP_Greedy',
+           'effective_size', 'efficiency', 'constraint'] + _lazy_all
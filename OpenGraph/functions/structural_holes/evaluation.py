@@ -1,6 +1,7 @@
 import sys
 sys.path.append('../../../')
 import OpenGraph as og
+from OpenGraph.utils.result_cache import cached_by_version
 
 __all__ = [
     'effective_size',
@@ -43,7 +44,7 @@ def effective_size(G, nodes=None, weight=None):
             if len(G[v]) == 0:
                 effective_size[v] = float('nan')
                 continue
-            E = G.ego_subgraph(v)
+            E = og.SubgraphView(G, [v, *G.all_neighbors(v)])
             effective_size[v] = len(E) - (2 * E.size()) / len(E)
     else:
         for v in nodes:
@@ -62,6 +63,7 @@ def efficiency(G, nodes=None, weight=None):
     efficiency = {n: v / degree[n] for n, v in e_size.items()}
 
 
+@cached_by_version
 def constraint(G, nodes=None, weight=None):
     if nodes is None:
         nodes = G.nodes
@@ -0,0 +1,12 @@
+from OpenGraph.readwrite.edgelist import *
+
+from OpenGraph.utils.lazy_import import lazy_import
+
+__getattr__, __dir__, _lazy_all = lazy_import(__name__, attributes={
+    'save_binary': '.binary',
+    'load_binary': '.binary',
+    'edgelist_to_binary': '.binary',
+})
+del lazy_import
+
+__all__ = ['parse_edgelist', 'read_edgelist'] + _lazy_all
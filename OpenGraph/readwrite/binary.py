@@ -0,0 +1,413 @@
+import json
+import pickle
+import struct
+
+import numpy as np
+
+__all__ = [
+    "save_binary",
+    "load_binary",
+    "edgelist_to_binary"
+]
+
+_MAGIC = b'OGBINv2\n'
+_MAGIC_V1 = b'OGBINv1\n'  # header pickled, read only with allow_pickle
+_ALIGN = 64
+
+_ARRAY_NAMES = ('indptr', 'indices', 'weights', 'in_indptr', 'in_indices', 'in_weights')
+
+
+def save_binary(G, path, weight='weight', allow_pickle=False):
+    """
+    Saves graph `G` to `path` in the binary CSR format read by
+    `load_binary`.
+
+    The file holds a small JSON header (node labels, graph attributes, and
+    dtype, shape and offset of each array) followed by the raw CSR arrays,
+    each aligned to 64 bytes so that they can be memory-mapped as they are.
+    Int labels are stored as an int64 array. Labels or graph attributes
+    that JSON does not give back as they are, e.g. tuples, need
+    `allow_pickle`.
+
+    Parameters
+    ----------
+    G : Graph, DiGraph or CSRGraph
+
+    path : String
+        path of the file to write.
+
+    weight : String or None
+        key for edge weight stored as a float64 column, if `G` is not
+        already a CSRGraph. None to store only the structure.
+
+    allow_pickle : boolean
+        if true, pickles the labels and graph attributes JSON cannot hold,
+        instead of raising a ValueError. The file must then be loaded with
+        ``load_binary(path, allow_pickle=True)``.
+    """
+    header, arrays = _csr_layout(G, weight, allow_pickle)
+    layout, size = header['arrays'], header['size']
+    header = json.dumps(header).encode()
+    data_start = _aligned(len(_MAGIC) + 8 + len(header))
+
+    with open(path, 'wb') as fp:
+        fp.write(_MAGIC)
+        fp.write(struct.pack('<Q', len(header)))
+        fp.write(header)
+        for name, array in arrays.items():
+            fp.seek(data_start + layout[name][2])
+            _write_array(fp, array)
+        fp.truncate(data_start + size)
+
+
+def load_binary(path, mmap=True, allow_pickle=False):
+    """
+    Loads a graph written by `save_binary` as a read-only CSRGraph.
+
+    With `mmap` the arrays are memory-mapped instead of read: loading
+    costs only the header, pages are read on first touch, and processes
+    loading the same file share it through the page cache.
+
+    Parameters
+    ----------
+    path : String
+        path of the file to read.
+
+    mmap : boolean
+        if true, memory-map the arrays, else read them into memory.
+
+    allow_pickle : boolean
+        if true, unpickles the labels and graph attributes of files saved
+        with ``allow_pickle=True``, and the headers of files written by
+        older versions. Unpickling runs arbitrary code, so only allow it
+        for files from trusted sources.
+
+    Returns
+    ----------
+    G : CSRGraph
+    """
+    with open(path, 'rb') as fp:
+        magic = fp.read(len(_MAGIC))
+        if magic not in (_MAGIC, _MAGIC_V1):
+            raise ValueError("{} is not an OpenGraph binary graph file.".format(path))
+        if magic == _MAGIC_V1 and not allow_pickle:
+            raise ValueError("{} has a pickled header, load it with allow_pickle=True "
+                             "if it comes from a trusted source.".format(path))
+        header_size, = struct.unpack('<Q', fp.read(8))
+        header = fp.read(header_size)
+    header = pickle.loads(header) if magic == _MAGIC_V1 else json.loads(header.decode())
+    data_start = _aligned(len(_MAGIC) + 8 + header_size)
+
+    arrays = dict()
+    for name, (dtype, shape, offset) in header['arrays'].items():
+        arrays[name] = _read_array(path, np.dtype(dtype), tuple(shape), data_start + offset, mmap)
+    return _csr_from_layout(header, arrays, allow_pickle)
+
+
+def edgelist_to_binary(files, path, weighted=False, directed=False, memory_limit=1 << 30,
+                       comments='#', nodetype=None, allow_pickle=False):
+    """
+    Converts edge list files to the binary CSR format of `save_binary`
+    without ever holding the edges in memory, for graphs larger than RAM.
+    ``load_binary(path)`` then memory-maps the arrays, which are paged in
+    on demand.
+
+    Only the node labels stay in memory. The edges are spilled to
+    temporary files next to `path`, counted per row, scattered into their
+    rows and sorted block by block, so the arrays held at once take about
+    `memory_limit` bytes. The temporary files take about three times the
+    size of the result. Duplicate edges keep the last weight, like
+    `add_edges_from_file`, and nodes are numbered in order of first
+    appearance.
+
+    Parameters
+    ----------
+    files : String or list of String
+        edge list files, plain or compressed, see `parse_edgelist`.
+
+    path : String
+        path of the binary file to write.
+
+    weighted : boolean
+        if true, the third column is parsed as the edge weight.
+
+    directed : boolean
+        if true, the graph is directed.
+
+    memory_limit : int
+        approximate bytes of edge arrays held in memory at once.
+
+    comments : String or None
+        prefix of comment lines.
+
+    nodetype : type or callable or None
+        parses the node labels, see `parse_edgelist`. Int labels are
+        stored as an int64 array instead of JSON strings.
+
+    allow_pickle : boolean
+        if true, pickles labels JSON cannot hold, see `save_binary`.
+
+    Returns
+    ----------
+    stats : dict
+        'lines', 'malformed' and 'edges' read from the files, and
+        'number_of_nodes' and 'number_of_edges' of the graph.
+    """
+    import os
+    import tempfile
+    from OpenGraph.classes.csr_graph import CSRGraph
+    from OpenGraph.readwrite.edgelist import parse_edgelist
+    if isinstance(files, str):
+        files = [files]
+    block = max(memory_limit // 256, 1 << 10)  # edges per block, ~256 bytes each in flight
+    stats = dict(lines=0, malformed=0, edges=0)
+
+    with tempfile.TemporaryDirectory(dir=os.path.dirname(os.path.abspath(path))) as tmp:
+        spill = {name: os.path.join(tmp, name) for name in ('src', 'dst', 'weight')}
+        index_of_label = dict()
+        with open(spill['src'], 'wb') as fs, open(spill['dst'], 'wb') as fd, \
+                open(spill['weight'], 'wb') as fw:
+            for file in files:
+                file_stats = dict()
+                for src, dst, weight in parse_edgelist(file, weighted=weighted, comments=comments,
+                                                       chunk_size=block, stats=file_stats,
+                                                       nodetype=nodetype):
+                    # Interleaved, so that nodes are numbered like add_edge does
+                    ends = [None] * (2 * len(src))
+                    ends[0::2], ends[1::2] = src, dst
+                    ids = np.fromiter(
+                        (index_of_label.setdefault(label, len(index_of_label)) for label in ends),
+                        dtype=np.int64, count=len(ends))
+                    fs.write(ids[0::2].tobytes())
+                    fd.write(ids[1::2].tobytes())
+                    if weighted:
+                        fw.write(np.asarray(weight, dtype=np.float64).tobytes())
+                for key in stats:
+                    stats[key] += file_stats[key]
+        labels = list(index_of_label)
+        del index_of_label
+
+        spilled = _SpilledEdges(spill, stats['edges'], weighted, block)
+        indptr, indices, weights = spilled.to_csr(tmp, 'out', len(labels), reverse=False,
+                                                  symmetric=not directed)
+        if directed:
+            in_indptr, in_indices, in_weights = spilled.to_csr(tmp, 'in', len(labels),
+                                                               reverse=True, symmetric=False)
+        else:
+            in_indptr = in_indices = in_weights = None
+        G = CSRGraph(indptr, indices, weights, nodes=labels, directed=directed,
+                     in_indptr=in_indptr, in_indices=in_indices, in_weights=in_weights,
+                     weight='weight' if weighted else None)
+        save_binary(G, path, allow_pickle=allow_pickle)
+        stats['number_of_nodes'] = len(labels)
+        stats['number_of_edges'] = len(indices) if directed else \
+            (len(indices) + spilled.self_loops) // 2
+        del G, indices, weights, in_indices, in_weights  # unmap before the directory goes
+    return stats
+
+
+class _SpilledEdges(object):
+    """
+    Edges spilled to disk by `edgelist_to_binary`, as int64 node ids in
+    files 'src' and 'dst' and float64 weights in 'weight'.
+    """
+
+    def __init__(self, spill, num_edges, weighted, block):
+        self.spill = spill
+        self.num_edges = num_edges
+        self.weighted = weighted
+        self.block = block
+        self.self_loops = 0
+
+    def entries(self, reverse, symmetric):
+        # Yields (rows, cols, weights) of the CSR entries in edge order,
+        # block by block: both directions of each edge if symmetric
+        for start in range(0, self.num_edges, self.block):
+            count = min(self.block, self.num_edges - start)
+            u = _read_array(self.spill['src'], np.dtype(np.int64), (count,), start * 8, False)
+            v = _read_array(self.spill['dst'], np.dtype(np.int64), (count,), start * 8, False)
+            w = _read_array(self.spill['weight'], np.dtype(np.float64), (count,), start * 8, False) \
+                if self.weighted else None
+            if reverse:
+                u, v = v, u
+            if symmetric:  # (u, v) then (v, u), a self-loop once
+                keep = np.ones(2 * count, dtype=bool)
+                keep[1::2] = u != v
+                u, v = np.column_stack((u, v)).ravel()[keep], np.column_stack((v, u)).ravel()[keep]
+                w = None if w is None else np.repeat(w, 2)[keep]
+            yield u, v, w
+
+    def to_csr(self, tmp, name, n, reverse, symmetric):
+        # Row counts go into one array, O(block) per block whatever n is
+        counts = np.zeros(n, dtype=np.int64)
+        for rows, cols, w in self.entries(reverse, symmetric):
+            np.add.at(counts, rows, 1)
+        raw_indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(counts, out=raw_indptr[1:])
+        total = int(raw_indptr[-1])
+        index_dtype = np.int32 if n < 2 ** 31 else np.int64
+
+        # Scatter each entry into its row, rows keeping the edge order
+        raw_cols = _scratch(tmp, name + '.cols', np.int64, total)
+        raw_w = _scratch(tmp, name + '.weights', np.float64, total) if self.weighted else None
+        cursor = raw_indptr[:-1].copy()
+        for rows, cols, w in self.entries(reverse, symmetric):
+            order = np.argsort(rows, kind='stable')
+            rows = rows[order]
+            rank = np.arange(len(rows)) - np.searchsorted(rows, rows)
+            pos = cursor[rows] + rank
+            raw_cols[pos] = cols[order]
+            if w is not None:
+                raw_w[pos] = w[order]
+            np.add.at(cursor, rows, 1)
+
+        # Sort each row by column and keep the last of duplicate entries,
+        # a block of rows at a time
+        indptr = np.zeros(n + 1, dtype=np.int32 if total < 2 ** 31 else np.int64)
+        indices = _scratch(tmp, name + '.indices', index_dtype, total)
+        weights = _scratch(tmp, name + '.final_weights', np.float64, total) if self.weighted else None
+        out = start_row = 0
+        while start_row < n:
+            end_row = int(np.searchsorted(raw_indptr, raw_indptr[start_row] + self.block, 'right')) - 1
+            end_row = min(max(end_row, start_row + 1), n)
+            lo, hi = raw_indptr[start_row], raw_indptr[end_row]
+            rows = np.repeat(np.arange(start_row, end_row), counts[start_row:end_row])
+            cols = np.array(raw_cols[lo:hi])
+            order = np.lexsort((cols, rows))  # stable, duplicates stay in edge order
+            rows, cols = rows[order], cols[order]
+            last = np.ones(len(rows), dtype=bool)
+            last[:-1] = (rows[1:] != rows[:-1]) | (cols[1:] != cols[:-1])
+            k = int(np.count_nonzero(last))
+            self.self_loops += int(np.count_nonzero((rows == cols) & last))
+            indices[out:out + k] = cols[last]
+            if weights is not None:
+                weights[out:out + k] = np.array(raw_w[lo:hi])[order][last]
+            indptr[start_row + 1:end_row + 1] = out + np.cumsum(
+                np.bincount(rows[last] - start_row, minlength=end_row - start_row))
+            out += k
+            start_row = end_row
+        return indptr, indices[:out], None if weights is None else weights[:out]
+
+
+def _scratch(tmp, name, dtype, size):
+    # Array of `size` items in a file of the temporary directory
+    import os
+    if size == 0:  # np.memmap refuses empty arrays
+        return np.empty(0, dtype=dtype)
+    return np.memmap(os.path.join(tmp, name), dtype=dtype, mode='w+', shape=(size,))
+
+
+def _csr_layout(G, weight, allow_pickle=False):
+    # Header and arrays of the CSR form of G, the arrays placed one after
+    # the other at 64-byte aligned offsets from 0 to header['size']. The
+    # header is JSON, what it cannot hold is pickled into array 'pickled'
+    from OpenGraph.classes.csr_graph import CSRGraph, _is_range
+    if not isinstance(G, CSRGraph):
+        G = G.to_csr(weight=weight)
+
+    arrays = {'indptr': G.indptr, 'indices': G.indices}
+    if G.weight is not None:
+        arrays['weights'] = G.weights
+    if G.is_directed():
+        arrays['in_indptr'] = G.in_indptr
+        arrays['in_indices'] = G.in_indices
+        if G.weight is not None:
+            arrays['in_weights'] = G.in_weights
+
+    nodes = G.nodes
+    labels = None
+    graph = dict(G.graph)
+    pickled = dict()
+    if _is_range(nodes):
+        node_format = 'range'
+    elif all(type(node) is int for node in nodes):
+        if nodes == list(range(len(nodes))):
+            node_format = 'range'
+        else:
+            node_format = 'array'
+            arrays['nodes'] = np.asarray(nodes, dtype=np.int64)
+    elif _fits_json(list(nodes)):
+        node_format = 'json'
+        labels = list(nodes)
+    else:
+        node_format = 'pickle'
+        pickled['labels'] = list(nodes)
+    if not _fits_json(graph):
+        pickled['graph'] = graph
+        graph = None
+    if pickled:
+        if not allow_pickle:
+            raise ValueError("The {} of G cannot be stored as JSON, pass allow_pickle=True "
+                             "to pickle them.".format(' and '.join(
+                                 'node labels' if key == 'labels' else 'graph attributes'
+                                 for key in pickled)))
+        arrays['pickled'] = np.frombuffer(
+            pickle.dumps(pickled, protocol=pickle.HIGHEST_PROTOCOL), dtype=np.uint8)
+
+    layout = dict()
+    offset = 0
+    for name, array in arrays.items():
+        array = np.ascontiguousarray(array)
+        arrays[name] = array
+        layout[name] = (array.dtype.str, list(array.shape), offset)
+        offset = _aligned(offset + array.nbytes)
+
+    header = {
+        'directed': G.is_directed(),
+        'weight': G.weight,
+        'graph': graph,
+        'number_of_nodes': len(nodes),
+        'node_format': node_format,
+        'labels': labels,
+        'arrays': layout,
+        'size': offset,
+    }
+    return header, arrays
+
+
+def _csr_from_layout(header, arrays, allow_pickle=False):
+    from OpenGraph.classes import CSRGraph
+    if 'pickled' in arrays:
+        if not allow_pickle:
+            raise ValueError("The graph holds pickled node labels or attributes, load it "
+                             "with allow_pickle=True if it comes from a trusted source.")
+        header = dict(header, **pickle.loads(arrays.pop('pickled').tobytes()))
+    if header['node_format'] == 'range':
+        nodes = None
+    elif header['node_format'] == 'array':
+        nodes = arrays.pop('nodes').tolist()
+    else:
+        nodes = header['labels']
+    return CSRGraph(nodes=nodes, directed=header['directed'], weight=header['weight'],
+                    **{name: arrays.get(name) for name in _ARRAY_NAMES}, **header['graph'])
+
+
+def _fits_json(value):
+    # Whether JSON gives `value` back as it is, e.g. not for tuples or
+    # int dict keys, which come back as lists and strings
+    try:
+        return json.loads(json.dumps(value)) == value
+    except (TypeError, ValueError):
+        return False
+
+
+def _aligned(offset):
+    return -(-offset // _ALIGN) * _ALIGN
+
+
+def _write_array(fp, array, block=1 << 26):
+    # Writes the bytes of `array` in blocks, a memory-mapped array is never
+    # read into memory whole
+    flat = array.reshape(-1)
+    step = max(block // max(flat.itemsize, 1), 1)
+    for start in range(0, len(flat), step):
+        fp.write(flat[start:start + step].tobytes())
+
+
+def _read_array(path, dtype, shape, offset, mmap):
+    count = int(np.prod(shape))
+    if count == 0:  # np.memmap refuses empty arrays
+        return np.empty(shape, dtype=dtype)
+    if mmap:
+        return np.memmap(path, dtype=dtype, mode='r', offset=offset, shape=shape)
+    return np.fromfile(path, dtype=dtype, count=count, offset=offset).reshape(shape)
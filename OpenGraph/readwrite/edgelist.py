@@ -0,0 +1,325 @@
+import io
+import os
+
+__all__ = [
+    "parse_edgelist",
+    "read_edgelist"
+]
+
+
+def parse_edgelist(file, weighted=False, chunk_size=1 << 22, comments='#', stats=None,
+                   nodetype=None):
+    """
+    Yields the edges of an edge list file in batches, reading it in
+    fixed-size chunks so that memory stays bounded by `chunk_size`
+    whatever the size of the file.
+
+    Each line is in form like:
+    a b 23.0
+    which denotes an edge (a, b) with weight 23.0. Blank lines and lines
+    starting with `comments` are skipped. Lines with too few columns, or
+    whose weight is not a number, are counted as malformed and skipped,
+    and so are lines whose nodes `nodetype` fails to parse.
+
+    Files compressed with gzip, bzip2 or xz are decompressed on the fly,
+    recognized by their magic bytes or else by a .gz, .bz2 or .xz
+    extension, without writing an uncompressed copy.
+
+    Parameters
+    ----------
+    file : String
+        path of the edge list file.
+
+    weighted : boolean
+        if true, the third column is parsed as the edge weight.
+
+    chunk_size : int
+        number of characters read at once, each chunk gives one batch.
+
+    comments : String or None
+        prefix of comment lines.
+
+    stats : dict or None
+        if given, updated after each batch with 'bytes_read',
+        'bytes_total', 'lines', 'edges' and 'malformed'. Bytes are those
+        of the file, compressed or not.
+
+    nodetype : type or callable or None
+        parses the node labels, e.g. int for numeric ids, which are faster
+        to look up than strings. None keeps them as strings.
+
+    Returns
+    ----------
+    Yields (src, dst, weight) lists for each batch, weight is None if not
+    weighted.
+    """
+    if stats is None:
+        stats = dict()
+    stats.update(bytes_read=0, bytes_total=os.path.getsize(file),
+                 lines=0, edges=0, malformed=0)
+    ncols = 3 if weighted else 2
+    nodetype = _nodetype(nodetype)
+    with open(file, 'rb') as raw, io.TextIOWrapper(_decompressed(file, raw)) as fp:
+        rest = ''
+        while True:
+            chunk = fp.read(chunk_size)
+            if not chunk:
+                break
+            chunk = rest + chunk
+            cut = chunk.rfind('\n') + 1
+            if cut == 0:  # No complete line yet
+                rest = chunk
+                continue
+            chunk, rest = chunk[:cut], chunk[cut:]
+            stats['bytes_read'] = raw.tell()
+            yield _parse_chunk(chunk, ncols, comments, stats, nodetype)
+        if rest:
+            yield _parse_chunk(rest + '\n', ncols, comments, stats, nodetype)
+        stats['bytes_read'] = stats['bytes_total']
+
+
+_MAGIC_BYTES = [(b'\x1f\x8b', 'gzip'), (b'BZh', 'bz2'), (b'\xfd7zXZ\x00', 'xz')]
+_EXTENSIONS = {'.gz': 'gzip', '.bz2': 'bz2', '.xz': 'xz'}
+
+
+def _compression(file, raw=None):
+    # 'gzip', 'bz2', 'xz' or None, from the magic bytes of the file, else
+    # from its extension
+    if raw is None:
+        with open(file, 'rb') as raw:
+            head = raw.read(6)
+    else:
+        head = raw.read(6)
+        raw.seek(0)
+    for magic, compression in _MAGIC_BYTES:
+        if head.startswith(magic):
+            return compression
+    return _EXTENSIONS.get(os.path.splitext(str(file))[1].lower())
+
+
+def _decompressed(file, raw):
+    # Binary stream of the content of `file`, read from its open binary
+    # file `raw` and decompressed on the fly if needed
+    compression = _compression(file, raw)
+    if compression == 'gzip':
+        import gzip
+        return gzip.GzipFile(fileobj=raw)
+    if compression == 'bz2':
+        import bz2
+        return bz2.BZ2File(raw)
+    if compression == 'xz':
+        import lzma
+        return lzma.LZMAFile(raw)
+    return raw
+
+
+def _nodetype(nodetype):
+    # None for string labels, kept as they are read
+    return None if nodetype is str else nodetype
+
+
+def _parse_chunk(chunk, ncols, comments, stats, nodetype=None):
+    # Lines are split one at a time, keeping only the (untracked) strings
+    # alive, since holding one list per line makes the garbage collector
+    # rescan the whole batch over and over.
+    src, dst = [], []
+    weight = [] if ncols == 3 else None
+    lines = chunk.splitlines()
+    for line in lines:
+        edge = line.split()
+        if not edge or (comments and edge[0].startswith(comments)):
+            continue
+        if len(edge) < ncols:
+            stats['malformed'] += 1
+            continue
+        if weight is not None:
+            try:
+                weight.append(float(edge[2]))
+            except ValueError:
+                stats['malformed'] += 1
+                continue
+        src.append(edge[0])
+        dst.append(edge[1])
+    if nodetype is not None:
+        src, dst, weight = _parse_nodes(src, dst, weight, nodetype, stats)
+    stats['lines'] += len(lines)
+    stats['edges'] += len(src)
+    return src, dst, weight
+
+
+def _parse_nodes(src, dst, weight, nodetype, stats):
+    # map() over whole columns, several times faster than numpy's string
+    # casts; on a failure, the columns are parsed again line by line to
+    # drop the malformed ones
+    try:
+        return list(map(nodetype, src)), list(map(nodetype, dst)), weight
+    except (ValueError, TypeError, OverflowError):
+        pass
+    parsed_src, parsed_dst = [], []
+    parsed_weight = [] if weight is not None else None
+    for i, (u, v) in enumerate(zip(src, dst)):
+        try:
+            u, v = nodetype(u), nodetype(v)
+        except (ValueError, TypeError, OverflowError):
+            stats['malformed'] += 1
+            continue
+        parsed_src.append(u)
+        parsed_dst.append(v)
+        if weight is not None:
+            parsed_weight.append(weight[i])
+    return parsed_src, parsed_dst, parsed_weight
+
+
+def read_edgelist(files, weighted=False, directed=False, workers=1, csr=False, comments='#',
+                  block_size=1 << 26, stats=None, nodetype=None):
+    """
+    Reads one or many edge list files into a single graph, parsing them
+    in parallel.
+
+    Each file is split into byte ranges of at most `block_size` bytes,
+    aligned to line starts, and the ranges are parsed by `workers`
+    processes into arrays of node indices, so that parsing scales with
+    the number of cores. A compressed file (see `parse_edgelist`) is
+    streamed whole by one worker. The arrays are then merged and inserted in bulk.
+    The result is the same as calling ``add_edges_from_file`` on each
+    file in order: node labels are strings (or parsed by `nodetype`), in
+    order of first appearance, neighbors and edges in the order the file
+    lists them, and a repeated edge keeps its first place and its last
+    weight. With `csr`, each row is sorted by node index instead, as in
+    any CSRGraph.
+
+    Parameters
+    ----------
+    files : String or list of String
+        paths of the edge list files, in the format of `parse_edgelist`.
+
+    weighted : boolean
+        if true, the third column is parsed as the edge weight.
+
+    directed : boolean
+        if true, returns a DiGraph, else a Graph.
+
+    workers : int
+        number of processes parsing the ranges.
+
+    csr : boolean
+        if true, returns a read-only CSRGraph built directly from the
+        arrays instead.
+
+    comments : String or None
+        prefix of comment lines.
+
+    block_size : int
+        maximum number of bytes parsed at once by a worker.
+
+    stats : dict or None
+        if given, updated with 'bytes_total', 'lines', 'edges' and
+        'malformed' over all files.
+
+    nodetype : type or callable or None
+        parses the node labels, see `parse_edgelist`. With int, labels are
+        merged as int64 arrays, faster than strings.
+
+    Returns
+    ----------
+    G : Graph, DiGraph or CSRGraph
+    """
+    import numpy as np
+    from OpenGraph.classes import Graph, DiGraph, CSRGraph
+    from OpenGraph.classes.bulk_edges import factorize_labels
+    if isinstance(files, (str, os.PathLike)):
+        files = [files]
+    total = sum(os.path.getsize(file) for file in files)
+    if workers > 1:  # a few ranges per worker to balance the load
+        block_size = min(block_size, max(1 << 20, -(-total // (workers * 4))))
+    ncols = 3 if weighted else 2
+    nodetype = _nodetype(nodetype)
+    ranges = []
+    for file in files:
+        size = os.path.getsize(file)
+        if _compression(file) is not None:  # Not seekable, read by one worker
+            ranges.append((file, 0, size, ncols, comments, nodetype))
+        else:
+            ranges.extend((file, start, min(start + block_size, size), ncols, comments, nodetype)
+                          for start in range(0, size, block_size))
+    if workers > 1 and len(ranges) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(min(workers, len(ranges))) as pool:
+            blocks = list(pool.map(_parse_range, *zip(*ranges)))
+    else:
+        blocks = [_parse_range(*args) for args in ranges]
+
+    if stats is None:
+        stats = dict()
+    stats.update(bytes_total=total, lines=0, edges=0, malformed=0)
+    for block in blocks:
+        for key in ('lines', 'edges', 'malformed'):
+            stats[key] += block[4][key]
+
+    # Local label indices of each range -> indices in the merged labels
+    labels, inverse = factorize_labels(np.concatenate(
+        [_label_array([], nodetype)] + [block[0] for block in blocks]))
+    offsets = np.cumsum([0] + [len(block[0]) for block in blocks])
+    u = np.concatenate([np.empty(0, dtype=np.int64)] +
+                       [inverse[offset + block[1]] for offset, block in zip(offsets, blocks)])
+    v = np.concatenate([np.empty(0, dtype=np.int64)] +
+                       [inverse[offset + block[2]] for offset, block in zip(offsets, blocks)])
+    weight = np.concatenate([np.empty(0)] + [block[3] for block in blocks]) if weighted else None
+
+    if csr:
+        return CSRGraph.from_edge_indices(labels, u, v, weight, directed=directed,
+                                          weight='weight' if weighted else None)
+    G = DiGraph() if directed else Graph()
+    G._add_edges_from_indices(labels, u, v, weight)
+    return G
+
+
+def _label_array(labels, nodetype):
+    # Strings, or the array numpy infers for parsed labels, int64 for ints
+    import numpy as np
+    if nodetype is None:
+        return np.array(labels, dtype=str)
+    if not len(labels):  # promotes to the type of the other ranges
+        return np.empty(0, dtype=np.int64)
+    array = np.array(labels)
+    if array.ndim != 1:  # e.g. tuple labels
+        array = np.empty(len(labels), dtype=object)
+        array[:] = labels
+    return array
+
+
+def _parse_range(file, start, end, ncols, comments, nodetype=None):
+    # Parses the lines of `file` starting in bytes [start, end), returns
+    # 1. labels of the range, in order of first appearance
+    # 2. 3. label index of the sources and targets
+    # 4. weights or None
+    # 5. counts of lines, edges and malformed lines
+    import numpy as np
+    from OpenGraph.classes.bulk_edges import factorize_labels
+    stats = dict(lines=0, edges=0, malformed=0)
+    if _compression(file) is not None:
+        src, dst = [], []
+        weight = [] if ncols == 3 else None
+        for batch in parse_edgelist(file, weighted=ncols == 3, comments=comments, stats=stats,
+                                    nodetype=nodetype):
+            src += batch[0]
+            dst += batch[1]
+            if weight is not None:
+                weight += batch[2]
+    else:
+        with open(file, 'rb') as fp:
+            if start > 0:  # The line running over start belongs to the range before
+                fp.seek(start - 1)
+                fp.readline()
+            position = fp.tell()
+            data = fp.read(end - position) if position < end else b''
+            if data and not data.endswith(b'\n'):  # Finish the last line
+                data += fp.readline()
+        src, dst, weight = _parse_chunk(data.decode(), ncols, comments, stats, nodetype)
+    # Interleaved, so that labels appear in the order add_edge meets them
+    ends = [None] * (2 * len(src))
+    ends[0::2], ends[1::2] = src, dst
+    labels, inverse = factorize_labels(_label_array(ends, nodetype))
+    if weight is not None:
+        weight = np.array(weight, dtype=np.float64)
+    return _label_array(labels, nodetype), inverse[0::2], inverse[1::2], weight, stats
@@ -0,0 +1 @@
+from OpenGraph.sampling.samplers import *
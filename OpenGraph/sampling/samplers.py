@@ -0,0 +1,370 @@
+from collections import deque, namedtuple
+
+import numpy as np
+
+from OpenGraph.classes.csr_graph import CSRGraph, _gather_positions
+
+__all__ = [
+    "Sample",
+    "random_node_sample",
+    "random_edge_sample",
+    "random_walk_sample",
+    "forest_fire_sample",
+    "snowball_sample"
+]
+
+Sample = namedtuple('Sample', ['graph', 'rows'])
+Sample.__doc__ = """
+Result of the samplers.
+
+graph : CSRGraph or SubgraphView
+    the sampled graph, with the node labels of the original graph.
+
+rows : numpy.ndarray
+    row of each node of `graph` in the CSR form of the original graph,
+    so ``rows[i]`` is the original index of ``graph.nodes[i]``.
+"""
+
+
+def random_node_sample(G, n, view=False, random_seed=None):
+    """
+    Returns the subgraph induced by `n` nodes drawn uniformly without
+    replacement.
+
+    Like all samplers, it runs in O(sample size), i.e. the degrees of the
+    sampled nodes, on a CSRGraph. Graph/DiGraph are frozen first, which
+    costs O(graph) on every call, so freeze a graph once with
+    ``G.to_csr()`` to draw several samples.
+
+    Parameters
+    ----------
+    G : Graph, DiGraph or CSRGraph
+
+    n : int
+        number of nodes, at most ``len(G)``.
+
+    view : bool
+        True to return a SubgraphView of `G` instead of a CSRGraph. `G`
+        must then be a Graph or DiGraph.
+
+    random_seed : int or None
+
+    Returns
+    ----------
+    sample : Sample
+    """
+    C, rng = _prepare(G, n, view, random_seed)
+    rows = rng.choice(len(C), size=n, replace=False)
+    return _induced_sample(G, C, rows, view)
+
+
+def random_edge_sample(G, m, induced=False, view=False, random_seed=None):
+    """
+    Returns the subgraph of `m` edges drawn uniformly without
+    replacement, and their endpoints.
+
+    Parameters
+    ----------
+    G : Graph, DiGraph or CSRGraph
+
+    m : int
+        number of edges, at most ``G.number_of_edges()``.
+
+    induced : bool
+        True to return the subgraph induced by the endpoints instead,
+        which also holds the edges between them that were not drawn.
+
+    view : bool
+        True to return a SubgraphView of `G`, which needs `induced`.
+
+    random_seed : int or None
+
+    Returns
+    ----------
+    sample : Sample
+    """
+    if view and not induced:
+        raise ValueError("A view of G holds every edge between its nodes, use induced=True.")
+    C, rng = _prepare(G, 0, view, random_seed)
+    num_edges = C.number_of_edges()
+    if not 0 <= m <= num_edges:
+        raise ValueError("m must be between 0 and {}, not {}.".format(num_edges, m))
+    if C.is_directed():
+        positions = rng.choice(len(C.indices), size=m, replace=False)
+    else:
+        # Each edge is stored in both rows, a self-loop once: drawing from
+        # the edges with u <= v counts each one once
+        positions = _undirected_edge_positions(C, m, rng)
+    u = np.searchsorted(C.indptr, positions, side='right') - 1
+    v = C.indices[positions].astype(np.int64)
+    rows, inverse = np.unique(np.concatenate([u, v]), return_inverse=True)
+    if induced:
+        return _induced_sample(G, C, rows, view)
+    labels = _labels(C, rows)
+    weight = _weight_key(C)
+    weights = C.weights[positions] if weight is not None else None
+    H = CSRGraph.from_edge_indices(labels, inverse[:m], inverse[m:], weights,
+                                   directed=C.is_directed(), weight=weight)
+    H.graph.update(C.graph)
+    return Sample(H, rows)
+
+
+def random_walk_sample(G, n, restart=0.15, max_steps=None, view=False, random_seed=None):
+    """
+    Returns the subgraph induced by the first `n` distinct nodes visited
+    by a random walk with restarts, which favors well connected nodes and
+    keeps neighborhoods together, unlike `random_node_sample`.
+
+    The walk starts at a random node and goes back to it with probability
+    `restart` at each step. It jumps to a new random start at dead ends
+    and after `n` steps without a new node, e.g. when the component
+    of the start is smaller than `n`. Directed walks follow out-edges.
+
+    Parameters
+    ----------
+    G : Graph, DiGraph or CSRGraph
+
+    n : int
+        number of nodes, at most ``len(G)``.
+
+    restart : float
+        probability of going back to the start at each step.
+
+    max_steps : int or None
+        bound on the total number of steps, None for ``100 * n``. The
+        sample is smaller than `n` if the walk runs out of steps.
+
+    view : bool
+        True to return a SubgraphView of `G`, which must then be a Graph
+        or DiGraph.
+
+    random_seed : int or None
+
+    Returns
+    ----------
+    sample : Sample
+    """
+    C, rng = _prepare(G, n, view, random_seed)
+    if max_steps is None:
+        max_steps = 100 * n
+    indptr, indices = C.indptr, C.indices
+    seen = set()
+    visited = []
+    start = current = None
+    stale = 0
+    # Random numbers are drawn in batches, one draw per step is slow
+    coins, picks = rng.random(0), rng.random(0)
+    for step in range(max_steps):
+        if len(visited) >= n:
+            break
+        if step % 1024 == 0:
+            coins, picks = rng.random(1024), rng.random(1024)
+        if current is None or stale > n:
+            start = current = int(rng.integers(len(C)))
+            stale = 0
+        elif coins[step % 1024] < restart:
+            current = start
+        else:
+            begin, end = int(indptr[current]), int(indptr[current + 1])
+            if begin == end:  # dead end
+                current = None
+                continue
+            current = int(indices[begin + int(picks[step % 1024] * (end - begin))])
+        if current in seen:
+            stale += 1
+        else:
+            seen.add(current)
+            visited.append(current)
+            stale = 0
+    return _induced_sample(G, C, np.array(visited, dtype=np.int64), view)
+
+
+def forest_fire_sample(G, n, p_forward=0.7, view=False, random_seed=None):
+    """
+    Returns the subgraph induced by the first `n` nodes burned by forest
+    fire sampling, which keeps the degree distribution and community
+    structure of the graph better than random nodes or edges.
+
+    The fire starts at a random node. Each burning node burns a
+    geometric number, of mean ``p_forward / (1 - p_forward)``, of its
+    unburned neighbors (out-neighbors if directed) picked at random, which
+    burn in turn. A fire that dies out restarts at a random node.
+
+    Parameters
+    ----------
+    G : Graph, DiGraph or CSRGraph
+
+    n : int
+        number of nodes, at most ``len(G)``.
+
+    p_forward : float
+        forward burning probability, in [0, 1).
+
+    view : bool
+        True to return a SubgraphView of `G`, which must then be a Graph
+        or DiGraph.
+
+    random_seed : int or None
+
+    Returns
+    ----------
+    sample : Sample
+    """
+    if not 0 <= p_forward < 1:
+        raise ValueError("p_forward must be in [0, 1), not {}.".format(p_forward))
+    C, rng = _prepare(G, n, view, random_seed)
+
+    def spread(row, unburned):
+        count = rng.geometric(1 - p_forward) - 1
+        if count >= len(unburned):
+            return unburned
+        return rng.choice(unburned, size=count, replace=False)
+
+    return _spread_sample(G, C, n, spread, rng, view)
+
+
+def snowball_sample(G, n, k=None, view=False, random_seed=None):
+    """
+    Returns the subgraph induced by the first `n` nodes reached by
+    snowball sampling: a breadth-first search from a random node in which
+    each node brings in at most `k` of its new neighbors (out-neighbors if
+    directed), picked at random. The search restarts at a random node if
+    it runs out of nodes.
+
+    Parameters
+    ----------
+    G : Graph, DiGraph or CSRGraph
+
+    n : int
+        number of nodes, at most ``len(G)``.
+
+    k : int or None
+        neighbors brought in by each node, None for all of them.
+
+    view : bool
+        True to return a SubgraphView of `G`, which must then be a Graph
+        or DiGraph.
+
+    random_seed : int or None
+
+    Returns
+    ----------
+    sample : Sample
+    """
+    C, rng = _prepare(G, n, view, random_seed)
+
+    def spread(row, unseen):
+        if k is None or len(unseen) <= k:
+            return unseen
+        return rng.choice(unseen, size=k, replace=False)
+
+    return _spread_sample(G, C, n, spread, rng, view)
+
+
+def _prepare(G, n, view, random_seed):
+    if view and not hasattr(G, '_node'):
+        raise ValueError("view=True needs a Graph or DiGraph, not a {}.".format(type(G).__name__))
+    if isinstance(G, CSRGraph):
+        C = G
+    else:
+        # Keep weights only if the graph has some, so that the edges of an
+        # unweighted graph do not come back as {'weight': 1.0}
+        has_weights = any('weight' in attr for nbrs in G._adj.values() for attr in nbrs.values())
+        C = G.to_csr(weight='weight' if has_weights else None)
+    if not 0 <= n <= len(C):
+        raise ValueError("n must be between 0 and {}, not {}.".format(len(C), n))
+    return C, np.random.default_rng(random_seed)
+
+
+def _spread_sample(G, C, n, spread, rng, view):
+    # Breadth-first spread from random starts, `spread(row, candidates)`
+    # choosing which of the new neighbors of `row` join the sample
+    indptr, indices = C.indptr, C.indices
+    seen = set()
+    sampled = []
+    queue = deque()
+    while len(sampled) < n:
+        if not queue:
+            # Restart at a random unseen node, a few draws as long as the
+            # sample is a small part of the graph
+            row = int(rng.integers(len(C)))
+            while row in seen:
+                row = int(rng.integers(len(C)))
+            seen.add(row)
+            sampled.append(row)
+            queue.append(row)
+            continue
+        row = queue.popleft()
+        neighbors = indices[indptr[row]:indptr[row + 1]].tolist()
+        new = [v for v in neighbors if v not in seen]
+        for v in np.asarray(spread(row, new), dtype=np.int64).tolist():
+            if len(sampled) == n:
+                break
+            seen.add(v)
+            sampled.append(v)
+            queue.append(v)
+    return _induced_sample(G, C, np.array(sampled, dtype=np.int64), view)
+
+
+def _undirected_edge_positions(C, m, rng):
+    # m distinct positions of edges (u, v) with u <= v, by rejection:
+    # about half of the stored entries qualify, so few rounds are needed
+    chosen = np.empty(0, dtype=np.int64)
+    while len(chosen) < m:
+        draw = rng.integers(len(C.indices), size=2 * (m - len(chosen)) + 16)
+        u = np.searchsorted(C.indptr, draw, side='right') - 1
+        chosen = np.concatenate([chosen, draw[u <= C.indices[draw]]])
+        _, first = np.unique(chosen, return_index=True)
+        chosen = chosen[np.sort(first)]  # distinct, in order of drawing
+    return chosen[:m]
+
+
+def _labels(C, rows):
+    nodes = C.nodes
+    return [nodes[i] for i in rows.tolist()]
+
+
+def _induced_sample(G, C, rows, view):
+    # Subgraph of C induced by `rows`, reading only their own rows
+    if view:
+        from OpenGraph.classes.subgraph_view import SubgraphView
+        view = SubgraphView(G, _labels(C, rows))
+        # The view lists its nodes in the order of G
+        index_of_node = C.index_of_node
+        return Sample(view, np.array([index_of_node[node] for node in view.nodes], dtype=np.int64))
+    sorter = np.argsort(rows)
+    sorted_rows = rows[sorter]
+    index_dtype = np.int32 if len(rows) < 2 ** 31 else np.int64
+    arrays = []
+    for indptr, indices, weights in _row_arrays(C):
+        starts = indptr[rows].astype(np.int64)
+        positions, offsets = _gather_positions(starts, indptr[rows + 1] - starts)
+        cols = indices[positions].astype(np.int64)
+        found = np.minimum(np.searchsorted(sorted_rows, cols), max(len(rows) - 1, 0))
+        keep = sorted_rows[found] == cols if len(rows) else np.zeros(0, dtype=bool)
+        local_cols = sorter[found[keep]]
+        row_ids = np.repeat(np.arange(len(rows), dtype=np.int64), np.diff(offsets))[keep]
+        order = np.lexsort((local_cols, row_ids))  # rows sorted by index
+        new_indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(row_ids, minlength=len(rows)), out=new_indptr[1:])
+        arrays.append((new_indptr, local_cols[order].astype(index_dtype), weights[positions][keep][order]))
+    (indptr, indices, weights), in_arrays = arrays[0], arrays[1:]
+    in_indptr, in_indices, in_weights = in_arrays[0] if in_arrays else (None, None, None)
+    H = CSRGraph(indptr, indices, weights, nodes=_labels(C, rows), directed=C.is_directed(),
+                 in_indptr=in_indptr, in_indices=in_indices, in_weights=in_weights,
+                 weight=_weight_key(C), **C.graph)
+    return Sample(H, rows)
+
+
+def _weight_key(C):
+    # None if C was built without weights, they are then all 1 and shared
+    if C.weight is None or C.weights.strides == (0,):
+        return None
+    return C.weight
+
+
+def _row_arrays(C):
+    arrays = [(C.indptr, C.indices, C.weights)]
+    if C.is_directed():
+        arrays.append((C.in_indptr, C.in_indices, C.in_weights))
+    return arrays
@@ -0,0 +1,661 @@
+import OpenGraph as og
+
+
+def _recount_degree(G, weight='weight'):
+    # Reference degree, summed straight from the adjacency
+    degree = dict.fromkeys(G.nodes, 0)
+    for u, nbrs in G.adj.items():
+        for v, d in nbrs.items():
+            w = d.get(weight, 1)
+            degree[u] += w + w if u == v else w
+    return degree
+
+
+def test_degree_index_follows_mutations():
+    g = og.Graph()
+    g.add_edges([(1, 2), (2, 3), (3, 1), (3, 4)])
+    assert g.degree(weight=None) == {1: 2, 2: 2, 3: 3, 4: 1}
+    assert g.degree(weight='weight', node=3) == 3
+
+    g.add_edge(1, 2, weight=5)
+    g.add_edge(4, 4)
+    g.add_node(5)
+    assert g.degree(weight='weight') == _recount_degree(g)
+    assert g.size(weight='weight') == 9
+    assert g.number_of_edges() == 5
+
+    g.remove_edge(2, 3)
+    g.remove_node(4)
+    assert g.degree(weight='weight') == _recount_degree(g)
+    assert g.degree(weight=None) == _recount_degree(g, weight=None)
+    assert g.number_of_edges() == 2
+
+
+def test_directed_degree_index_follows_mutations():
+    g = og.DiGraph()
+    g.add_edges([(1, 2), (2, 3), (3, 1), (3, 3)])
+    assert g.out_degree(weight=None) == {1: 1, 2: 1, 3: 2}
+    assert g.in_degree(weight=None) == {1: 1, 2: 1, 3: 2}
+
+    g.add_edge(1, 2, weight=4)
+    assert g.size(weight='weight') == 7
+    g.remove_node(3)
+    assert g.out_degree(weight='weight') == {1: 4, 2: 0}
+    assert g.in_degree(weight='weight') == {1: 0, 2: 4}
+    assert g.number_of_edges() == 1
+
+
+def test_edge_view():
+    g = og.Graph()
+    g.add_edges([(1, 2), (2, 3), (3, 3)], [{'weight': 2}, {}, {}])
+    assert list(g.edges) == [(1, 2, {'weight': 2}), (2, 3, {}), (3, 3, {})]
+    assert list(g.edges(data=False)) == [(1, 2), (2, 3), (3, 3)]
+    assert list(g.edges(weight='weight')) == [(1, 2, 2), (2, 3, 1), (3, 3, 1)]
+    assert len(g.edges) == 3
+    assert (2, 1) in g.edges and (1, 3) not in g.edges
+    assert (1, 2, 2) in g.edges(weight='weight')
+
+    dg = og.DiGraph()
+    dg.add_edges([(1, 2), (2, 1), (2, 3)])
+    assert list(dg.edges(data=False)) == [(1, 2), (2, 1), (2, 3)]
+    assert len(dg.edges) == 3
+    assert (3, 2) not in dg.edges
+
+
+def test_csr_snapshot_is_drop_in():
+    g = og.Graph()
+    g.add_edges([(1, 2), (2, 3), (4, 5), (5, 5)], [{'weight': 3}, {}, {}, {}])
+    g.add_node(6)
+    c = g.freeze()
+    assert list(c.indptr) == [0, 1, 3, 4, 5, 7, 7]
+    assert list(c.indices) == [1, 0, 2, 1, 4, 3, 4]
+    assert c.degree() == g.degree()
+    assert c.degree(weight=None) == g.degree(weight=None)
+    assert all(c.degree(node=n) == g.degree()[n] for n in g)
+    assert all(c.degree(weight=None, node=n) == g.degree(weight=None)[n] for n in g)
+    assert c.size(weight='weight') == g.size(weight='weight')
+    assert c.number_of_edges() == 4
+    thawed = c.copy()  # one change per node and per edge
+    assert {u: list(row) for u, row in thawed.adj.items()} == {u: list(row) for u, row in g.adj.items()}
+    assert thawed[2][1] == {'weight': 3.0} and thawed.version == len(g) + g.number_of_edges()
+    assert c[1][2].get('weight', 1) == 3 and c.has_edge(2, 1)
+    assert list(c.edges(data=False)) == list(g.edges(data=False))
+    components = og.functions.connected_components(c)
+    assert sorted(map(sorted, components)) == [[1, 2, 3], [4, 5], [6]]
+    many = og.Graph()
+    many.add_edges([(i, i + 1) for i in range(0, 600, 3)] + [(2, 598), (7, 700)])
+    assert og.functions.connected_components(many.to_csr()) == \
+        og.functions.connected_components(many)
+
+    dg = og.DiGraph()
+    dg.add_edges([(1, 2), (3, 2)])
+    dc = dg.to_csr()
+    assert dc.out_degree(weight=None) == dg.out_degree(weight=None)
+    assert dc.in_degree(weight=None) == dg.in_degree(weight=None)
+    assert dc.out_degree(node=3) == 1 and dc.in_degree(node=2) == 2 and dc.degree(node=2) == 2
+    assert sorted(dc.predecessors(2)) == [1, 3]
+
+
+def test_add_edges_from_arrays():
+    import numpy as np
+    g = og.Graph()
+    g.add_edge(1, 2, weight=7)
+    g.degree()
+    g.add_edges_from_arrays(np.array([2, 3, 3, 4, 4]), np.array([1, 4, 4, 3, 4]),
+                            weight=np.array([1., 2., 3., 4., 5.]))
+    assert list(g.nodes) == [1, 2, 3, 4]
+    assert g[1][2] == {'weight': 1.} and g[2][1] is g[1][2]
+    assert g[3][4] == {'weight': 4.} and g[4][4] == {'weight': 5.}
+    assert g.degree() == {1: 1., 2: 1., 3: 4., 4: 14.}
+    assert g.number_of_edges() == 3
+
+    dg = og.DiGraph()
+    dg.add_edges_from_arrays(np.array(['a', 'b', 'a'], dtype=object),
+                             np.array(['b', 'a', 'b'], dtype=object))
+    assert list(dg.edges(data=False)) == [('a', 'b'), ('b', 'a')]
+    assert sorted(dg.predecessors('b')) == ['a']
+
+
+def test_add_edges_from_file_streams_and_counts_malformed(tmp_path):
+    path = tmp_path / "edges.txt"
+    path.write_text("# comment\n1 2 0.5\n2 3\n\n3 4 x\n4 5 2\n5 6 1.0\n6 7 3")
+    g = og.Graph()
+    stats = g.add_edges_from_file(str(path), weighted=True, chunk_size=7)
+    assert (stats['edges'], stats['malformed']) == (4, 2)
+    assert list(g.edges(weight='weight')) == [('1', '2', 0.5), ('4', '5', 2.), ('5', '6', 1.), ('6', '7', 3.)]
+
+    dg = og.DiGraph()
+    stats = dg.add_edges_from_file(str(path))
+    assert (stats['edges'], stats['malformed']) == (6, 0)
+    assert dg.number_of_edges() == 6
+
+
+def test_binary_round_trip(tmp_path):
+    import numpy as np
+    dg = og.DiGraph()
+    dg.add_edges([('a', 'b'), ('b', 'c'), ('c', 'a')], [{'weight': 2.}, {}, {}])
+    dg.add_node('z')
+    og.save_binary(dg, str(tmp_path / "dg.ogb"))
+    for mmap in (True, False):
+        c = og.load_binary(str(tmp_path / "dg.ogb"), mmap=mmap)
+        assert isinstance(c.indices, np.memmap) == mmap
+        assert c.nodes == ['a', 'b', 'c', 'z'] and c.is_directed()
+        assert c.out_degree() == dg.out_degree() and c.in_degree() == dg.in_degree()
+
+    g = og.Graph()
+    g.add_edges([(5, 1), (1, 2)])
+    og.save_binary(g, str(tmp_path / "g.ogb"), weight=None)
+    c = og.load_binary(str(tmp_path / "g.ogb"))
+    assert c.nodes == [5, 1, 2] and c.weight is None
+    assert list(c.edges(data=False)) == list(g.edges(data=False))
+
+    # The header is JSON, pickle only on request
+    import json
+    import pytest
+    import struct
+    with open(str(tmp_path / "dg.ogb"), 'rb') as fp:
+        fp.read(8)
+        header = json.loads(fp.read(struct.unpack('<Q', fp.read(8))[0]).decode())
+    assert header['node_format'] == 'json' and header['labels'] == ['a', 'b', 'c', 'z']
+    t = og.Graph(name='tuples')
+    t.add_edges([((0, 1), (1, 0))])
+    with pytest.raises(ValueError):
+        og.save_binary(t, str(tmp_path / "t.ogb"))
+    og.save_binary(t, str(tmp_path / "t.ogb"), allow_pickle=True)
+    with pytest.raises(ValueError):
+        og.load_binary(str(tmp_path / "t.ogb"))
+    c = og.load_binary(str(tmp_path / "t.ogb"), allow_pickle=True)
+    assert c.nodes == [(0, 1), (1, 0)] and c.graph == {'name': 'tuples'}
+
+
+def test_node_index_is_kept_incrementally():
+    g = og.Graph()
+    g.add_edges([('a', 'b'), ('b', 'c')])
+    index_of_node = g.index_of_node
+    assert index_of_node == {'a': 0, 'b': 1, 'c': 2}
+    g.remove_node('b')
+    g.add_node('d')
+    assert g.index_of_node is index_of_node
+    assert index_of_node == {'a': 0, 'c': 2, 'd': 3}
+    assert g.node_of_index == ['a', None, 'c', 'd']
+
+    idx2node, node2idx = og.utils.get_relation_of_index_and_node(g)
+    assert idx2node == ['a', 'c', 'd'] and node2idx == {'a': 0, 'c': 1, 'd': 2}
+    idx2node.append('x')
+    node2idx['x'] = 3  # copies, the tables of g are untouched
+    assert g.node_of_index == ['a', 'c', 'd'] and 'x' not in g.index_of_node
+    view = og.SubgraphView(g, ['d', 'a'])
+    assert og.utils.get_relation_of_index_and_node(view) == (['a', 'd'], {'a': 0, 'd': 1})
+    assert og.utils.to_numpy_matrix(view).tolist() == [[0., 0.], [0., 0.]]
+    from OpenGraph.functions import pagerank
+    assert sorted(pagerank(view)) == ['a', 'd']
+    G_index, index_of_node, node_of_index = g.to_index_node_graph()
+    index_of_node['x'] = 3  # a copy, the table of g is untouched
+    assert 'x' not in g.index_of_node
+    G_index, index_of_node, node_of_index = g.to_index_node_graph()
+    assert list(G_index.nodes) == [0, 1, 2] and node_of_index == {0: 'a', 1: 'c', 2: 'd'}
+
+    dg = og.DiGraph()
+    dg.add_edges([(3, 1), (1, 2)])
+    dg.remove_node(1)
+    assert og.utils.to_numpy_matrix(dg).tolist() == [[0., 0.], [0., 0.]]
+    assert dg.index_of_node == {3: 0, 2: 1}
+
+
+def test_subgraph_view_filters_without_copying():
+    g = og.Graph()
+    g.add_edges([(1, 2), (2, 3), (3, 4), (2, 2)], [{'weight': 2}, {}, {}, {}])
+    view = og.SubgraphView(g, [1, 2, 3, 9])
+    assert list(view) == [1, 2, 3] and len(view) == 3
+    assert sorted(view[2]) == [1, 2, 3] and 4 not in view[3]
+    assert view[1][2] is g[1][2]
+    assert view.degree(weight=None) == {1: 1, 2: 4, 3: 1}
+    assert view.size(weight='weight') == 4 and view.number_of_edges() == 3
+    assert len(list(view.edges)) == 3
+    assert og.functions.connected_components(view.nodes_subgraph([1, 3])) == [{1}, {3}]
+
+    g.add_edge(1, 3)
+    assert view.has_edge(3, 1)
+    H = view.copy()
+    assert isinstance(H, og.Graph) and H.number_of_edges() == 4
+
+    dg = og.DiGraph()
+    dg.add_edges([(1, 2), (2, 3), (3, 1)])
+    dview = og.SubgraphView(dg, [1, 2])
+    assert dview.out_degree(weight=None) == {1: 1, 2: 0}
+    assert dview.in_degree(weight=None) == {1: 0, 2: 1}
+    assert sorted(dview.all_neighbors(2)) == [1]
+
+
+def test_subgraph_view_order_and_csr(tmp_path):
+    import math
+    from OpenGraph.functions.structural_holes.evaluation import effective_size, constraint
+    g = og.Graph()
+    g.add_edges([(5, 1), (1, 4), (4, 2), (2, 5), (3, 1), (3, 4), (2, 6)])
+    view, copy = og.SubgraphView(g, [4, 3, 1, 2]), g.nodes_subgraph([4, 3, 1, 2])
+    assert list(view) == list(copy) == [1, 4, 2, 3]
+    assert all(list(view[u]) == list(copy[u]) for u in copy)
+    lazy = g.copy(lazy=True)
+    lazy_view = og.SubgraphView(lazy, [4, 3, 1, 2])
+    assert list(lazy_view) == [1, 4, 2, 3] and lazy._node_index is None
+    assert list(lazy_view[1]) == [4, 3]
+    lazy.remove_edge(1, 4)
+    lazy.add_edge(1, 2)  # the cached row order follows the changes
+    assert list(lazy_view[1]) == [3, 2] and list(lazy_view[4]) == [2, 3]
+    og.save_binary(g, str(tmp_path / 'g.bin'))
+    for h in (g.to_csr(), og.load_binary(str(tmp_path / 'g.bin'), mmap=True)):
+        assert list(og.SubgraphView(h, [4, 3, 1, 2])) == [1, 4, 2, 3]
+        for func in (effective_size, constraint):
+            expected, result = func(g), func(h)
+            assert all(math.isclose(expected[v], result[v]) for v in g)
+
+
+def test_copy_on_write():
+    g = og.Graph()
+    g.add_edges([(1, 2), (2, 3), (3, 1)], [{'weight': 2}, {}, {}])
+    g.add_node(1, color='red')
+    h = g.copy(lazy=True)
+    assert h[1] is g[1]
+    h.remove_node(2)
+    h.add_edge(3, 1, weight=5)
+    h.add_node(1, color='blue')
+    assert sorted(g[2]) == [1, 3] and g[1][3] == {} and g.nodes[1] == {'color': 'red'}
+    assert list(h.edges) == [(1, 3, {'weight': 5})] and h.nodes[1] == {'color': 'blue'}
+    g.remove_edge(1, 3)
+    assert h.has_edge(3, 1) and not g.has_edge(1, 3)
+    assert h.degree() == {1: 5, 3: 5} and g.degree() == {1: 2, 2: 3, 3: 1}
+
+    dg = og.DiGraph()
+    dg.add_edges([(1, 2), (2, 3), (3, 3)])
+    dh = dg.copy(lazy=True)
+    dh.remove_node(3)
+    assert list(dg.predecessors(3)) == [2, 3] and dg.number_of_edges() == 3
+    assert list(dh.edges(data=False)) == [(1, 2)]
+
+
+def test_copy_is_independent():
+    for g in (og.Graph(), og.DiGraph()):
+        g.add_edges([(1, 2), (2, 3), (3, 3)], [{'weight': 1}, {}, {}])
+        g.add_node(1, label='a')
+        h = g.copy()
+        h[1][2]['weight'] = 999
+        h.nodes[1]['label'] = 'b'
+        assert g[1][2] == {'weight': 1} and g.nodes[1] == {'label': 'a'}
+        assert h.adj == {1: {2: {'weight': 999}}, 2: {3: {}}, 3: {3: {}}} if g.is_directed() \
+            else h[2][1] is h[1][2] and h[3][3] == {}
+        assert h.degree(weight=None) == g.degree(weight=None) and h.version == g.version
+
+
+def test_compact_graph_shares_one_empty_attr():
+    import pytest
+    g = og.CompactGraph()
+    g.add_edges([(1, 2), (2, 3), (3, 3)])
+    assert g[1][2] is g[2][3] is g.nodes[1]
+    assert g[1][2].get('weight', 1) == 1 and g[1][2] == {}
+    assert g.degree() == {1: 1, 2: 2, 3: 3} and g.size() == 3
+    with pytest.raises(ValueError):
+        g.add_edge(1, 4, weight=2)
+    assert 4 not in g
+    h = g.copy()
+    h.remove_node(2)
+    assert isinstance(h, og.CompactGraph) and g.number_of_edges() == 3
+
+    dg = og.CompactDiGraph()
+    dg.add_edges([(1, 2), (2, 1)])
+    assert dg.out_degree(weight=None) == {1: 1, 2: 1} and dg[2][1] is dg[1][2]
+
+
+def test_directed_per_node_queries():
+    dg = og.DiGraph()
+    dg.add_edges([(1, 2), (2, 1), (2, 3), (3, 3)], [{'weight': 4}, {}, {}, {}])
+    assert dg.nodes is dg._node
+    assert dg.out_degree(weight='weight', node=1) == 4
+    assert dg.in_degree(weight=None, node=3) == 2 and dg.degree(weight=None, node=2) == 3
+    assert list(dg.all_neighbors(2)) == [1, 3] and list(dg.all_neighbors(3)) == [3, 2]
+    dg.out_degree()
+    assert dg.out_degree(node=1) == 4 and dg.degree(node=3) == 3
+    assert dg.degree(weight=None) == {1: 2, 2: 3, 3: 3}
+
+    g = og.Graph()
+    g.add_edges([(1, 2), (2, 2)], [{'weight': 3}, {}])
+    assert g.degree(weight=None, node=2) == 3 and g.degree(node=2) == 5
+
+
+def test_memory_usage_breakdown():
+    g = og.Graph()
+    g.add_edges([(1, 2), (2, 3)], [{'weight': 2.5}, {}])
+    usage = g.memory_usage()
+    assert set(usage) == {'nodes', 'adjacency', 'edge_attrs', 'graph_attrs', 'indexes', 'total'}
+    assert usage['total'] == sum(size for key, size in usage.items() if key != 'total')
+    assert usage['edge_attrs'] > 0 and g.memory_usage(deep=False)['total'] < usage['total']
+    assert og.CompactGraph().memory_usage()['edge_attrs'] == 0
+
+    c = g.to_csr()
+    assert c.memory_usage()['arrays'] == c.indptr.nbytes + c.indices.nbytes + c.weights.nbytes
+    assert og.utils.memory_usage([[1, 2], [2, 3]]) > 0
+    assert og.utils.memory_usage(g) == usage['total']
+
+
+def test_journal_records_changes_since_version():
+    import numpy as np
+    import pytest
+    g = og.Graph()
+    g.add_edge(1, 2)
+    assert g.version == 3 and g.copy().version == 3
+    with pytest.raises(ValueError):
+        g.changes_since(0)
+    g.enable_journal()
+    v = g.version
+    g.add_edge(2, 3, weight=2)
+    g.add_edge(1, 2)
+    g.remove_node(2)
+    changes = g.changes_since(v)
+    assert [(c.op, c.u, c.v) for c in changes] == [
+        ('add_node', 3, None), ('add_edge', 2, 3), ('remove_edge', 2, 1),
+        ('remove_edge', 2, 3), ('remove_node', 2, None)]
+    assert changes[1].attr == {'weight': 2} and changes[-1].version == g.version
+    assert g.changes_since(g.version) == []
+
+    dg = og.DiGraph()
+    dg.enable_journal(maxlen=2)
+    dg.add_edges_from_arrays(np.array([1, 2]), np.array([2, 3]))
+    assert [c.op for c in dg.changes_since(dg.version - 2)] == ['add_edge', 'add_edge']
+    with pytest.raises(ValueError):
+        dg.changes_since(0)
+
+
+def test_shared_memory_graph():
+    import pickle
+    g = og.Graph()
+    g.add_edges([('a', 'b'), ('b', 'c')], [{'weight': 2}, {}])
+    with g.to_shared_memory() as handle:
+        worker_handle = pickle.loads(pickle.dumps(handle))
+        c = worker_handle.attach()
+        assert worker_handle.attach() is c and c.nodes == ['a', 'b', 'c']
+        assert c['a']['b'] == {'weight': 2.0} and c.degree(weight=None) == {'a': 1, 'b': 2, 'c': 1}
+        assert not c.indices.flags.writeable and c.memory_usage()['arrays'] == 0
+
+    dg = og.DiGraph()
+    dg.add_edges([(5, 7), (7, 9)])
+    with dg.to_csr().to_shared_memory() as handle:
+        c = pickle.loads(pickle.dumps(handle)).attach()
+        assert c.nodes == [5, 7, 9] and list(c.predecessors(7)) == [5]
+
+
+def test_read_edgelist_in_byte_ranges(tmp_path):
+    first, second = tmp_path / 'part-0.txt', tmp_path / 'part-1.txt'
+    first.write_text('# comment\n1 2 0.5\n2 3 1.5\nbad\n3 1 2\n')
+    second.write_text('3 4 1\n2 1 4')
+    g = og.Graph()
+    for path in (first, second):
+        g.add_edges_from_file(str(path), weighted=True)
+    stats = {}
+    for workers, block_size in [(1, 1 << 20), (2, 7)]:
+        h = og.read_edgelist([str(first), str(second)], weighted=True, workers=workers,
+                             block_size=block_size, stats=stats)
+        assert list(h.nodes) == list(g.nodes) and h.adj == g.adj
+        assert stats['edges'] == 5 and stats['malformed'] == 1
+    c = og.read_edgelist(str(first), directed=True, csr=True, block_size=5)
+    assert c.nodes == ['1', '2', '3'] and c['1']['2'] == {} and list(c.predecessors('1')) == ['3']
+
+
+def test_compressed_edge_lists(tmp_path):
+    import bz2
+    import gzip
+    import lzma
+    text = b'# comment\n1 2 0.5\n2 3 1.5\n3 1 2\n'
+    plain = tmp_path / 'edges.txt'
+    plain.write_bytes(text)
+    g = og.Graph()
+    g.add_edges_from_file(str(plain), weighted=True)
+    for name, compress in [('edges.txt.gz', gzip.compress), ('edges.bz2', bz2.compress),
+                           ('edges.dat', lzma.compress)]:
+        path = tmp_path / name
+        path.write_bytes(compress(text))
+        h = og.Graph()
+        stats = h.add_edges_from_file(str(path), weighted=True, chunk_size=8)
+        assert h.adj == g.adj and stats['edges'] == 3
+        assert stats['bytes_read'] == stats['bytes_total'] == len(path.read_bytes())
+        assert og.read_edgelist([str(path), str(plain)], weighted=True, workers=2).adj == g.adj
+
+
+def test_batch_queries():
+    import numpy as np
+    g = og.Graph()
+    g.add_edges([(10, 20), (20, 30), (30, 30)], [{'weight': 2}, {}, {'weight': 4}])
+    c = g.to_csr()
+    for G in (g, c):
+        assert G.has_edges([10, 20, 10, 99], [20, 10, 30, 10]).tolist() == [True, True, False, False]
+        assert G.degrees_of([10, 30], weight=None).tolist() == [1, 3]
+        assert G.degrees_of(np.array([20, 30])).tolist() == [3, 9]
+        neighbors, offsets = G.neighbors_of([20, 30])
+        assert offsets.tolist() == [0, 2, 4] and sorted(neighbors[:2].tolist()) == [10, 30]
+    assert c.rows_of(np.array([30, 10, 5])).tolist() == [2, 0, -1]
+
+    dg = og.DiGraph()
+    dg.add_edges([('a', 'b'), ('b', 'c')])
+    dc = dg.to_csr()
+    for G in (dg, dc):
+        assert G.has_edges(['a', 'b'], ['b', 'a']).tolist() == [True, False]
+        assert G.degrees_of(['b'], weight=None).tolist() == [2]
+        assert G.neighbors_of(['a', 'c'])[0].tolist() == ['b']
+
+
+def test_columnar_edge_attributes():
+    import pytest
+    for cls, base in [(og.ColumnarGraph, og.Graph), (og.ColumnarDiGraph, og.DiGraph)]:
+        g, h = cls(), base()
+        for G in (g, h):
+            G.add_edges([(1, 2), (2, 3), (3, 1), (3, 4)], [{'weight': 2.}, {}, {'weight': 4.}, {}])
+            G.remove_node(2)
+            G.add_edge(5, 1, weight=0.5)
+        assert {u: {v: dict(d) for v, d in row.items()} for u, row in g.adj.items()} == h.adj
+        assert g.degree() == h.degree() and g.degree(weight=None) == h.degree(weight=None)
+        assert g.size(weight='weight') == h.size(weight='weight')
+        src, dst, weights = g.edge_arrays()
+        nodes = g.node_of_index
+        assert len(src) == h.number_of_edges()
+        assert all(h[nodes[u]][nodes[v]].get('weight', 1) == w for u, v, w in zip(src, dst, weights))
+        with pytest.raises(ValueError):
+            g.add_edge(1, 4, color='red')
+        c = g.copy()
+        c[3][1]['weight'] = 8.
+        assert g[3][1]['weight'] == 4.
+        g.enable_concurrency()
+        assert g.snapshot().adj == g.adj and g.copy(lazy=True).adj == g.adj
+
+    from OpenGraph.functions.structural_holes import common_greedy
+    g, h = og.ColumnarGraph(), og.Graph()
+    for G in (g, h):
+        G.add_edges([(i, (i * 3 + 1) % 12) for i in range(12)] + [(0, 6), (2, 9)])
+    assert common_greedy(g, 2) == common_greedy(h, 2)
+
+
+def test_lazy_import():
+    import os
+    import subprocess
+    import sys
+    code = ("import sys, OpenGraph as og\n"
+            "assert not {'numpy', 'tensorflow', 'gensim', 'sklearn'} & set(sys.modules)\n"
+            "assert og.functions.pagerank and 'numpy' not in sys.modules\n"
+            "assert og.CSRGraph is og.classes.csr_graph.CSRGraph\n"
+            "assert 'tensorflow' not in sys.modules and 'sklearn' not in sys.modules\n")
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    subprocess.run([sys.executable, '-c', code], env=dict(os.environ, PYTHONPATH=root), check=True)
+    assert 'load_binary' in dir(og) and callable(og.functions.connected_components)
+    assert og.functions.connected is og.functions.components.connected
+    assert og.functions.evaluation.constraint is og.functions.constraint
+    assert og.graph.Graph is og.Graph and 'positioning' in dir(og.functions)
+    assert 'lazy_import' not in dir(og) + dir(og.functions) + dir(og.classes)
+
+
+def test_result_cache():
+    from OpenGraph.functions import pagerank, connected_components
+    g = og.Graph()
+    g.add_edges([(1, 2), (2, 3), (4, 5)])
+    og.utils.clear_result_cache()
+    first = pagerank(g)
+    assert pagerank(g) == first and og.utils.result_cache_info()['hits'] == 1
+    first[1] = 0  # callers get copies, the cached results stay intact
+    components = connected_components(g)
+    expected = [set(component) for component in components]
+    components[0].add(6)
+    components.append({7})
+    assert pagerank(g)[1] != 0 and connected_components(g) == expected
+    assert og.utils.result_cache_info()['hits'] == 3
+    g.add_edge(3, 4)
+    assert pagerank(g) != first and len(connected_components(g)) == 1
+    from OpenGraph.functions.structural_holes import AP_Greedy
+    entries = og.utils.result_cache_info()['entries']
+    AP_Greedy(g, 1)  # its throwaway copies stay out of the cache
+    assert og.utils.result_cache_info()['entries'] == entries
+    og.utils.set_result_cache(maxsize=1)
+    assert og.utils.result_cache_info()['entries'] == 1
+    og.utils.set_result_cache(maxsize=0)
+    assert pagerank(g) == pagerank(g) and og.utils.result_cache_info()['entries'] == 0
+    og.utils.set_result_cache()
+
+
+def test_concurrent_readers_and_writer():
+    import threading
+    g = og.Graph()
+    g.enable_concurrency()
+    errors = []
+
+    def write():
+        for i in range(200):
+            with g.writing():  # every batch adds two edges
+                g.add_edge(i, i + 1)
+                g.add_edge(-i, -i - 1)
+            if i % 50 == 49:
+                with g.writing():
+                    g.remove_node(i)
+                    g.remove_node(-i)
+
+    def read():
+        try:
+            for _ in range(100):
+                s = g.snapshot()
+                assert sum(len(row) for row in s.adj.values()) % 4 == 0
+                with g.reading():
+                    assert sum(len(row) for row in g.adj.values()) % 4 == 0
+        except Exception as err:
+            errors.append(err)
+
+    threads = [threading.Thread(target=write)] + [threading.Thread(target=read) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert not errors
+    assert g.snapshot().adj == g.adj and g.snapshot() is g.snapshot()
+    import pickle
+    h = pickle.loads(pickle.dumps(g))
+    assert h.adj == g.adj and h.snapshot().version == g.version
+
+
+def test_edgelist_to_binary_out_of_core(tmp_path):
+    import numpy as np
+    from OpenGraph.functions import pagerank
+    path = tmp_path / 'edges.txt'
+    path.write_text("a b 1.0\nb c 2.0\n# comment\nc a 3.0\nb a 4.0\nd d 5.0\nc e\n")
+    for directed in (False, True):
+        g = og.DiGraph() if directed else og.Graph()
+        g.add_edges_from_file(str(path), weighted=True)
+        out = str(tmp_path / 'g.bin')
+        stats = og.edgelist_to_binary(str(path), out, weighted=True, directed=directed,
+                                      memory_limit=1)
+        c = og.load_binary(out)
+        assert stats['number_of_edges'] == g.number_of_edges() and stats['malformed'] == 1
+        assert isinstance(c.indices, np.memmap) and list(c.nodes) == list(g.nodes)
+        assert {u: dict(row) for u, row in c.adj.items()} == g.adj
+        ranks, csr_ranks = pagerank(g), pagerank(c)
+        assert all(abs(ranks[node] - csr_ranks[node]) < 1e-9 for node in g)
+    assert og.CSRGraph(np.array([0, 1, 1]), np.array([1])).index_of_node == {0: 0, 1: 1}
+
+
+def test_partition():
+    import pytest
+    g = og.Graph()
+    g.add_edges([(i, i + 1) for i in range(99)] + [(0, 50)])
+    for method in ('bfs', 'label_propagation', 'hash'):
+        P = og.partition(g, 4, method=method)
+        assert sum(P.stats['sizes']) == 100 and P.stats['balance'] < 1.3
+        assert len(P.assignment) == len(P.nodes) == 100 and len(P.parts) == 4
+        cut = sum(P.assignment[u] != P.assignment[v] for u, v, d in g.edges)
+        assert P.stats['edge_cut'] == cut
+        for part, shard in enumerate(P.parts):
+            owned = list(shard.nodes)[:len(shard) - len(P.ghosts[part])]
+            assert all(P.assignment[u] == part and set(shard[u]) == set(g[u]) for u in owned)
+            assert all(len(shard[u]) == 0 for u in P.ghosts[part])
+            assert set(P.boundary[part]) == {u for u in owned if set(g[u]) - set(owned)}
+    cuts = {method: og.partition(g, 4, method=method).stats['edge_cut'] for method in ('bfs', 'hash')}
+    assert cuts['bfs'] < cuts['hash']
+    with pytest.raises(ValueError):
+        og.partition(g, 2, method='metis')
+
+
+def test_sampling():
+    import pytest
+    from OpenGraph import sampling
+    edges = [(i, (i * 7 + 1) % 300) for i in range(300)] + [(i, i + 1) for i in range(299)]
+    for g in (og.DiGraph(), og.Graph()):
+        g.add_edges(edges, edges_attr=[{'weight': i} for i in range(599)])
+        h = g.to_csr()
+        samplers = [sampling.random_node_sample, sampling.random_walk_sample,
+                    sampling.forest_fire_sample, sampling.snowball_sample]
+        for sampler in samplers:
+            sample = sampler(h, 40, random_seed=0)
+            s = sample.graph
+            assert len(s) == 40 and [h.nodes[r] for r in sample.rows] == list(s.nodes)
+            for u in s:  # induced, with the original weights
+                assert {v: d['weight'] for v, d in s[u].items()} == \
+                    {v: d['weight'] for v, d in h[u].items() if v in s}
+            assert sampler(h, 40, random_seed=0).rows.tolist() == sample.rows.tolist()
+        sample = sampling.random_edge_sample(h, 30, random_seed=1)
+        assert sample.graph.number_of_edges() == 30
+        assert all(h[u][v] == sample.graph[u][v] for u, v, d in sample.graph.edges)
+    sample = sampling.snowball_sample(g, 25, k=2, view=True, random_seed=0)
+    view = sample.graph
+    assert isinstance(view, og.SubgraphView) and len(view) == 25
+    assert [h.nodes[r] for r in sample.rows] == list(view.nodes)
+    sample = sampling.random_edge_sample(g, 10, induced=True, view=True, random_seed=0)
+    assert [h.nodes[r] for r in sample.rows] == list(sample.graph.nodes)
+    with pytest.raises(ValueError):
+        sampling.random_edge_sample(g, 10, view=True)
+    with pytest.raises(ValueError):
+        sampling.random_node_sample(h, 301)
+    unweighted = og.Graph()
+    unweighted.add_edges(edges)
+    for source in (unweighted, unweighted.to_csr(weight=None)):
+        for induced in (False, True):
+            s = sampling.random_edge_sample(source, 20, induced=induced, random_seed=0).graph
+            assert all(d == {} for u, v, d in s.edges)
+
+
+def test_edgelist_nodetype(tmp_path):
+    path = tmp_path / 'edges.txt'
+    path.write_text("1 2 1.5\nx 3 2.0\n2 3 2.5\n3 y 1.0\n10 1 3.0\n")
+    g = og.Graph()
+    stats = g.add_edges_from_file(str(path), weighted=True, nodetype=int)
+    assert list(g.nodes) == [1, 2, 3, 10] and g[10][1] == {'weight': 3.0}
+    assert stats['edges'] == 3 and stats['malformed'] == 2
+    for csr in (False, True):
+        for workers in (1, 2):
+            h = og.read_edgelist(str(path), weighted=True, nodetype=int, csr=csr,
+                                 workers=workers, block_size=8)
+            assert list(h.nodes) == [1, 2, 3, 10]
+            assert {u: dict(row) for u, row in h.adj.items()} == g.adj
+    path.write_text("a b 1\nb c 2\nc a 3\nd b 4\nb a 5\nc d 6\na a 7\n")
+    for directed in (False, True):
+        g = og.DiGraph() if directed else og.Graph()
+        g.add_edges_from_file(str(path), weighted=True)
+        for workers in (1, 2):
+            h = og.read_edgelist(str(path), weighted=True, directed=directed,
+                                 workers=workers, block_size=8)
+            assert list(h.edges) == list(g.edges)
+            assert [list(row) for row in h.adj.values()] == [list(row) for row in g.adj.values()]
+    path.write_text("1 2 1.5\nx 3 2.0\n2 3 2.5\n3 y 1.0\n10 1 3.0\n")
+    og.edgelist_to_binary(str(path), str(tmp_path / 'g.bin'), weighted=True, nodetype=int)
+    assert list(og.load_binary(str(tmp_path / 'g.bin')).nodes) == [1, 2, 3, 10]
+    assert list(og.read_edgelist(str(path), weighted=True, nodetype=str).nodes)[:2] == ['1', '2']
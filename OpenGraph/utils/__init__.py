@@ -2,4 +2,7 @@ from OpenGraph.utils.decorators import *
 from OpenGraph.utils.mapped_queue import *
 from OpenGraph.utils.convert_to_matrix import *
 from OpenGraph.utils.alias import *
-from OpenGraph.utils.index_of_node import *
\ No newline at end of file
+from OpenGraph.utils.index_of_node import *
+from OpenGraph.utils.memory import *
+from OpenGraph.utils.lazy_import import *
+from OpenGraph.utils.result_cache import *
\ No newline at end of file
@@ -16,7 +16,11 @@ def to_numpy_matrix(G, edge_sign = 1.0, not_edge_sign = 0.0):
 
     """
     import numpy as np
-    index_of_node = dict(zip(G.nodes, range(len(G))))
+    if hasattr(G, 'compact_node_index'):
+        G.compact_node_index()
+        index_of_node = G.index_of_node
+    else:  # e.g. a SubgraphView, numbered in node order
+        index_of_node = {node: i for i, node in enumerate(G.nodes)}
     N = len(G)
     M = np.full((N, N), not_edge_sign)
 
@@ -1,11 +1,18 @@
 __all__ = ["get_relation_of_index_and_node"]
 
 def get_relation_of_index_and_node(graph):
-    node2idx = {}
-    idx2node = []
-    node_size = 0
-    for node in graph.nodes:
-        node2idx[node] = node_size
-        idx2node.append(node)
-        node_size += 1
-    return idx2node, node2idx
\ No newline at end of file
+    """
+    Returns
+    1. node of index, list
+    2. index of node, dict
+
+    Copies of the tables the graph keeps (see `Graph.index_of_node`),
+    compacted to 0..n-1 in node order, so copying them is all a call
+    costs. Graphs without these tables, e.g. SubgraphViews, are numbered
+    in node order.
+    """
+    if not hasattr(graph, 'compact_node_index'):
+        idx2node = list(graph.nodes)
+        return idx2node, {node: i for i, node in enumerate(idx2node)}
+    graph.compact_node_index()
+    return list(graph.node_of_index), dict(graph.index_of_node)
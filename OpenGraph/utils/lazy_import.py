@@ -0,0 +1,50 @@
+import importlib
+
+__all__ = [
+    "lazy_import"
+]
+
+
+def lazy_import(package, submodules=(), attributes={}):
+    """
+    Returns the module-level ``__getattr__``, ``__dir__`` and ``__all__``
+    of a package whose submodules are imported on first access (PEP 562),
+    so that importing the package only costs its own ``__init__``.
+
+    Parameters
+    ----------
+    package : String
+        ``__name__`` of the package.
+
+    submodules : list of String
+        submodules reachable as attributes, e.g. ``og.functions``.
+
+    attributes : dict
+        attribute name -> relative name of the submodule defining it,
+        e.g. ``{'pagerank': '.not_sorted'}``.
+
+    Examples
+    --------
+    In the ``__init__.py`` of a package
+
+    >>> __getattr__, __dir__, __all__ = lazy_import(
+    ...     __name__, submodules=['drawing'], attributes={'pagerank': '.not_sorted'})
+    """
+    submodules = set(submodules)
+    attributes = dict(attributes)
+
+    def __getattr__(name):
+        if name in submodules:
+            value = importlib.import_module('.' + name, package)
+        elif name in attributes:
+            value = getattr(importlib.import_module(attributes[name], package), name)
+        else:
+            raise AttributeError("module {!r} has no attribute {!r}".format(package, name))
+        # Cached in the package, later lookups do not come back here
+        setattr(importlib.import_module(package), name, value)
+        return value
+
+    def __dir__():
+        return sorted(set(vars(importlib.import_module(package))) | submodules | set(attributes))
+
+    return __getattr__, __dir__, list(attributes)
@@ -0,0 +1,85 @@
+import sys
+
+__all__ = [
+    "memory_usage"
+]
+
+
+def memory_usage(obj, deep=True):
+    """
+    Returns the bytes taken by `obj`, e.g. a walk corpus (list of lists of
+    nodes) or any nested dict/list/tuple/set. For a graph, returns the
+    'total' of its own ``memory_usage``.
+
+    Parameters
+    ----------
+    obj : object
+
+    deep : boolean
+        if true, the items of containers are counted too, each object
+        once, otherwise only the outer container.
+    """
+    if hasattr(obj, 'memory_usage'):
+        return obj.memory_usage(deep=deep)['total']
+    return sizeof(obj, deep=deep)
+
+
+def sizeof(obj, deep=True, seen=None):
+    """
+    Returns sys.getsizeof of `obj`, plus, with `deep`, that of the keys,
+    values and items it holds, recursively. Objects whose id is in `seen`
+    are skipped, and counted objects are added to it. NumPy arrays report
+    their buffer only if they own it.
+    """
+    if seen is None:
+        seen = set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if not deep or isinstance(obj, (str, bytes)):
+        return size
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            size += sizeof(key, deep, seen) + sizeof(value, deep, seen)
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        for item in obj:
+            size += sizeof(item, deep, seen)
+    return size
+
+
+def graph_memory_usage(G, deep=True):
+    """
+    Memory breakdown of Graph/DiGraph `G`, see `Graph.memory_usage`.
+    """
+    seen = set()
+    usage = dict()
+
+    nodes = sizeof(G._node, deep=False, seen=seen)
+    for node, node_attr in G._node.items():
+        if deep:
+            nodes += sizeof(node, seen=seen)
+        nodes += sizeof(node_attr, deep=deep, seen=seen)
+    usage['nodes'] = nodes
+
+    rows = [G._adj, G._pred] if G.is_directed() else [G._adj]
+    usage['adjacency'] = sum(sizeof(adj, deep=False, seen=seen) +
+                             sum(sizeof(row, deep=False, seen=seen) for row in adj.values())
+                             for adj in rows)
+
+    # An undirected edge shares one dict between its two rows, count it once
+    usage['edge_attrs'] = sum(sizeof(edge_attr, deep=deep, seen=seen)
+                              for nbrs in G._adj.values() for edge_attr in nbrs.values())
+
+    usage['graph_attrs'] = sizeof(G.graph, deep=deep, seen=seen)
+
+    indexes = [G._out_degree_index, G._in_degree_index] if G.is_directed() \
+        else [G._degree_index]
+    indexes += [G._degree_total, G._node_index, G._index_node, G._owned]
+    if G._journal is not None:
+        indexes.append(G._journal.entries)
+    usage['indexes'] = sum(sizeof(index, deep=deep, seen=seen) for index in indexes
+                           if index is not None)
+
+    usage['total'] = sum(usage.values())
+    return usage
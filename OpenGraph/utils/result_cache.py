@@ -0,0 +1,175 @@
+import functools
+import itertools
+import threading
+import weakref
+from collections import OrderedDict
+
+__all__ = [
+    "cached_by_version",
+    "set_result_cache",
+    "clear_result_cache",
+    "result_cache_info"
+]
+
+
+class _ResultCache(object):
+    """
+    LRU cache of algorithm results shared by all graphs, bounded in
+    entries and optionally in bytes. Each entry holds the result of one
+    (graph, function, arguments) for one version of the graph; a lookup at
+    another version drops it.
+    """
+
+    def __init__(self, maxsize=128, maxbytes=None):
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.entries = OrderedDict()  # key -> (version, result, nbytes)
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+        # Graph -> unique token, so that a dead graph whose id is reused
+        # can never match the entries of the new one
+        self.tokens = weakref.WeakKeyDictionary()
+        self.counter = itertools.count()
+
+    def token(self, G):
+        with self.lock:
+            try:
+                return self.tokens[G]
+            except KeyError:
+                token = self.tokens[G] = next(self.counter)
+                return token
+
+    def get(self, key, version):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                if entry[0] == version:
+                    self.entries.move_to_end(key)
+                    self.hits += 1
+                    return True, entry[1]
+                self._drop(key)  # the graph changed since
+            self.misses += 1
+            return False, None
+
+    def put(self, key, version, result):
+        nbytes = 0
+        if self.maxbytes is not None:
+            from OpenGraph.utils.memory import memory_usage
+            nbytes = memory_usage(result)
+            if nbytes > self.maxbytes:
+                return
+        with self.lock:
+            if key in self.entries:
+                self._drop(key)
+            self.entries[key] = (version, result, nbytes)
+            self.nbytes += nbytes
+            self._evict()
+
+    def _drop(self, key):
+        self.nbytes -= self.entries.pop(key)[2]
+
+    def _evict(self):
+        while self.entries and (len(self.entries) > self.maxsize or
+                                (self.maxbytes is not None and self.nbytes > self.maxbytes)):
+            self._drop(next(iter(self.entries)))
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.nbytes = 0
+            self.hits = self.misses = 0
+
+
+_cache = _ResultCache()
+
+
+def cached_by_version(func):
+    """
+    Decorator memoizing ``func(G, ...)`` in the result cache, keyed by
+    graph, function, arguments and ``G.version``.
+
+    Repeated calls on an unchanged graph return a copy of the cached
+    result, so callers may modify what they get. Any mutation through the
+    graph methods bumps ``G.version`` and invalidates the results of `G`.
+    In-place changes of attribute dicts, e.g. ``G[u][v]['weight'] = 3``,
+    do not: call `clear_result_cache` after those. Graphs without a
+    version, such as the short-lived SubgraphViews algorithms create, and
+    calls with unhashable arguments are not cached.
+    """
+    name = func.__module__ + '.' + func.__qualname__
+
+    @functools.wraps(func)
+    def wrapper(G, *args, **kwargs):
+        version = getattr(G, 'version', None)
+        if version is None or _cache.maxsize == 0:
+            return func(G, *args, **kwargs)
+        try:
+            key = (_cache.token(G), name, args, frozenset(kwargs.items()))
+            hash(key)
+        except TypeError:  # e.g. a list of nodes as argument
+            return func(G, *args, **kwargs)
+        found, result = _cache.get(key, version)
+        if not found:
+            result = func(G, *args, **kwargs)
+            _cache.put(key, version, result)
+        return _copy_result(result)
+
+    return wrapper
+
+
+def _copy_result(result):
+    # Copies the dicts, lists and sets of a result, e.g. the sets of a
+    # list of components, and shares the immutable values they hold
+    if isinstance(result, dict):
+        return {key: _copy_result(value) for key, value in result.items()}
+    if isinstance(result, list):
+        return [_copy_result(value) for value in result]
+    if isinstance(result, set):
+        return set(result)
+    return result
+
+
+def set_result_cache(maxsize=128, maxbytes=None):
+    """
+    Sets the bounds of the result cache of `cached_by_version`, evicting
+    the least recently used results beyond them.
+
+    Parameters
+    ----------
+    maxsize : int
+        maximum number of cached results, 0 disables the cache.
+
+    maxbytes : int or None
+        maximum total bytes of the cached results, as measured by
+        `OpenGraph.utils.memory_usage`. None for no limit.
+    """
+    with _cache.lock:
+        _cache.maxsize = maxsize
+        _cache.maxbytes = maxbytes
+        if maxbytes is not None:  # results cached so far were not measured
+            from OpenGraph.utils.memory import memory_usage
+            _cache.entries = OrderedDict(
+                (key, (version, result, memory_usage(result)))
+                for key, (version, result, nbytes) in _cache.entries.items())
+            _cache.nbytes = sum(entry[2] for entry in _cache.entries.values())
+        _cache._evict()
+
+
+def clear_result_cache():
+    """
+    Drops every cached result.
+    """
+    _cache.clear()
+
+
+def result_cache_info():
+    """
+    Returns a dict of 'hits', 'misses', 'entries', 'bytes', 'maxsize' and
+    'maxbytes' of the result cache. 'bytes' is only counted when
+    'maxbytes' is set.
+    """
+    with _cache.lock:
+        return {'hits': _cache.hits, 'misses': _cache.misses, 'entries': len(_cache.entries),
+                'bytes': _cache.nbytes, 'maxsize': _cache.maxsize, 'maxbytes': _cache.maxbytes}
@@ -0,0 +1,65 @@
+import random
+import sys
+import threading
+import time
+sys.path.append('../')
+import numpy as np
+import OpenGraph as og
+
+
+def generate_graph_gnm(n=100000, m=500000, seed=0):
+    rng = np.random.default_rng(seed)
+    g = og.Graph()
+    g.add_edges_from_arrays(rng.integers(0, n, m), rng.integers(0, n, m))
+    g.enable_concurrency()
+    return g
+
+
+def read_once(G, nodes):
+    # A small query: total degree of the neighbors of 100 nodes
+    return sum(len(G[v]) for u in nodes for v in G[u])
+
+
+def record_throughput(G, num_readers, mode, duration=2.0, batch_size=1000):
+    n = len(G)
+    stop = threading.Event()
+    reads = [0] * num_readers
+    written = [0]
+
+    def writer():
+        rng = random.Random(1)
+        while not stop.is_set():
+            with G.writing():
+                for _ in range(batch_size):
+                    G.add_edge(rng.randrange(n), rng.randrange(n))
+            written[0] += batch_size
+            time.sleep(0.01)
+
+    def reader(i):
+        rng = random.Random(i)
+        while not stop.is_set():
+            nodes = [rng.randrange(n) for _ in range(100)]
+            if mode == 'snapshot':
+                read_once(G.snapshot(), nodes)
+            else:
+                with G.reading():
+                    read_once(G, nodes)
+            reads[i] += 1
+
+    threads = [threading.Thread(target=writer)] + \
+        [threading.Thread(target=reader, args=(i,)) for i in range(num_readers)]
+    for t in threads:
+        t.start()
+    time.sleep(duration)
+    stop.set()
+    for t in threads:
+        t.join()
+    print("{:<9} {} readers: {:>9.0f} reads/s, writer {:>8.0f} edges/s".format(
+        mode, num_readers, sum(reads) / duration, written[0] / duration))
+
+
+if __name__ == "__main__":
+    G = generate_graph_gnm()
+    for mode in ['reading', 'snapshot']:
+        for num_readers in [1, 2, 4, 8]:
+            record_throughput(G, num_readers, mode)
@@ -0,0 +1,37 @@
+import os
+import subprocess
+import sys
+
+BUDGET = 0.050  # seconds for `import OpenGraph`
+HEAVY_MODULES = ['numpy', 'scipy', 'sklearn', 'tensorflow', 'gensim', 'joblib', 'tqdm']
+
+_CHILD = """
+import sys, time
+start = time.perf_counter()
+import OpenGraph
+print(time.perf_counter() - start)
+print(' '.join(m for m in {} if m in sys.modules))
+"""
+
+
+def record_import_time(runs=7):
+    # Each run in a fresh interpreter, nothing cached but the .pyc files
+    root = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+    env = dict(os.environ, PYTHONPATH=root)
+    times, loaded = [], ''
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, '-c', _CHILD.format(HEAVY_MODULES)], env=env,
+                             capture_output=True, text=True, check=True).stdout.split('\n')
+        times.append(float(out[0]))
+        loaded = out[1]
+    times.sort()
+    return times[len(times) // 2], loaded
+
+
+if __name__ == "__main__":
+    median, loaded = record_import_time()
+    print("import OpenGraph: {:.1f} ms (median), budget {:.0f} ms".format(median * 1000, BUDGET * 1000))
+    if loaded:
+        print("Heavy modules loaded at import: {}".format(loaded))
+    if median > BUDGET or loaded:
+        sys.exit(1)
@@ -0,0 +1,36 @@
+import sys
+sys.path.append('../')
+import numpy as np
+import OpenGraph as og
+from OpenGraph.functions.graph_embedding.deepwalk import simulate_walks
+
+
+def generate_graph_gnm(graph_class, n=100000, m=500000, seed=0):
+    rng = np.random.default_rng(seed)
+    g = graph_class()
+    g.add_edges_from_arrays(rng.integers(0, n, m), rng.integers(0, n, m))
+    return g
+
+
+def record_memory(name, graph, deep=True):
+    usage = graph.memory_usage(deep=deep)
+    num_edges = graph.number_of_edges()
+    print("Memory of \'{}\' with {} nodes, {} edges: {:.1f} MB, {:.1f} bytes per edge".format(
+        name, len(graph), num_edges, usage['total'] / 2**20, usage['total'] / max(num_edges, 1)))
+    for key, size in usage.items():
+        if key != 'total':
+            print("    {:<12}{:>14,}".format(key, size))
+    print()
+    return usage
+
+
+if __name__ == "__main__":
+    for n, m in [(10000, 50000), (100000, 500000)]:
+        G = generate_graph_gnm(og.Graph, n=n, m=m)
+        G.degree()
+        record_memory('Graph', G)
+        record_memory('CompactGraph', generate_graph_gnm(og.CompactGraph, n=n, m=m))
+        record_memory('DiGraph', generate_graph_gnm(og.DiGraph, n=n, m=m))
+        record_memory('CSRGraph', G.to_csr())
+        walks = simulate_walks(G.to_csr(), walk_length=10, num_walks=1)
+        print("Memory of walk corpus: {:.1f} MB\n".format(og.utils.memory_usage(walks) / 2**20))
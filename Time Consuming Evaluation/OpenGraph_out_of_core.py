@@ -0,0 +1,46 @@
+import os
+import resource
+import sys
+import tempfile
+import time
+sys.path.append('../')
+import numpy as np
+import OpenGraph as og
+
+
+def write_edge_file(path, n, m, seed=0, block=1000000):
+    # Random edge list written block by block
+    rng = np.random.default_rng(seed)
+    with open(path, 'w') as fp:
+        for start in range(0, m, block):
+            count = min(block, m - start)
+            edges = np.column_stack((rng.integers(0, n, count), rng.integers(0, n, count)))
+            np.savetxt(fp, edges, fmt='%d')
+
+
+def peak_rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def record(name, func):
+    start = time.perf_counter()
+    result = func()
+    print("{:<36} {:>8.1f} s   peak RSS {:>8.1f} MB".format(
+        name, time.perf_counter() - start, peak_rss_mb()))
+    return result
+
+
+if __name__ == "__main__":
+    n, m = 1000000, 10000000
+    memory_limit = 1 << 28
+    with tempfile.TemporaryDirectory(dir='.') as tmp:
+        edges, binary = os.path.join(tmp, 'edges.txt'), os.path.join(tmp, 'graph.bin')
+        write_edge_file(edges, n, m)
+        print("{} nodes, {} edges, {:.0f} MB of text, memory_limit {} MB".format(
+            n, m, os.path.getsize(edges) / 2**20, memory_limit >> 20))
+        record('edgelist_to_binary', lambda: og.edgelist_to_binary(
+            edges, binary, memory_limit=memory_limit))
+        G = record('load_binary (mmap)', lambda: og.load_binary(binary))
+        record('pagerank', lambda: og.functions.pagerank(G))
+        record('degree', lambda: G.degree(weight=None))
+        print(G.memory_usage())
@@ -26,7 +26,7 @@ with open(path.join(DIR, 'README.md')) as f:
 
 setup(
     name='OpenGraph',
-    packages=['OpenGraph','OpenGraph/classes','OpenGraph/functions','OpenGraph/tests','OpenGraph/utils','OpenGraph/functions/community','OpenGraph/functions/components','OpenGraph/functions/graph_embedding','OpenGraph/functions/not_sorted','OpenGraph/functions/structural_holes','OpenGraph/functions/graph_embedding/node2vec'],
+    packages=['OpenGraph','OpenGraph/classes','OpenGraph/functions','OpenGraph/tests','OpenGraph/utils','OpenGraph/readwrite','OpenGraph/functions/community','OpenGraph/functions/components','OpenGraph/functions/graph_embedding','OpenGraph/functions/not_sorted','OpenGraph/functions/structural_holes','OpenGraph/functions/graph_embedding/node2vec','OpenGraph/functions/partitioning','OpenGraph/sampling'],
     description="ONAP testing",
     long_description=README,
     long_description_content_type='text/markdown',